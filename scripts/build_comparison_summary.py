@@ -384,6 +384,76 @@ def build_summary(matched_rows: list[dict[str, object]]) -> list[dict[str, objec
     return summary_rows
 
 
+MATCHED_FIELDS = [
+    "name_plat",
+    "year_plat",
+    "quantity_plat",
+    "volume_plat",
+    "price_plat",
+    "url_plat",
+    "platinum_vivino_rating",
+    "platinum_vivino_num_ratings",
+    "platinum_vivino_url",
+    "name_main",
+    "year_main",
+    "quantity_main",
+    "volume_main",
+    "price_main",
+    "url_main",
+    "match_method",
+    "match_score",
+]
+COMPARISON_FIELDS = [
+    "name_plat",
+    "year_plat",
+    "quantity_plat",
+    "volume_plat",
+    "quantity_main",
+    "price_plat",
+    "price_main",
+    "price_diff",
+    "price_diff_pct",
+    "cheaper_side",
+    "url_plat",
+    "url_main",
+    "platinum_vivino_rating",
+    "platinum_vivino_num_ratings",
+    "platinum_vivino_url",
+]
+
+
+def build_comparison(
+    grandcru_csv: Path,
+    platinum_csv: Path,
+    output_comparison: Path,
+    *,
+    output_matched: Path | None = None,
+    match_threshold: float = 0.6,
+) -> list[dict[str, str]]:
+    """Build and write comparison_summary, returning the rows as the CSV would read back.
+
+    Callers running the importer in the same process can pass the returned rows
+    straight through instead of re-parsing output_comparison.
+    """
+    grandcru_rows = prepare_rows(read_rows(grandcru_csv), enforce_in_stock=True)
+    platinum_rows = prepare_rows(read_rows(platinum_csv), enforce_in_stock=True)
+    matched = build_matches(grandcru_rows, platinum_rows, threshold=match_threshold)
+    summary = build_summary(matched)
+
+    if output_matched:
+        write_rows(output_matched, MATCHED_FIELDS, matched)
+    write_rows(output_comparison, COMPARISON_FIELDS, summary)
+
+    print(
+        f"Built {len(summary)} comparison rows from "
+        f"{len(grandcru_rows)} grandcru rows and {len(platinum_rows)} platinum rows."
+    )
+    return [
+        {field: "" if row.get(field) is None else str(row[field]) for field in COMPARISON_FIELDS}
+        for row in summary
+    ]
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Build comparison_summary from raw scraped catalogs")
     parser.add_argument("--grandcru-csv", required=True, type=Path)
@@ -393,60 +463,12 @@ def main() -> None:
     parser.add_argument("--match-threshold", type=float, default=0.6)
     args = parser.parse_args()
 
-    grandcru_rows = prepare_rows(read_rows(args.grandcru_csv), enforce_in_stock=True)
-    platinum_rows = prepare_rows(read_rows(args.platinum_csv), enforce_in_stock=True)
-    matched = build_matches(grandcru_rows, platinum_rows, threshold=args.match_threshold)
-    summary = build_summary(matched)
-
-    if args.output_matched:
-        write_rows(
-            args.output_matched,
-            [
-                "name_plat",
-                "year_plat",
-                "quantity_plat",
-                "volume_plat",
-                "price_plat",
-                "url_plat",
-                "platinum_vivino_rating",
-                "platinum_vivino_num_ratings",
-                "platinum_vivino_url",
-                "name_main",
-                "year_main",
-                "quantity_main",
-                "volume_main",
-                "price_main",
-                "url_main",
-                "match_method",
-                "match_score",
-            ],
-            matched,
-        )
-    write_rows(
+    build_comparison(
+        args.grandcru_csv,
+        args.platinum_csv,
         args.output_comparison,
-        [
-            "name_plat",
-            "year_plat",
-            "quantity_plat",
-            "volume_plat",
-            "quantity_main",
-            "price_plat",
-            "price_main",
-            "price_diff",
-            "price_diff_pct",
-            "cheaper_side",
-            "url_plat",
-            "url_main",
-            "platinum_vivino_rating",
-            "platinum_vivino_num_ratings",
-            "platinum_vivino_url",
-        ],
-        summary,
-    )
-
-    print(
-        f"Built {len(summary)} comparison rows from "
-        f"{len(grandcru_rows)} grandcru rows and {len(platinum_rows)} platinum rows."
+        output_matched=args.output_matched,
+        match_threshold=args.match_threshold,
     )
 
 
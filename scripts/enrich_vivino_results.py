@@ -289,11 +289,10 @@ def read_csv_rows(path: Path) -> list[dict[str, str]]:
 
 def write_csv_rows(path: Path, rows: list[dict[str, str]], fieldnames: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as handle:
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
 _STRIP_TOKENS_RE = re.compile(
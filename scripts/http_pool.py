@@ -0,0 +1,118 @@
+import http.client
+import ssl
+import threading
+from urllib.parse import urlsplit
+
+# New connections resume the host's last TLS session instead of paying a full
+# handshake; shared by every pool in the process.
+_TLS_CONTEXT = ssl.create_default_context()
+_TLS_SESSIONS: dict[str, ssl.SSLSession] = {}
+
+
+class _ResumingHTTPSConnection(http.client.HTTPSConnection):
+    def connect(self) -> None:
+        http.client.HTTPConnection.connect(self)
+        self.sock = _TLS_CONTEXT.wrap_socket(
+            self.sock,
+            server_hostname=self.host,
+            session=_TLS_SESSIONS.get(self.host),
+        )
+
+
+class RequestError(OSError):
+    """Transport failure; ``sent`` is False only if nothing reached the server."""
+
+    def __init__(self, cause: BaseException, *, sent: bool) -> None:
+        super().__init__(str(cause) or type(cause).__name__)
+        self.sent = sent
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, one idle stack per (scheme, host).
+
+    Repeated requests to the same host skip the TCP + TLS handshake that
+    urlopen pays on every call. Callers handle statuses, redirects and
+    retries; the pool only recovers from a socket the server closed while it
+    sat idle, which it re-sends once on a new connection.
+    """
+
+    def __init__(self, *, maxsize: int, timeout: float) -> None:
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def _new_connection(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        if scheme == "http":
+            return http.client.HTTPConnection(host, timeout=self.timeout)
+        return _ResumingHTTPSConnection(host, timeout=self.timeout, context=_TLS_CONTEXT)
+
+    def _checkout(self, scheme: str, host: str) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get((scheme, host))
+            if idle:
+                return idle.pop()
+        return self._new_connection(scheme, host)
+
+    def _checkin(self, scheme: str, host: str, connection: http.client.HTTPConnection) -> None:
+        # TLS 1.3 tickets arrive after the handshake, so capture the session
+        # once a response has been read rather than right after connect().
+        session = getattr(connection.sock, "session", None)
+        if session is not None and session.has_ticket:
+            _TLS_SESSIONS[connection.host] = session
+        with self._lock:
+            idle = self._idle.setdefault((scheme, host), [])
+            if len(idle) < self.maxsize:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            pooled = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in pooled:
+            connection.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        body: bytes | None = None,
+        max_bytes: int | None = None,
+    ) -> tuple[http.client.HTTPResponse, bytes]:
+        """Send one request and read its body (at most ``max_bytes + 1`` bytes).
+
+        Raises RequestError on transport failures.
+        """
+        parts = urlsplit(url)
+        target = f"{parts.path or '/'}?{parts.query}" if parts.query else (parts.path or "/")
+        fresh = False
+        while True:
+            if fresh:
+                connection = self._new_connection(parts.scheme, parts.netloc)
+            else:
+                connection = self._checkout(parts.scheme, parts.netloc)
+            reused = connection.sock is not None
+            sent = False
+            response = None
+            try:
+                connection.request(method, target, body=body, headers=headers or {})
+                sent = True
+                response = connection.getresponse()
+                payload = response.read() if max_bytes is None else response.read(max_bytes + 1)
+            except (http.client.HTTPException, OSError) as exc:
+                connection.close()
+                # A pooled socket the server closed while idle fails before
+                # any status line arrives, so the server never processed it.
+                if reused and response is None:
+                    fresh = True
+                    continue
+                raise RequestError(exc, sent=sent) from exc
+            if response.will_close or not response.isclosed():
+                connection.close()
+            else:
+                self._checkin(parts.scheme, parts.netloc, connection)
+            return response, payload
@@ -562,8 +562,14 @@ def import_data(
     vivino_overrides_path: Path | None = None,
     *,
     market_prices_path: Path | None = None,
+    comparison_rows: list[dict[str, str]] | None = None,
 ) -> None:
-    if not comparison_path.exists():
+    """Rebuild wine_deals from the CSV inputs.
+
+    comparison_rows lets an in-process caller hand over rows it just wrote to
+    comparison_path, skipping a second parse of the same file.
+    """
+    if comparison_rows is None and not comparison_path.exists():
         raise FileNotFoundError(f"comparison_summary missing: {comparison_path}")
     if not vivino_path.exists():
         raise FileNotFoundError(f"vivino_results missing: {vivino_path}")
@@ -582,7 +588,8 @@ def import_data(
     ensure_column("wine_deals", "market_retailer_name", "VARCHAR(128)")
     ensure_column("wine_deals", "market_retailer_url", "VARCHAR(512)")
 
-    comparison_rows = read_csv_rows(comparison_path)
+    if comparison_rows is None:
+        comparison_rows = read_csv_rows(comparison_path)
     vivino_rows_base = _annotate_vivino_rows(read_csv_rows(vivino_path), "base")
     vivino_rows_override = _annotate_vivino_rows(read_optional_csv_rows(vivino_overrides_path), "override")
     vivino_rows = vivino_rows_base + vivino_rows_override
@@ -0,0 +1,181 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: faster parse/serialize for cached result lists
+    orjson = None
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _json_loads(data: bytes | str) -> object:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(value: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+class QueryCache:
+    """Provider query results persisted in SQLite, one durable row per query.
+
+    WAL mode lets several resolver runs share the file; each write commits on
+    its own, so a crashed run keeps everything it fetched. Entries keep the
+    ``{"timestamp": ..., "results": [...]}`` shape of the old JSON cache.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS query_cache ("
+            "cache_key TEXT PRIMARY KEY, timestamp INTEGER NOT NULL, results TEXT NOT NULL, "
+            "query TEXT NOT NULL DEFAULT '')"
+        )
+
+    def get(self, cache_key: str, ttl_hours: float = 0.0) -> dict[str, object] | None:
+        # Expiry is evaluated by SQLite; a non-positive TTL never expires entries.
+        min_timestamp = int(time.time() - ttl_hours * 3600) if ttl_hours > 0 else None
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT timestamp, results FROM query_cache "
+                "WHERE cache_key = ? AND (? IS NULL OR timestamp >= ?)",
+                (cache_key, min_timestamp, min_timestamp),
+            ).fetchone()
+        if row is None:
+            return None
+        try:
+            results = _json_loads(row[1])
+        except json.JSONDecodeError:
+            return None
+        return {"timestamp": row[0], "results": results}
+
+    def __setitem__(self, cache_key: str, entry: dict[str, object]) -> None:
+        self.put_many([(cache_key, entry)])
+
+    def put_many(self, entries: list[tuple[str, dict[str, object]]]) -> None:
+        rows = [
+            (
+                key,
+                int(entry.get("timestamp") or 0),
+                _json_dumps(entry.get("results") or []),
+                str(entry.get("query") or ""),
+            )
+            for key, entry in entries
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO query_cache (cache_key, timestamp, results, query) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM query_cache").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _load_legacy_query_cache(path: Path) -> dict[str, dict[str, object]]:
+    if not path.exists():
+        return {}
+    try:
+        payload = _json_loads(path.read_bytes())
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    normalized: dict[str, dict[str, object]] = {}
+    for key, value in payload.items():
+        if isinstance(key, str) and isinstance(value, dict):
+            normalized[key] = value
+    return normalized
+
+
+def load_query_cache(path: Path) -> QueryCache:
+    # Older runs kept the cache as one JSON document; seed a new database from it once.
+    legacy_path = path.with_suffix(".json")
+    if path.suffix == ".json":
+        path = path.with_suffix(".sqlite3")
+    cache = QueryCache(path)
+    if len(cache) == 0:
+        legacy = _load_legacy_query_cache(legacy_path)
+        if legacy:
+            entries: list[tuple[str, dict[str, object]]] = []
+            for key, entry in legacy.items():
+                new_key, query = _rekey_plain_cache_key(key)
+                entries.append((new_key, {**entry, "query": query}))
+            cache.put_many(entries)
+    return cache
+
+
+def normalize_query(query: str) -> str:
+    return _WHITESPACE_RE.sub(" ", query.strip().lower())
+
+
+def _hashed_cache_key(provider: str, max_results: int | str, cleaned_query: str) -> str:
+    # A fixed 16-hex digest keeps keys short; the readable query is stored beside it.
+    digest = hashlib.blake2b(cleaned_query.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{provider}|{max_results}|{digest}"
+
+
+def _rekey_plain_cache_key(key: str) -> tuple[str, str]:
+    parts = key.split("|", 2)
+    if len(parts) != 3:
+        return (key, "")
+    provider, max_results, cleaned_query = parts
+    return (_hashed_cache_key(provider, max_results, cleaned_query), cleaned_query)
+
+
+def build_query_cache_key(provider: str, query: str, max_results: int) -> str:
+    return _hashed_cache_key(provider, max_results, normalize_query(query))
+
+
+def read_cache_results(
+    cache: QueryCache,
+    cache_key: str,
+    cache_ttl_hours: float,
+) -> list[dict[str, str]] | None:
+    entry = cache.get(cache_key, cache_ttl_hours)
+    if not entry:
+        return None
+
+    results = entry.get("results")
+    if not isinstance(results, list):
+        return None
+
+    normalized: list[dict[str, str]] = []
+    for item in results:
+        if not isinstance(item, dict):
+            continue
+        url = str(item.get("url") or "").strip()
+        title = str(item.get("title") or "").strip()
+        if url:
+            normalized.append({"url": url, "title": title})
+    return normalized
+
+
+def write_cache_results(
+    cache: QueryCache,
+    cache_key: str,
+    results: list[dict[str, str]],
+    query: str = "",
+) -> None:
+    cache[cache_key] = {
+        "timestamp": int(time.time()),
+        "results": results,
+        "query": normalize_query(query),
+    }
@@ -1,34 +1,303 @@
 import argparse
 import csv
+import hashlib
+import itertools
 import json
+import mmap
 import os
+import random
 import shlex
+import shutil
 import subprocess
 import sys
 import time
 from pathlib import Path
-from urllib.error import URLError
-from urllib.request import urlopen
 from typing import Any
+from urllib.parse import urljoin, urlsplit
 
 from sqlalchemy import create_engine, text
 
+try:
+    import orjson
+except ImportError:  # optional: parses bytes directly and faster than stdlib json
+    orjson = None
+
 ROOT = Path(__file__).resolve().parents[1]
+ROW_COUNT_CACHE = ROOT / "data" / "refresh_row_counts.json"
+DEFAULT_DATABASE_URL = "sqlite:///./data/wines.db"
+
+
+_COUNT_CHUNK_BYTES = 1 << 20
+
+
+def _count_rows_mapped(path: Path) -> int | None:
+    """Count data rows by scanning a memory-mapped file for newlines.
+
+    Returns None when a raw newline count would disagree with csv parsing
+    (quoted fields can embed newlines, blank lines are skipped) or the file
+    cannot be mapped, e.g. when it is empty.
+    """
+    with path.open("rb") as raw:
+        try:
+            mapped = mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError, OverflowError):
+            return None
+    with mapped:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        if mapped.find(b'"') != -1 or mapped.find(b"\n\n") != -1 or mapped.find(b"\n\r\n") != -1:
+            return None
+        size = len(mapped)
+        lines = sum(
+            mapped[start:start + _COUNT_CHUNK_BYTES].count(b"\n")
+            for start in range(0, size, _COUNT_CHUNK_BYTES)
+        )
+        if mapped[size - 1:] != b"\n":
+            lines += 1
+    return max(0, lines - 1)
 
 
-def count_rows(path: Path) -> int:
+def count_rows(path: Path, size_hint: int | None = None) -> int:
+    if size_hint == 0:
+        return 0
+    mapped_count = _count_rows_mapped(path)
+    if mapped_count is not None:
+        return mapped_count
     with path.open("r", encoding="utf-8", newline="") as handle:
         return sum(1 for _ in csv.DictReader(handle))
 
 
-def run_command(command: str, env: dict[str, str]) -> None:
+def stat_csv(path: Path) -> os.stat_result | None:
+    """Single stat() per CSV, or None when it is missing; feeds the row-count cache."""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def existing_paths(*paths: Path) -> set[Path]:
+    """Return which paths exist, listing a shared parent directory only once.
+
+    One scandir over seed/ replaces a stat() per input CSV, which adds up on
+    networked or bind-mounted filesystems.
+    """
+    parents = {path.parent for path in paths}
+    if len(paths) > 1 and len(parents) == 1:
+        wanted = {path.name for path in paths}
+        try:
+            with os.scandir(parents.pop()) as entries:
+                found = {entry.name for entry in entries if entry.name in wanted}
+        except FileNotFoundError:
+            return set()
+        except OSError:
+            pass
+        else:
+            return {path for path in paths if path.name in found}
+    return {path for path in paths if path.exists()}
+
+
+def load_row_count_cache(path: Path) -> dict[str, dict[str, int]]:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def save_row_count_cache(path: Path, cache: dict[str, dict[str, int]]) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(cache, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError as exc:
+        print(f"[refresh] Could not write row count cache {path}: {exc}")
+
+
+def cached_count_rows(path: Path, cache: dict[str, dict[str, int]]) -> int:
+    """Count rows, reusing the cached count while size and mtime are unchanged."""
+    stat = stat_csv(path)
+    if stat is None:
+        return 0
+    key = str(path)
+    entry = cache.get(key)
+    if (
+        isinstance(entry, dict)
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and isinstance(entry.get("rows"), int)
+    ):
+        return entry["rows"]
+    rows = count_rows(path, size_hint=stat.st_size)
+    cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "rows": rows}
+    return rows
+
+
+_RELAY_CHUNK_BYTES = 64 * 1024
+
+
+def run_streamed(cmd: list[str], env: dict[str, str]) -> None:
+    """Run a log-heavy child with stdout on a pipe and relay it in large chunks.
+
+    A piped child block-buffers its prints instead of flushing per line to a
+    TTY, and the parent forwards whatever is available with one write+flush.
+    """
+    sys.stdout.flush()
+    with subprocess.Popen(
+        cmd, cwd=ROOT, env=env, stdout=subprocess.PIPE, bufsize=_RELAY_CHUNK_BYTES
+    ) as process:
+        assert process.stdout is not None
+        sink = getattr(sys.stdout, "buffer", None)
+        while chunk := process.stdout.read1(_RELAY_CHUNK_BYTES):
+            if sink is not None:
+                sink.write(chunk)
+                sink.flush()
+            else:
+                sys.stdout.write(chunk.decode("utf-8", errors="replace"))
+                sys.stdout.flush()
+        returncode = process.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd)
+
+
+def input_mtimes(comparison_path: Path, vivino_path: Path, vivino_overrides_path: Path) -> dict[str, int | None]:
+    mtimes: dict[str, int | None] = {}
+    for key, path in (
+        ("comparison_mtime_ns", comparison_path),
+        ("vivino_mtime_ns", vivino_path),
+        ("overrides_mtime_ns", vivino_overrides_path),
+    ):
+        stat = stat_csv(path)
+        mtimes[key] = stat.st_mtime_ns if stat is not None else None
+    return mtimes
+
+
+def _database_fingerprint(database_url: str) -> str:
+    # Hashed so credentials in the URL never land in the state file.
+    return hashlib.sha256(database_url.encode("utf-8")).hexdigest()[:16]
+
+
+def inputs_unchanged(state_file: Path, mtimes: dict[str, int | None], database_url: str) -> bool:
+    """True when the last successful import used these same inputs and database."""
+    try:
+        payload = json.loads(state_file.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return False
+    if not isinstance(payload, dict) or payload.get("database") != _database_fingerprint(database_url):
+        return False
+    for key, current in mtimes.items():
+        stored = payload.get(key)
+        if current is None:
+            if stored is not None:
+                return False
+        elif not isinstance(stored, int) or current > stored:
+            return False
+    return True
+
+
+def save_refresh_state(state_file: Path, mtimes: dict[str, int | None], database_url: str) -> None:
+    payload = {
+        **mtimes,
+        "database": _database_fingerprint(database_url),
+        "completed_at": time.time(),
+    }
+    # The import already succeeded; failing to record it only costs a
+    # --skip-if-unchanged shortcut next time, so it must not fail the run.
+    try:
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    except OSError as exc:
+        print(f"[refresh] Could not write refresh state {state_file}: {exc}")
+
+
+def _ensure_root_on_path() -> None:
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+
+
+def run_build(
+    *,
+    grandcru_csv: Path,
+    platinum_csv: Path,
+    match_threshold: float,
+    comparison_path: Path,
+    env: dict[str, str],
+    in_process: bool = False,
+) -> list[dict[str, str]] | None:
+    """Build comparison_summary; in-process builds also return the written rows."""
+    if in_process:
+        _ensure_root_on_path()
+        from scripts.build_comparison_summary import build_comparison
+
+        return build_comparison(
+            grandcru_csv,
+            platinum_csv,
+            comparison_path,
+            match_threshold=match_threshold,
+        )
+
+    build_cmd = [
+        sys.executable,
+        str(ROOT / "scripts" / "build_comparison_summary.py"),
+        "--grandcru-csv",
+        str(grandcru_csv),
+        "--platinum-csv",
+        str(platinum_csv),
+        "--output-comparison",
+        str(comparison_path),
+        "--match-threshold",
+        str(match_threshold),
+    ]
+    subprocess.run(build_cmd, cwd=ROOT, env=env, check=True)
+    return None
+
+
+_CHAIN_SHELL = "/bin/sh"
+
+
+def _resolve_command(command: str, env: dict[str, str]) -> list[str]:
     args = shlex.split(command)
     if not args:
         raise ValueError(f"Invalid empty command: {command!r}")
+    # Resolve bare program names once here so the child execs a single absolute
+    # path instead of probing every PATH entry.
+    if os.sep not in args[0]:
+        executable = shutil.which(args[0], path=env.get("PATH"))
+        if executable is None:
+            raise FileNotFoundError(f"Pre-command not found on PATH: {args[0]!r}")
+        args[0] = executable
+    return args
+
+
+def run_command(command: str, env: dict[str, str]) -> None:
+    args = _resolve_command(command, env)
     print(f"[refresh] Running: {' '.join(args)}")
+    # No preexec_fn/start_new_session is passed, which keeps CPython on its
+    # vfork fast path.
     subprocess.run(args, cwd=ROOT, env=env, check=True)
 
 
+def run_commands(commands: list[str], env: dict[str, str], *, isolate: bool = False) -> None:
+    """Run pre-commands, chaining several through one shell unless isolated.
+
+    Each command is resolved like run_command and re-quoted, so the shell runs
+    exactly the same argv and applies no globbing, pipes, redirections or
+    ``NAME=value`` assignments. Without a POSIX shell the commands run one by one.
+    """
+    if isolate or len(commands) < 2 or not os.access(_CHAIN_SHELL, os.X_OK):
+        for command in commands:
+            run_command(command, env)
+        return
+    quoted = []
+    for command in commands:
+        program, *rest = _resolve_command(command, env)
+        # shlex.quote leaves "NAME=value" bare, which the shell would take as
+        # an assignment; the program is always single-quoted instead.
+        program = "'" + program.replace("'", "'\"'\"'") + "'"
+        quoted.append(" ".join([program, *map(shlex.quote, rest)]))
+    script = " && ".join(quoted)
+    print(f"[refresh] Running: {script}")
+    subprocess.run([_CHAIN_SHELL, "-c", script], cwd=ROOT, env=env, check=True)
+
+
 def run_vivino_resolver(
     *,
     comparison_path: Path,
@@ -53,43 +322,29 @@ def run_vivino_resolver(
     require_vivino_metrics: bool,
     env: dict[str, str],
 ) -> None:
+    value_flags = (
+        ("--comparison", comparison_path),
+        ("--vivino", vivino_path),
+        ("--vivino-overrides", vivino_overrides_path),
+        ("--provider", provider),
+        ("--max-results", max_results),
+        ("--sleep-seconds", sleep_seconds),
+        ("--min-confidence", min_confidence),
+        ("--min-margin", min_margin),
+        ("--limit", limit),
+        ("--max-api-queries", max_api_queries),
+        ("--auto-provider-order", auto_provider_order),
+        ("--query-cache", query_cache),
+        ("--cache-ttl-hours", cache_ttl_hours),
+        ("--state-file", state_file),
+        ("--output-review", output_review),
+        ("--output-unmatched", output_unmatched),
+        ("--output-suggestions", output_suggestions),
+    )
     resolver_cmd = [
         sys.executable,
         str(ROOT / "scripts" / "resolve_vivino_matches.py"),
-        "--comparison",
-        str(comparison_path),
-        "--vivino",
-        str(vivino_path),
-        "--vivino-overrides",
-        str(vivino_overrides_path),
-        "--provider",
-        provider,
-        "--max-results",
-        str(max_results),
-        "--sleep-seconds",
-        str(sleep_seconds),
-        "--min-confidence",
-        str(min_confidence),
-        "--min-margin",
-        str(min_margin),
-        "--limit",
-        str(limit),
-        "--max-api-queries",
-        str(max_api_queries),
-        "--auto-provider-order",
-        auto_provider_order,
-        "--query-cache",
-        str(query_cache),
-        "--cache-ttl-hours",
-        str(cache_ttl_hours),
-        "--state-file",
-        str(state_file),
-        "--output-review",
-        str(output_review),
-        "--output-unmatched",
-        str(output_unmatched),
-        "--output-suggestions",
-        str(output_suggestions),
+        *itertools.chain.from_iterable((flag, str(value)) for flag, value in value_flags),
     ]
     if only_new_unresolved:
         resolver_cmd.append("--only-new-unresolved")
@@ -120,7 +375,47 @@ def resolver_recent(state_file: Path, min_interval_hours: float) -> bool:
     return (time.time() - float(last_run)) < (min_interval_hours * 3600)
 
 
-def run_import(comparison_path: Path, vivino_path: Path, vivino_overrides_path: Path, env: dict[str, str]) -> None:
+def run_import(
+    comparison_path: Path,
+    vivino_path: Path,
+    vivino_overrides_path: Path,
+    env: dict[str, str],
+    *,
+    in_process: bool = False,
+    comparison_rows: list[dict[str, str]] | None = None,
+) -> None:
+    print(
+        f"[refresh] Running import with {comparison_path.name}, {vivino_path.name},"
+        f" overrides={vivino_overrides_path.name}"
+    )
+    if in_process:
+        # app.config reads DATABASE_URL when first imported, and the default
+        # sqlite URL is relative to the repo root like the subprocess's cwd.
+        # Both are only in effect for the import and restored afterwards.
+        saved_env = {key: os.environ.get(key) for key in env}
+        saved_cwd = os.getcwd()
+        os.environ.update(env)
+        os.chdir(ROOT)
+        try:
+            _ensure_root_on_path()
+            from scripts.import_wine_data import import_data
+
+            import_data(
+                comparison_path,
+                vivino_path,
+                vivino_overrides_path,
+                market_prices_path=ROOT / "seed" / "market_prices.csv",
+                comparison_rows=comparison_rows,
+            )
+        finally:
+            os.chdir(saved_cwd)
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+        return
+
     import_cmd = [
         sys.executable,
         str(ROOT / "scripts" / "import_wine_data.py"),
@@ -133,10 +428,6 @@ def run_import(comparison_path: Path, vivino_path: Path, vivino_overrides_path:
         "--skip-if-fresh",
         "0",
     ]
-    print(
-        f"[refresh] Running import with {comparison_path.name}, {vivino_path.name},"
-        f" overrides={vivino_overrides_path.name}"
-    )
     subprocess.run(import_cmd, cwd=ROOT, env=env, check=True)
 
 
@@ -161,7 +452,8 @@ def run_scrape_and_build(
     platinum_detail_sleep_seconds: float,
     comparison_path: Path,
     env: dict[str, str],
-) -> None:
+    in_process: bool = False,
+) -> list[dict[str, str]] | None:
     output_dir.mkdir(parents=True, exist_ok=True)
     scrape_cmd = [
         sys.executable,
@@ -183,22 +475,17 @@ def run_scrape_and_build(
     if headed:
         scrape_cmd.append("--headed")
     print(f"[refresh] Running scrape into {output_dir}")
-    subprocess.run(scrape_cmd, cwd=ROOT, env=env, check=True)
+    run_streamed(scrape_cmd, env)
 
-    build_cmd = [
-        sys.executable,
-        str(ROOT / "scripts" / "build_comparison_summary.py"),
-        "--grandcru-csv",
-        str(output_dir / "grandcru_wines.csv"),
-        "--platinum-csv",
-        str(output_dir / "platinum_wines.csv"),
-        "--output-comparison",
-        str(comparison_path),
-        "--match-threshold",
-        str(match_threshold),
-    ]
     print(f"[refresh] Building comparison summary into {comparison_path}")
-    subprocess.run(build_cmd, cwd=ROOT, env=env, check=True)
+    return run_build(
+        grandcru_csv=output_dir / "grandcru_wines.csv",
+        platinum_csv=output_dir / "platinum_wines.csv",
+        match_threshold=match_threshold,
+        comparison_path=comparison_path,
+        env=env,
+        in_process=in_process,
+    )
 
 
 def run_build_comparison_only(
@@ -208,41 +495,86 @@ def run_build_comparison_only(
     match_threshold: float,
     comparison_path: Path,
     env: dict[str, str],
-) -> None:
-    build_cmd = [
-        sys.executable,
-        str(ROOT / "scripts" / "build_comparison_summary.py"),
-        "--grandcru-csv",
-        str(grandcru_csv),
-        "--platinum-csv",
-        str(platinum_csv),
-        "--output-comparison",
-        str(comparison_path),
-        "--match-threshold",
-        str(match_threshold),
-    ]
+    in_process: bool = False,
+) -> list[dict[str, str]] | None:
     print(
         "[refresh] Building comparison summary from existing CSVs:",
         f"platinum={platinum_csv}",
         f"grandcru={grandcru_csv}",
         f"output={comparison_path}",
     )
-    subprocess.run(build_cmd, cwd=ROOT, env=env, check=True)
+    return run_build(
+        grandcru_csv=grandcru_csv,
+        platinum_csv=platinum_csv,
+        match_threshold=match_threshold,
+        comparison_path=comparison_path,
+        env=env,
+        in_process=in_process,
+    )
+
 
+_HEALTH_MAX_BYTES = 64 * 1024
+_HEALTH_MAX_REDIRECTS = 5
+_HEALTH_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+
+
+def _check_health_url(health_url: str) -> None:
+    parts = urlsplit(health_url)
+    if parts.scheme not in {"http", "https"} or not parts.netloc:
+        raise ValueError(f"Unsupported health URL: {health_url!r}")
+
+
+def check_health(health_url: str, retries: int = 0, backoff_seconds: float = 0.2) -> bool:
+    """Probe the API health endpoint, retrying with jittered exponential backoff.
+
+    A keep-alive connection is reused across attempts so retries do not pay a
+    fresh TCP/TLS handshake each time. Redirects are followed as urlopen did;
+    any other non-2xx status counts as a failed attempt.
+    """
+    _ensure_root_on_path()
+    from scripts.http_pool import ConnectionPool, RequestError
 
-def check_health(health_url: str) -> bool:
     print(f"[refresh] Checking health: {health_url}")
+    _check_health_url(health_url)
+    pool = ConnectionPool(maxsize=1, timeout=20)
+    payload = b""
+    attempt = 0
+    redirects = 0
     try:
-        with urlopen(health_url, timeout=20) as response:
-            payload = response.read().decode("utf-8")
-    except URLError as exc:
-        print(f"[refresh] Health check failed: {exc}")
-        return False
+        while True:
+            try:
+                response, payload = pool.request("GET", health_url, max_bytes=_HEALTH_MAX_BYTES)
+            except RequestError as exc:
+                print(f"[refresh] Health check failed: {exc}")
+            else:
+                if len(payload) > _HEALTH_MAX_BYTES:
+                    print(f"[refresh] Health check failed: response larger than {_HEALTH_MAX_BYTES} bytes")
+                    return False
+                location = response.headers.get("Location")
+                if (
+                    response.status in _HEALTH_REDIRECT_STATUSES
+                    and location
+                    and redirects < _HEALTH_MAX_REDIRECTS
+                ):
+                    redirects += 1
+                    health_url = urljoin(health_url, location)
+                    _check_health_url(health_url)
+                    continue
+                if 200 <= response.status < 300:
+                    break
+                print(f"[refresh] Health check failed: HTTP {response.status} {response.reason}")
+            if attempt >= max(0, retries):
+                return False
+            attempt += 1
+            time.sleep(backoff_seconds * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2))
+    finally:
+        pool.close()
 
     try:
-        body = json.loads(payload)
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError.
+        body = orjson.loads(payload) if orjson is not None else json.loads(payload)
     except json.JSONDecodeError:
-        print(f"[refresh] Health response (raw): {payload[:400]}")
+        print(f"[refresh] Health response (raw): {payload[:400].decode('utf-8', errors='replace')}")
         return True
 
     latest = body.get("latest_ingestion") or {}
@@ -351,7 +683,7 @@ def main() -> None:
     parser.add_argument(
         "--resolver-query-cache",
         type=Path,
-        default=ROOT / "data" / "vivino_query_cache.json",
+        default=ROOT / "data" / "vivino_query_cache.sqlite3",
     )
     parser.add_argument("--resolver-cache-ttl-hours", type=float, default=168.0)
     parser.add_argument(
@@ -487,12 +819,47 @@ def main() -> None:
     parser.add_argument("--platinum-detail-sleep-seconds", type=float, default=2.0)
     parser.add_argument("--scrape-headed", action="store_true")
     parser.add_argument("--build-match-threshold", type=float, default=0.6)
+    parser.add_argument(
+        "--skip-if-unchanged",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Exit without resolving or importing when the comparison/vivino/overrides CSVs "
+            "are no newer than at the last successful import into the same database "
+            "(default: false)."
+        ),
+    )
+    parser.add_argument(
+        "--refresh-state-file",
+        type=Path,
+        default=ROOT / "data" / "refresh_state.json",
+        help="Where input mtimes of the last successful import are recorded.",
+    )
+    parser.add_argument(
+        "--in-process",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Run the comparison build and the import inside this interpreter and hand the "
+            "built comparison rows straight to the importer instead of re-parsing the CSV. "
+            "The CSV is still written because resolver steps read it (default: false)."
+        ),
+    )
     parser.add_argument(
         "--pre-command",
         action="append",
         default=[],
         help="Optional command to run before import. Repeat for multiple commands.",
     )
+    parser.add_argument(
+        "--pre-command-isolate",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Spawn each --pre-command separately instead of chaining them with && in "
+            "one /bin/sh process (default: false)."
+        ),
+    )
     parser.add_argument(
         "--llm-resolve",
         action="store_true",
@@ -507,6 +874,15 @@ def main() -> None:
         action="store_true",
         help="Run market price resolver (Brave + Wine-Searcher) with validation.",
     )
+    parser.add_argument(
+        "--row-counts",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "Log input CSV row counts before the resolver/import steps. Each count is a "
+            "full file scan, so the default only logs them when stdout is a terminal."
+        ),
+    )
     parser.add_argument(
         "--health-url",
         default=None,
@@ -518,6 +894,12 @@ def main() -> None:
         default=False,
         help="If true, fail the run when --health-url check fails (default: false).",
     )
+    parser.add_argument(
+        "--health-retries",
+        type=int,
+        default=0,
+        help="Extra --health-url attempts with jittered exponential backoff (default: 0).",
+    )
     args = parser.parse_args()
 
     comparison_path = args.comparison.resolve()
@@ -526,9 +908,10 @@ def main() -> None:
 
     build_requested = args.scrape_and_build or args.build_comparison
 
-    if not comparison_path.exists() and not build_requested:
+    present = existing_paths(comparison_path, vivino_path, vivino_overrides_path)
+    if comparison_path not in present and not build_requested:
         raise FileNotFoundError(f"Missing comparison CSV: {comparison_path}")
-    if not vivino_path.exists():
+    if vivino_path not in present:
         raise FileNotFoundError(f"Missing vivino CSV: {vivino_path}")
 
     env = os.environ.copy()
@@ -541,11 +924,11 @@ def main() -> None:
             "Platinum Vivino metadata during --scrape-and-build."
         )
 
-    for command in args.pre_command:
-        run_command(command, env)
+    run_commands(args.pre_command, env, isolate=args.pre_command_isolate)
 
+    comparison_rows: list[dict[str, str]] | None = None
     if args.scrape_and_build:
-        run_scrape_and_build(
+        comparison_rows = run_scrape_and_build(
             grandcru_base_url=args.grandcru_base_url,
             platinum_base_url=args.platinum_base_url,
             output_dir=args.scrape_output_dir.resolve(),
@@ -557,28 +940,45 @@ def main() -> None:
             platinum_detail_ratings=args.platinum_detail_ratings,
             platinum_detail_sleep_seconds=args.platinum_detail_sleep_seconds,
             env=env,
+            in_process=args.in_process,
         )
     elif args.build_comparison:
         platinum_csv = args.platinum.resolve()
         grandcru_csv = args.grandcru.resolve()
-        if not platinum_csv.exists():
+        present = existing_paths(platinum_csv, grandcru_csv)
+        if platinum_csv not in present:
             raise FileNotFoundError(f"Missing platinum CSV: {platinum_csv}")
-        if not grandcru_csv.exists():
+        if grandcru_csv not in present:
             raise FileNotFoundError(f"Missing grandcru CSV: {grandcru_csv}")
-        run_build_comparison_only(
+        comparison_rows = run_build_comparison_only(
             platinum_csv=platinum_csv,
             grandcru_csv=grandcru_csv,
             match_threshold=args.build_match_threshold,
             comparison_path=comparison_path,
             env=env,
+            in_process=args.in_process,
         )
 
-    print(
-        "[refresh] Input rows:",
-        f"comparison={count_rows(comparison_path)}",
-        f"vivino={count_rows(vivino_path)}",
-        f"overrides={count_rows(vivino_overrides_path) if vivino_overrides_path.exists() else 0}",
-    )
+    database_url = args.database_url or env.get("DATABASE_URL") or DEFAULT_DATABASE_URL
+    refresh_state_path = args.refresh_state_file.resolve()
+    if args.skip_if_unchanged and inputs_unchanged(
+        refresh_state_path,
+        input_mtimes(comparison_path, vivino_path, vivino_overrides_path),
+        database_url,
+    ):
+        print("[refresh] Inputs unchanged since the last successful import; nothing to do (no-op).")
+        return
+
+    print_row_counts = args.row_counts if args.row_counts is not None else sys.stdout.isatty()
+    if print_row_counts:
+        row_count_cache = load_row_count_cache(ROW_COUNT_CACHE)
+        print(
+            "[refresh] Input rows:",
+            f"comparison={cached_count_rows(comparison_path, row_count_cache)}",
+            f"vivino={cached_count_rows(vivino_path, row_count_cache)}",
+            f"overrides={cached_count_rows(vivino_overrides_path, row_count_cache)}",
+        )
+        save_row_count_cache(ROW_COUNT_CACHE, row_count_cache)
 
     if args.resolve_vivino:
         state_path = args.resolver_state_file.resolve()
@@ -682,18 +1082,31 @@ def main() -> None:
         print("[refresh] Enriching vivino_results.csv from override URLs")
         subprocess.run(enrich_cmd, cwd=ROOT, env=env, check=True)
 
-    run_import(comparison_path, vivino_path, vivino_overrides_path, env)
+    run_import(
+        comparison_path,
+        vivino_path,
+        vivino_overrides_path,
+        env,
+        in_process=args.in_process,
+        comparison_rows=comparison_rows,
+    )
 
     if args.validate_completeness:
         run_completeness_validation(strict=args.validate_completeness_strict, env=env)
 
+    # Recorded after the resolver/enrich steps, which may rewrite the inputs.
+    save_refresh_state(
+        refresh_state_path,
+        input_mtimes(comparison_path, vivino_path, vivino_overrides_path),
+        database_url,
+    )
+
     if args.health_url:
-        health_ok = check_health(args.health_url)
+        health_ok = check_health(args.health_url, retries=args.health_retries)
         if not health_ok and args.health_strict:
             raise RuntimeError("Health check failed in strict mode.")
 
     if (args.ratings_coverage_min and args.ratings_coverage_min > 0) or args.max_unrated >= 0:
-        database_url = args.database_url or env.get("DATABASE_URL") or "sqlite:///./data/wines.db"
         try:
             total, rated, unrated_with_url, unrated_without_url, coverage = compute_rating_coverage(database_url)
         except Exception as exc:
@@ -1,22 +1,29 @@
 import argparse
 import logging
+from pathlib import Path
 
-from app.database import Base, engine
 
-
-logging.basicConfig(
-    level="INFO",
-    format="%(asctime)s %(levelname)s %(name)s %(message)s",
-)
 logger = logging.getLogger("grandcru.reset_db")
 
-
-def reset_database(drop_all: bool) -> None:
-    if drop_all:
-        logger.info("Dropping all tables...")
-        Base.metadata.drop_all(bind=engine)
-    logger.info("Creating tables...")
-    Base.metadata.create_all(bind=engine)
+DEFAULT_REFRESH_STATE_FILE = Path(__file__).resolve().parents[1] / "data" / "refresh_state.json"
+
+
+def reset_database(drop_all: bool, refresh_state_file: Path | None = DEFAULT_REFRESH_STATE_FILE) -> None:
+    # Deferred so `--help` and library imports skip loading SQLAlchemy and the models.
+    from app.database import Base, engine
+
+    # One connection and one transaction for the whole reset. After a drop the
+    # tables are known to be gone, so create_all can skip its per-table probe.
+    with engine.begin() as conn:
+        if drop_all:
+            logger.info("Dropping all tables...")
+            Base.metadata.drop_all(bind=conn)
+        logger.info("Creating tables...")
+        Base.metadata.create_all(bind=conn, checkfirst=not drop_all)
+    # refresh_pipeline --skip-if-unchanged trusts this file to mean the
+    # database already holds the current CSVs, which is no longer true.
+    if refresh_state_file is not None:
+        refresh_state_file.unlink(missing_ok=True)
     logger.info("Database reset complete.")
 
 
@@ -28,8 +35,18 @@ def main() -> None:
         default=True,
         help="Drop all existing tables before creating them again (default: true).",
     )
+    parser.add_argument(
+        "--refresh-state-file",
+        type=Path,
+        default=DEFAULT_REFRESH_STATE_FILE,
+        help="refresh_pipeline state file to remove so the next refresh re-imports.",
+    )
     args = parser.parse_args()
-    reset_database(drop_all=args.drop_all)
+    logging.basicConfig(
+        level="INFO",
+        format="%(asctime)s %(levelname)s %(name)s %(message)s",
+    )
+    reset_database(drop_all=args.drop_all, refresh_state_file=args.refresh_state_file)
 
 
 if __name__ == "__main__":
@@ -1,21 +1,34 @@
 import argparse
+import atexit
 import csv
 import json
 import os
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, closing
+from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, TextIO
 from urllib.error import HTTPError, URLError
 from urllib.parse import parse_qs, quote_plus, urlencode, urlparse, urlunparse
-from urllib.request import Request, urlopen
+
+try:
+    import orjson
+except ImportError:  # optional: faster parse/serialize for the state, cache and API payloads
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from scripts.http_pool import ConnectionPool, RequestError  # noqa: E402
 from scripts.import_wine_data import (  # noqa: E402
     build_vivino_lookup,
     canonicalize_key,
@@ -25,7 +38,19 @@ from scripts.import_wine_data import (  # noqa: E402
     read_csv_rows,
     read_optional_csv_rows,
 )
-from scripts.vivino_overrides import OVERRIDE_FIELDS, upsert_overrides  # noqa: E402
+from scripts.query_cache import (  # noqa: E402
+    QueryCache,
+    build_query_cache_key,
+    load_query_cache,
+    read_cache_results,
+    write_cache_results,
+)
+from scripts.vivino_overrides import OVERRIDE_FIELDS, _gs, upsert_overrides  # noqa: E402
+
+# Scoring re-normalizes the same producers, titles and slugs across a row's
+# queries and across rows; both helpers are pure, so memoize them here.
+_canonical_key = lru_cache(maxsize=16384)(canonicalize_key)
+_normalized_key = lru_cache(maxsize=16384)(normalize_key)
 
 _REVIEW_FIELDS = [
     "wine_name",
@@ -44,8 +69,10 @@ _REVIEW_FIELDS = [
     "best_url",
     "best_provider",
     "best_query",
+    "best_producer_similarity",
     "decision",
     "reason",
+    "search_trace",
 ]
 
 _UNMATCHED_FIELDS = [
@@ -68,19 +95,57 @@ _UNMATCHED_FIELDS = [
 
 _COLOR_TOKENS = {"red", "white", "rose", "sparkling", "orange"}
 
+_CSV_WRITE_BUFFER_BYTES = 1 << 20
+_STREAM_FLUSH_EVERY = 25
+
+# (results, provider_used, cache_hit, errors) for one search query.
+_SearchOutcome = tuple[list[dict[str, str]], str, bool, list[str]]
+
+_LEADING_YEAR_RE = re.compile(r"^(?:19|20)\d{2}\s+", re.IGNORECASE)
+_LEADING_NV_RE = re.compile(r"^nv\s+", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_HTTP_TIMEOUT_SECONDS = 30
+_HTTP_POOL_MAXSIZE = 32
+_HTTP_RETRY_TOTAL = 2
+_HTTP_RETRY_BACKOFF_SECONDS = 0.3
+_HTTP_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Auth and quota failures will not clear up mid-run; a provider that returns
+# one is skipped for the remaining queries instead of being retried per query.
+_PROVIDER_DISABLING_STATUSES = frozenset({401, 402, 403, 429})
+
+# Keep-alive pool shared by the search providers, so repeated queries skip
+# the TCP + TLS handshake.
+_HTTP_POOL = ConnectionPool(maxsize=_HTTP_POOL_MAXSIZE, timeout=_HTTP_TIMEOUT_SECONDS)
+# Guards the API-call budget when several search workers share it.
+_API_BUDGET_LOCK = threading.Lock()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class WineIdentity:
     wine_name: str
     year: int | None
     producer: str
     label: str
     color: str
-    producer_tokens: set[str]
-    target_tokens: set[str]
+    producer_tokens: frozenset[str]
+    target_tokens: frozenset[str]
+    # Derived once per row so scoring does not rebuild them per candidate.
+    target_sorted_text: str
+    producer_key: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class CandidateFeatures:
+    # Token forms of one search result, shared by every row that sees it.
+    tokens: frozenset[str]
+    sorted_text: str
+    slug_key: str
+    raw_tokens: frozenset[str]
+    text_year: int | None
+
+
+@dataclass(slots=True)
 class Candidate:
     url: str
     title: str
@@ -89,57 +154,121 @@ class Candidate:
     score: float
     producer_overlap: int
     year_match: bool
+    producer_similarity: float = 0.0
+
+
+def _json_loads(data: bytes | str) -> object:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(value: object) -> str:
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+@dataclass(slots=True, frozen=True)
+class ParsedVivinoUrl:
+    url: str
+    year: int | None
+    slug_text: str
 
 
 def vivino_row_has_metrics(row: dict[str, str] | None) -> bool:
     if not row:
         return False
     return bool(
-        (row.get("vivino_rating") or "").strip()
-        or (row.get("vivino_num_ratings") or "").strip()
-        or (row.get("vivino_raters") or "").strip()
+        _gs(row, "vivino_rating")
+        or _gs(row, "vivino_num_ratings")
+        or _gs(row, "vivino_raters")
     )
 
 
-def load_state(path: Path) -> dict[str, object]:
-    if not path.exists():
-        return {"seen_unresolved": {}}
+def _state_log_path(path: Path) -> Path:
+    return path.with_name(f"{path.name}.log")
+
+
+def _replay_state_log(path: Path, seen_unresolved: dict[str, object]) -> None:
+    # Rows seen by a run that never reached save_state(); a torn last line is skipped.
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return {"seen_unresolved": {}}
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return
+    with handle:
+        for line in handle:
+            try:
+                entry = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict) and isinstance(entry.get("fingerprint"), str):
+                seen_unresolved[entry["fingerprint"]] = entry.get("seen_at")
+
+
+def load_state(path: Path) -> dict[str, object]:
+    payload: object = None
+    if path.exists():
+        try:
+            payload = _json_loads(path.read_bytes())
+        except json.JSONDecodeError:
+            payload = None
     if not isinstance(payload, dict):
-        return {"seen_unresolved": {}}
+        payload = {"seen_unresolved": {}}
     if not isinstance(payload.get("seen_unresolved"), dict):
         payload["seen_unresolved"] = {}
+    _replay_state_log(_state_log_path(path), payload["seen_unresolved"])
     return payload
 
 
+def open_state_log(stack: ExitStack, path: Path) -> TextIO:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return stack.enter_context(_state_log_path(path).open("a", encoding="utf-8"))
+
+
+def append_state_log(handle: TextIO, fingerprint: str, seen_at: int) -> None:
+    handle.write(_json_dumps({"fingerprint": fingerprint, "seen_at": seen_at}) + "\n")
+
+
 def save_state(path: Path, state: dict[str, object]) -> None:
+    # Writes the compacted snapshot, then drops the append log it now contains.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    if orjson is not None:
+        tmp_path.write_bytes(orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+    else:
+        tmp_path.write_text(json.dumps(state, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp_path, path)
+    _state_log_path(path).unlink(missing_ok=True)
 
 
 def unresolved_fingerprint(row: dict[str, str]) -> str:
-    name = (row.get("name_plat") or "").strip()
-    year = (row.get("year_plat") or "").strip()
-    url_main = (row.get("url_main") or "").strip()
-    url_plat = (row.get("url_plat") or "").strip()
+    name = _gs(row, "name_plat")
+    year = _gs(row, "year_plat")
+    url_main = _gs(row, "url_main")
+    url_plat = _gs(row, "url_plat")
     raw = f"{name}|{year}|{url_main}|{url_plat}"
     return canonicalize_key(raw)
 
 
+def _open_csv_stream(stack: ExitStack, path: Path, fieldnames: list[str]) -> tuple[TextIO, csv.DictWriter]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = stack.enter_context(path.open("w", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER_BYTES))
+    writer = csv.DictWriter(handle, fieldnames=fieldnames)
+    writer.writeheader()
+    return handle, writer
+
+
 def write_csv_rows(path: Path, rows: list[dict[str, str]], fieldnames: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as handle:
+    # A 1 MiB buffer lets writerows() reach the file in a handful of write() calls.
+    with path.open("w", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER_BYTES) as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
         writer.writerows(rows)
 
 
-def _safe_slug_text(url: str) -> str:
-    parsed = urlparse(url)
-    parts = [part for part in parsed.path.split("/") if part]
+def _slug_text_from_path(path: str) -> str:
+    parts = [part for part in path.split("/") if part]
     if "w" in parts:
         idx = parts.index("w")
         if idx > 0:
@@ -149,6 +278,7 @@ def _safe_slug_text(url: str) -> str:
     return ""
 
 
+@lru_cache(maxsize=8192)
 def _product_slug_text(url: str) -> str:
     if not url:
         return ""
@@ -161,24 +291,31 @@ def _product_slug_text(url: str) -> str:
 
 
 def parse_identity(row: dict[str, str]) -> WineIdentity:
-    wine_name = (row.get("name_plat") or "").strip()
+    return _parse_identity_cached(_gs(row, "name_plat"), row.get("year_plat") or "")
+
+
+# Comparison exports repeat the same wine across vintages and sources; the
+# identity and its queries depend only on these row fields, so memoize them.
+@lru_cache(maxsize=16384)
+def _parse_identity_cached(wine_name: str, year_plat: str) -> WineIdentity:
     parts = [part.strip() for part in wine_name.split(" - ") if part.strip()]
 
     primary = parts[0] if parts else wine_name
-    year = extract_year(row.get("year_plat")) or extract_year(wine_name)
+    year = extract_year(year_plat) or extract_year(wine_name)
 
-    producer = re.sub(r"^(?:19|20)\d{2}\s+", "", primary, flags=re.IGNORECASE)
-    producer = re.sub(r"^nv\s+", "", producer, flags=re.IGNORECASE).strip()
+    producer = _LEADING_YEAR_RE.sub("", primary)
+    producer = _LEADING_NV_RE.sub("", producer).strip()
     producer = producer or primary.strip()
 
     label = parts[1] if len(parts) > 1 else producer
-    color = normalize_key(parts[2]) if len(parts) > 2 else ""
+    color = _normalized_key(parts[2]) if len(parts) > 2 else ""
     if color not in _COLOR_TOKENS:
         color = ""
 
     target_text = " ".join(piece for piece in [str(year) if year else "", producer, label] if piece)
-    target_tokens = set(canonicalize_key(target_text).split())
-    producer_tokens = {token for token in canonicalize_key(producer).split() if len(token) >= 3}
+    target_tokens = frozenset(_canonical_key(target_text).split())
+    producer_key = _canonical_key(producer)
+    producer_tokens = frozenset(token for token in producer_key.split() if len(token) >= 3)
 
     return WineIdentity(
         wine_name=wine_name,
@@ -188,10 +325,17 @@ def parse_identity(row: dict[str, str]) -> WineIdentity:
         color=color,
         producer_tokens=producer_tokens,
         target_tokens=target_tokens,
+        target_sorted_text=" ".join(sorted(target_tokens)),
+        producer_key=producer_key,
     )
 
 
 def build_queries(identity: WineIdentity, row: dict[str, str]) -> list[str]:
+    return list(_build_queries_cached(identity, _gs(row, "url_main"), _gs(row, "url_plat")))
+
+
+@lru_cache(maxsize=16384)
+def _build_queries_cached(identity: WineIdentity, url_main: str, url_plat: str) -> tuple[str, ...]:
     query_terms = [
         " ".join(
             part
@@ -201,21 +345,21 @@ def build_queries(identity: WineIdentity, row: dict[str, str]) -> list[str]:
         " ".join(part for part in [identity.producer, identity.label, identity.color, "site:vivino.com"] if part),
     ]
 
-    slug_hint = _product_slug_text((row.get("url_main") or "").strip())
+    slug_hint = _product_slug_text(url_main)
     if not slug_hint:
-        slug_hint = _product_slug_text((row.get("url_plat") or "").strip())
+        slug_hint = _product_slug_text(url_plat)
     if slug_hint:
         query_terms.append(f"{slug_hint} site:vivino.com")
 
     deduped: list[str] = []
     seen: set[str] = set()
     for query in query_terms:
-        cleaned = re.sub(r"\s+", " ", query).strip()
+        cleaned = _WHITESPACE_RE.sub(" ", query).strip()
         if cleaned and cleaned not in seen:
             deduped.append(cleaned)
             seen.add(cleaned)
 
-    return deduped[:3]
+    return tuple(deduped[:3])
 
 
 def build_vivino_search_url(identity: WineIdentity) -> str:
@@ -225,34 +369,84 @@ def build_vivino_search_url(identity: WineIdentity) -> str:
     return f"https://www.vivino.com/en/search/wines?q={quote_plus(base_query)}"
 
 
-def normalize_vivino_url(url: str | None) -> str:
+def parse_vivino_url(url: str | None, *, require_wine_page: bool = True) -> ParsedVivinoUrl | None:
     if not url:
-        return ""
+        return None
     parsed = urlparse(url.strip())
-    if "vivino.com" not in (parsed.netloc or ""):
-        return ""
-    if "/w/" not in parsed.path:
-        return ""
-    normalized_path = parsed.path.rstrip("/")
-    # Strip query/fragment to avoid Vivino pages that omit aggregateRating.
-    return urlunparse((parsed.scheme or "https", parsed.netloc, normalized_path, "", "", ""))
+    if require_wine_page and ("vivino.com" not in (parsed.netloc or "") or "/w/" not in parsed.path):
+        return None
 
+    year: int | None = None
+    year_values = parse_qs(parsed.query).get("year", [])
+    if year_values:
+        try:
+            year = int(year_values[0])
+        except ValueError:
+            year = None
 
-def search_serper(query: str, api_key: str, max_results: int) -> list[dict[str, str]]:
-    request_body = json.dumps({"q": query, "num": max_results}).encode("utf-8")
-    request = Request(
-        "https://google.serper.dev/search",
-        data=request_body,
-        method="POST",
-        headers={
-            "X-API-KEY": api_key,
-            "Content-Type": "application/json",
-        },
+    normalized_path = parsed.path.rstrip("/")
+    # Strip query/fragment to avoid Vivino pages that omit aggregateRating;
+    # the ?year= vintage hint is kept on the parsed result for scoring.
+    return ParsedVivinoUrl(
+        url=urlunparse((parsed.scheme or "https", parsed.netloc, normalized_path, "", "", "")),
+        year=year,
+        slug_text=_slug_text_from_path(parsed.path),
     )
 
-    with urlopen(request, timeout=30) as response:
-        payload = json.loads(response.read().decode("utf-8"))
 
+def normalize_vivino_url(url: str | None) -> str:
+    parsed = parse_vivino_url(url)
+    return parsed.url if parsed else ""
+
+
+def close_http_pool() -> None:
+    _HTTP_POOL.close()
+
+
+atexit.register(close_http_pool)
+
+
+def _request_json(
+    method: str,
+    url: str,
+    *,
+    headers: dict[str, str] | None = None,
+    body: bytes | None = None,
+    reserve_retry: Callable[[], bool] | None = None,
+) -> dict | list:
+    # Failures surface as HTTPError/URLError, same as urlopen, so provider
+    # fallback keeps catching them. Transport errors and 429/5xx are retried
+    # for GET, while a POST is re-sent only when nothing reached the server,
+    # since otherwise the provider may already have billed it. Each retry
+    # must first be granted by reserve_retry, which charges it to the query
+    # budget. (A pooled socket closed while idle is handled by the pool.)
+    idempotent = method in ("GET", "HEAD")
+    attempt = 0
+    while True:
+        try:
+            response, payload = _HTTP_POOL.request(method, url, headers=headers, body=body)
+        except RequestError as exc:
+            if (
+                attempt >= _HTTP_RETRY_TOTAL
+                or (exc.sent and not idempotent)
+                or (reserve_retry is not None and not reserve_retry())
+            ):
+                raise URLError(exc) from exc
+        else:
+            if (
+                response.status not in _HTTP_RETRY_STATUSES
+                or not idempotent
+                or attempt >= _HTTP_RETRY_TOTAL
+                or (reserve_retry is not None and not reserve_retry())
+            ):
+                if response.status >= 400:
+                    raise HTTPError(url, response.status, response.reason, response.headers, None)
+                return _json_loads(payload)
+        time.sleep(_HTTP_RETRY_BACKOFF_SECONDS * (2**attempt))
+        attempt += 1
+
+
+def _serper_organic_results(payload: dict) -> list[dict[str, str]]:
     results: list[dict[str, str]] = []
     for item in payload.get("organic", []) or []:
         link = (item.get("link") or "").strip()
@@ -262,7 +456,54 @@ def search_serper(query: str, api_key: str, max_results: int) -> list[dict[str,
     return results
 
 
-def search_google_cse(query: str, api_key: str, cse_id: str, max_results: int) -> list[dict[str, str]]:
+def search_serper(
+    query: str,
+    api_key: str,
+    max_results: int,
+    reserve_retry: Callable[[], bool] | None = None,
+) -> list[dict[str, str]]:
+    payload = _request_json(
+        "POST",
+        "https://google.serper.dev/search",
+        body=json.dumps({"q": query, "num": max_results}).encode("utf-8"),
+        headers={
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json",
+        },
+        reserve_retry=reserve_retry,
+    )
+    return _serper_organic_results(payload)
+
+
+def search_serper_batch(
+    queries: list[str],
+    api_key: str,
+    max_results: int,
+    reserve_retry: Callable[[], bool] | None = None,
+) -> list[list[dict[str, str]]]:
+    # Serper accepts a JSON array of searches and answers with one payload per entry.
+    payload = _request_json(
+        "POST",
+        "https://google.serper.dev/search",
+        body=json.dumps([{"q": query, "num": max_results} for query in queries]).encode("utf-8"),
+        headers={
+            "X-API-KEY": api_key,
+            "Content-Type": "application/json",
+        },
+        reserve_retry=reserve_retry,
+    )
+    if not isinstance(payload, list) or len(payload) != len(queries):
+        raise ValueError("serper batch response does not match the submitted queries")
+    return [_serper_organic_results(item if isinstance(item, dict) else {}) for item in payload]
+
+
+def search_google_cse(
+    query: str,
+    api_key: str,
+    cse_id: str,
+    max_results: int,
+    reserve_retry: Callable[[], bool] | None = None,
+) -> list[dict[str, str]]:
     if max_results <= 0:
         return []
 
@@ -273,10 +514,7 @@ def search_google_cse(query: str, api_key: str, cse_id: str, max_results: int) -
         "num": max(1, min(max_results, 10)),
     }
     url = f"https://customsearch.googleapis.com/customsearch/v1?{urlencode(params)}"
-    request = Request(url, method="GET")
-
-    with urlopen(request, timeout=30) as response:
-        payload = json.loads(response.read().decode("utf-8"))
+    payload = _request_json("GET", url, reserve_retry=reserve_retry)
 
     results: list[dict[str, str]] = []
     for item in payload.get("items", []) or []:
@@ -287,7 +525,12 @@ def search_google_cse(query: str, api_key: str, cse_id: str, max_results: int) -
     return results
 
 
-def search_brave(query: str, api_key: str, max_results: int) -> list[dict[str, str]]:
+def search_brave(
+    query: str,
+    api_key: str,
+    max_results: int,
+    reserve_retry: Callable[[], bool] | None = None,
+) -> list[dict[str, str]]:
     if max_results <= 0:
         return []
 
@@ -296,18 +539,16 @@ def search_brave(query: str, api_key: str, max_results: int) -> list[dict[str, s
         "count": max(1, min(max_results, 20)),
     }
     url = f"https://api.search.brave.com/res/v1/web/search?{urlencode(params)}"
-    request = Request(
+    payload = _request_json(
+        "GET",
         url,
-        method="GET",
         headers={
             "Accept": "application/json",
             "X-Subscription-Token": api_key,
         },
+        reserve_retry=reserve_retry,
     )
 
-    with urlopen(request, timeout=30) as response:
-        payload = json.loads(response.read().decode("utf-8"))
-
     results: list[dict[str, str]] = []
     web = payload.get("web") or {}
     for item in web.get("results", []) or []:
@@ -326,13 +567,19 @@ def run_search(
     google_api_key: str,
     google_cse_id: str,
     brave_api_key: str,
+    reserve_retry: Callable[[], bool] | None = None,
 ) -> list[dict[str, str]]:
     if provider == "none":
         return []
     if provider == "serper":
         if not serper_api_key:
             raise ValueError("SERPER_API_KEY is required for --provider serper")
-        return search_serper(query=query, api_key=serper_api_key, max_results=max_results)
+        return search_serper(
+            query=query,
+            api_key=serper_api_key,
+            max_results=max_results,
+            reserve_retry=reserve_retry,
+        )
     if provider == "google_cse":
         if not google_api_key:
             raise ValueError("GOOGLE_API_KEY is required for --provider google_cse")
@@ -343,81 +590,20 @@ def run_search(
             api_key=google_api_key,
             cse_id=google_cse_id,
             max_results=max_results,
+            reserve_retry=reserve_retry,
         )
     if provider == "brave":
         if not brave_api_key:
             raise ValueError("BRAVE_API_KEY is required for --provider brave")
-        return search_brave(query=query, api_key=brave_api_key, max_results=max_results)
+        return search_brave(
+            query=query,
+            api_key=brave_api_key,
+            max_results=max_results,
+            reserve_retry=reserve_retry,
+        )
     raise ValueError(f"Unsupported provider: {provider}")
 
 
-def load_query_cache(path: Path) -> dict[str, dict[str, object]]:
-    if not path.exists():
-        return {}
-    try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
-        return {}
-    if not isinstance(payload, dict):
-        return {}
-    normalized: dict[str, dict[str, object]] = {}
-    for key, value in payload.items():
-        if isinstance(key, str) and isinstance(value, dict):
-            normalized[key] = value
-    return normalized
-
-
-def save_query_cache(path: Path, cache: dict[str, dict[str, object]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
-
-
-def _build_query_cache_key(provider: str, query: str, max_results: int) -> str:
-    cleaned_query = re.sub(r"\s+", " ", query.strip().lower())
-    return f"{provider}|{max_results}|{cleaned_query}"
-
-
-def _read_cache_results(
-    cache: dict[str, dict[str, object]],
-    cache_key: str,
-    cache_ttl_hours: float,
-) -> list[dict[str, str]] | None:
-    entry = cache.get(cache_key)
-    if not entry:
-        return None
-
-    timestamp = entry.get("timestamp")
-    if isinstance(timestamp, (int, float)) and cache_ttl_hours > 0:
-        age_seconds = time.time() - float(timestamp)
-        if age_seconds > (cache_ttl_hours * 3600):
-            return None
-
-    results = entry.get("results")
-    if not isinstance(results, list):
-        return None
-
-    normalized: list[dict[str, str]] = []
-    for item in results:
-        if not isinstance(item, dict):
-            continue
-        url = str(item.get("url") or "").strip()
-        title = str(item.get("title") or "").strip()
-        if url:
-            normalized.append({"url": url, "title": title})
-    return normalized
-
-
-def _write_cache_results(
-    cache: dict[str, dict[str, object]],
-    cache_key: str,
-    results: list[dict[str, str]],
-) -> None:
-    cache[cache_key] = {
-        "timestamp": int(time.time()),
-        "results": results,
-    }
-
-
 def _provider_has_credentials(
     provider: str,
     *,
@@ -474,6 +660,61 @@ def _resolve_provider_order(
     return providers
 
 
+def _reserve_api_call(api_calls_state: dict[str, int], max_api_queries: int, calls: int = 1) -> bool:
+    with _API_BUDGET_LOCK:
+        if max_api_queries > 0 and api_calls_state["count"] + calls > max_api_queries:
+            return False
+        api_calls_state["count"] += calls
+        return True
+
+
+class _RateLimiter:
+    # Token bucket shared by every worker calling one provider: up to `burst`
+    # calls go out back to back, then calls are spaced at the configured rate.
+    # Tokens may go negative, so concurrent callers each wait for their slot.
+    def __init__(self, rate_per_minute: float, burst: int = 1) -> None:
+        self._interval = 60.0 / rate_per_minute
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) / self._interval)
+            self._updated = now
+            self._tokens -= 1.0
+            wait = -self._tokens * self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+@dataclass(slots=True)
+class ProviderRunState:
+    disabled: dict[str, str] = field(default_factory=dict)
+    limiters: dict[str, _RateLimiter] = field(default_factory=dict)
+
+    def disable_on_http_error(self, provider: str, exc: Exception) -> None:
+        if isinstance(exc, HTTPError) and exc.code in _PROVIDER_DISABLING_STATUSES:
+            self.disabled.setdefault(provider, f"after_http_{exc.code}")
+
+    def throttle(self, provider: str) -> None:
+        limiter = self.limiters.get(provider)
+        if limiter is not None:
+            limiter.acquire()
+
+
+def _build_rate_limiters(args: argparse.Namespace) -> dict[str, _RateLimiter]:
+    rates = {
+        "google_cse": args.rate_per_minute_google_cse,
+        "brave": args.rate_per_minute_brave,
+        "serper": args.rate_per_minute_serper,
+    }
+    burst = max(1, args.search_workers)
+    return {provider: _RateLimiter(rate, burst=burst) for provider, rate in rates.items() if rate > 0}
+
+
 def search_with_cache_and_fallback(
     *,
     requested_provider: str,
@@ -484,11 +725,14 @@ def search_with_cache_and_fallback(
     google_cse_id: str,
     brave_api_key: str,
     auto_provider_order: str,
-    query_cache: dict[str, dict[str, object]],
+    query_cache: QueryCache,
     cache_ttl_hours: float,
     max_api_queries: int,
     api_calls_state: dict[str, int],
+    provider_state: ProviderRunState | None = None,
 ) -> tuple[list[dict[str, str]], str, bool, list[str]]:
+    if provider_state is None:
+        provider_state = ProviderRunState()
     providers = _resolve_provider_order(
         requested_provider,
         auto_provider_order=auto_provider_order,
@@ -516,19 +760,24 @@ def search_with_cache_and_fallback(
             errors.append(f"{provider}:missing_credentials")
             continue
 
-        cache_key = _build_query_cache_key(provider, query, max_results)
-        cached_results = _read_cache_results(query_cache, cache_key, cache_ttl_hours)
+        cache_key = build_query_cache_key(provider, query, max_results)
+        cached_results = read_cache_results(query_cache, cache_key, cache_ttl_hours)
         if cached_results is not None:
             had_cache_hit = True
             if cached_results:
                 return (cached_results, provider, True, errors)
             errors.append(f"{provider}:cache_empty_retrying_live")
 
-        if max_api_queries > 0 and api_calls_state["count"] >= max_api_queries:
+        disabled_reason = provider_state.disabled.get(provider)
+        if disabled_reason:
+            errors.append(f"{provider}:skipped_{disabled_reason}")
+            continue
+
+        if not _reserve_api_call(api_calls_state, max_api_queries):
             errors.append(f"{provider}:max_api_queries_reached")
             continue
 
-        api_calls_state["count"] += 1
+        provider_state.throttle(provider)
         try:
             live_results = run_search(
                 provider=provider,
@@ -538,12 +787,14 @@ def search_with_cache_and_fallback(
                 google_api_key=google_api_key,
                 google_cse_id=google_cse_id,
                 brave_api_key=brave_api_key,
+                reserve_retry=lambda: _reserve_api_call(api_calls_state, max_api_queries),
             )
         except (HTTPError, URLError, ValueError) as exc:
+            provider_state.disable_on_http_error(provider, exc)
             errors.append(f"{provider}:{exc}")
             continue
 
-        _write_cache_results(query_cache, cache_key, live_results)
+        write_cache_results(query_cache, cache_key, live_results, query)
         if live_results:
             return (live_results, provider, False, errors)
         errors.append(f"{provider}:no_results")
@@ -551,71 +802,335 @@ def search_with_cache_and_fallback(
     return ([], fallback_provider, had_cache_hit, errors)
 
 
-def _token_set_ratio(target_tokens: set[str], candidate_tokens: set[str]) -> float:
+def _fetch_query_results(
+    args: argparse.Namespace,
+    query: str,
+    query_cache: QueryCache,
+    api_calls_state: dict[str, int],
+    provider_state: ProviderRunState | None = None,
+) -> _SearchOutcome:
+    outcome = search_with_cache_and_fallback(
+        requested_provider=args.provider,
+        query=query,
+        max_results=args.max_results,
+        serper_api_key=args.serper_api_key,
+        google_api_key=args.google_api_key,
+        google_cse_id=args.google_cse_id,
+        brave_api_key=args.brave_api_key,
+        auto_provider_order=args.auto_provider_order,
+        query_cache=query_cache,
+        cache_ttl_hours=args.cache_ttl_hours,
+        max_api_queries=args.max_api_queries,
+        api_calls_state=api_calls_state,
+        provider_state=provider_state,
+    )
+    if args.sleep_seconds > 0 and not (provider_state and provider_state.limiters):
+        time.sleep(args.sleep_seconds)
+    return outcome
+
+
+def _fetch_serper_batch(
+    args: argparse.Namespace,
+    queries: list[str],
+    query_cache: QueryCache,
+    api_calls_state: dict[str, int],
+    provider_state: ProviderRunState | None = None,
+) -> list[_SearchOutcome]:
+    if provider_state is None:
+        provider_state = ProviderRunState()
+    outcomes: list[_SearchOutcome | None] = [None] * len(queries)
+    pending: list[tuple[int, str, bool, list[str]]] = []
+    for index, query in enumerate(queries):
+        cache_key = build_query_cache_key("serper", query, args.max_results)
+        cached_results = read_cache_results(query_cache, cache_key, args.cache_ttl_hours)
+        errors: list[str] = []
+        if cached_results:
+            outcomes[index] = (cached_results, "serper", True, errors)
+            continue
+        if cached_results is not None:
+            errors.append("serper:cache_empty_retrying_live")
+        # Queries left without a reservation go through the per-query path,
+        # which reports the exhausted budget or disabled provider the usual way.
+        if "serper" not in provider_state.disabled and _reserve_api_call(api_calls_state, args.max_api_queries):
+            pending.append((index, cache_key, cached_results is not None, errors))
+
+    if pending:
+        provider_state.throttle("serper")
+        try:
+            batches = search_serper_batch(
+                [queries[index] for index, _, _, _ in pending],
+                api_key=args.serper_api_key,
+                max_results=args.max_results,
+                reserve_retry=lambda: _reserve_api_call(api_calls_state, args.max_api_queries, len(pending)),
+            )
+        except (HTTPError, URLError, ValueError) as exc:
+            provider_state.disable_on_http_error("serper", exc)
+            for index, _, cache_hit, errors in pending:
+                outcomes[index] = ([], "serper", cache_hit, [*errors, f"serper:{exc}"])
+        else:
+            for (index, cache_key, cache_hit, errors), results in zip(pending, batches):
+                write_cache_results(query_cache, cache_key, results, queries[index])
+                if not results:
+                    errors.append("serper:no_results")
+                outcomes[index] = (results, "serper", cache_hit, errors)
+        if args.sleep_seconds > 0 and not provider_state.limiters:
+            time.sleep(args.sleep_seconds)
+
+    return [
+        outcome
+        if outcome is not None
+        else _fetch_query_results(args, query, query_cache, api_calls_state, provider_state)
+        for query, outcome in zip(queries, outcomes)
+    ]
+
+
+def _is_settled_empty_error(error: str) -> bool:
+    return error.endswith((":no_results", ":cache_empty_retrying_live"))
+
+
+def _fetch_row_outcomes(
+    args: argparse.Namespace,
+    queries: list[str],
+    query_cache: QueryCache,
+    api_calls_state: dict[str, int],
+    *,
+    run_memo: dict[str, _SearchOutcome],
+    search_pool: ThreadPoolExecutor | None = None,
+    provider_state: ProviderRunState | None = None,
+) -> list[_SearchOutcome]:
+    # Rows share producers and slugs, so the same normalized query recurs within
+    # a run. Settled outcomes are memoized per run: repeats skip the cache
+    # lookup, and known-empty queries are not re-sent live.
+    memo_keys = [build_query_cache_key(args.provider, query, args.max_results) for query in queries]
+    pending: dict[str, str] = {}
+    for query, memo_key in zip(queries, memo_keys):
+        if memo_key not in run_memo and memo_key not in pending:
+            pending[memo_key] = query
+
+    pending_queries = list(pending.values())
+    if not pending_queries:
+        fetched: list[_SearchOutcome] = []
+    elif args.provider == "serper" and args.serper_batch and len(pending_queries) > 1:
+        # Serper takes all of a row's queries in one POST; other providers do not batch.
+        fetched = _fetch_serper_batch(args, pending_queries, query_cache, api_calls_state, provider_state)
+    elif search_pool is not None:
+        fetched = list(
+            search_pool.map(
+                lambda query: _fetch_query_results(args, query, query_cache, api_calls_state, provider_state),
+                pending_queries,
+            )
+        )
+    else:
+        fetched = [
+            _fetch_query_results(args, query, query_cache, api_calls_state, provider_state)
+            for query in pending_queries
+        ]
+
+    fresh = dict(zip(pending, fetched))
+    for memo_key, (results, provider_used, _, errors) in fresh.items():
+        # An empty outcome is settled only if every provider tried answered
+        # with nothing; a transient failure anywhere leaves it to be retried.
+        if results or provider_used == "none" or (errors and all(map(_is_settled_empty_error, errors))):
+            run_memo[memo_key] = (results, provider_used, True, [] if results else errors)
+
+    outcomes: list[_SearchOutcome] = []
+    served: set[str] = set()
+    for memo_key in memo_keys:
+        if memo_key in fresh and memo_key not in served:
+            served.add(memo_key)
+            outcomes.append(fresh[memo_key])
+        else:
+            outcomes.append(run_memo.get(memo_key) or fresh[memo_key])
+    return outcomes
+
+
+def _iter_row_outcomes(
+    args: argparse.Namespace,
+    row_queries: Iterable[list[str]],
+    query_cache: QueryCache,
+    api_calls_state: dict[str, int],
+    *,
+    run_memo: dict[str, _SearchOutcome],
+    search_pool: ThreadPoolExecutor | None = None,
+    prefetch_rows: int = 0,
+    row_workers: int = 1,
+    provider_state: ProviderRunState | None = None,
+) -> Iterator[list[_SearchOutcome]]:
+    def fetch(queries: list[str]) -> list[_SearchOutcome]:
+        return _fetch_row_outcomes(
+            args,
+            queries,
+            query_cache,
+            api_calls_state,
+            run_memo=run_memo,
+            search_pool=search_pool,
+            provider_state=provider_state,
+        )
+
+    row_workers = max(1, row_workers)
+    lookahead = max(prefetch_rows, row_workers - 1)
+    if lookahead <= 0:
+        for queries in row_queries:
+            yield fetch(queries)
+        return
+
+    # Fetch threads walk the rows in order, at most `lookahead` rows ahead of
+    # the caller, so network waits overlap scoring; outcomes are yielded in
+    # row order. With one thread the run memo and API budget are consumed in
+    # the same order as a plain loop. With more, rows fetch side by side and a
+    # query shared by rows in flight together may be sent more than once.
+    fetcher = ThreadPoolExecutor(max_workers=row_workers)
+    upcoming = iter(row_queries)
+    window: deque[Future[list[_SearchOutcome]]] = deque()
+    try:
+        for queries in upcoming:
+            window.append(fetcher.submit(fetch, queries))
+            if len(window) > lookahead:
+                break
+        while window:
+            outcomes = window.popleft().result()
+            queries = next(upcoming, None)
+            if queries is not None:
+                window.append(fetcher.submit(fetch, queries))
+            yield outcomes
+    finally:
+        fetcher.shutdown(wait=True, cancel_futures=True)
+
+
+def _token_set_ratio(
+    target_tokens: frozenset[str] | set[str],
+    candidate_tokens: frozenset[str] | set[str],
+    *,
+    target_text: str | None = None,
+    candidate_matcher: SequenceMatcher | None = None,
+) -> float:
     inter = sorted(target_tokens & candidate_tokens)
     if not inter:
         return 0.0
 
     inter_text = " ".join(inter)
-    target_text = " ".join(sorted(target_tokens))
-    candidate_text = " ".join(sorted(candidate_tokens))
+    if target_text is None:
+        target_text = " ".join(sorted(target_tokens))
+    candidate_text = candidate_matcher.b if candidate_matcher is not None else " ".join(sorted(candidate_tokens))
+    # A subset match compares identical strings, which always scores 1.0.
+    if inter_text == target_text or inter_text == candidate_text:
+        return 1.0
+
+    if candidate_matcher is None:
+        candidate_matcher = SequenceMatcher(None, inter_text, candidate_text)
+    else:
+        candidate_matcher.set_seq1(inter_text)
     return max(
         SequenceMatcher(None, inter_text, target_text).ratio(),
-        SequenceMatcher(None, inter_text, candidate_text).ratio(),
+        candidate_matcher.ratio(),
+    )
+
+
+def _jaro_winkler(left: str, right: str, prefix_scale: float = 0.1) -> float:
+    if not left or not right:
+        return 0.0
+    if left == right:
+        return 1.0
+
+    window = max(max(len(left), len(right)) // 2 - 1, 0)
+    right_matched = [False] * len(right)
+    left_matches: list[str] = []
+    for index, char in enumerate(left):
+        for other in range(max(0, index - window), min(index + window + 1, len(right))):
+            if not right_matched[other] and right[other] == char:
+                right_matched[other] = True
+                left_matches.append(char)
+                break
+
+    matches = len(left_matches)
+    if matches == 0:
+        return 0.0
+    right_matches = [char for char, matched in zip(right, right_matched) if matched]
+    transpositions = sum(a != b for a, b in zip(left_matches, right_matches)) // 2
+    jaro = (matches / len(left) + matches / len(right) + (matches - transpositions) / matches) / 3
+
+    prefix = 0
+    for a, b in zip(left[:4], right[:4]):
+        if a != b:
+            break
+        prefix += 1
+    return jaro + prefix * prefix_scale * (1.0 - jaro)
+
+
+@lru_cache(maxsize=16384)
+def _candidate_features(title: str, slug_text: str) -> CandidateFeatures:
+    candidate_text = f"{title} {slug_text}"
+    tokens = frozenset(_canonical_key(candidate_text).split())
+    return CandidateFeatures(
+        tokens=tokens,
+        sorted_text=" ".join(sorted(tokens)),
+        slug_key=_canonical_key(slug_text),
+        raw_tokens=frozenset(_normalized_key(candidate_text).split()),
+        text_year=extract_year(candidate_text),
     )
 
 
-def score_candidate(identity: WineIdentity, title: str, url: str) -> tuple[float, int, bool]:
-    candidate_text = f"{title} {_safe_slug_text(url)}"
-    candidate_key = canonicalize_key(candidate_text)
-    candidate_tokens = set(candidate_key.split())
+def score_candidate(
+    identity: WineIdentity,
+    title: str,
+    url: ParsedVivinoUrl | str,
+) -> tuple[float, int, bool, float]:
+    if not isinstance(url, ParsedVivinoUrl):
+        url = parse_vivino_url(url, require_wine_page=False) or ParsedVivinoUrl(url="", year=None, slug_text="")
+    features = _candidate_features(title, url.slug_text)
+    candidate_tokens = features.tokens
     if not identity.target_tokens or not candidate_tokens:
-        return (0.0, 0, False)
+        return (0.0, 0, False, 0.0)
 
     overlap = len(identity.target_tokens & candidate_tokens)
     if overlap == 0:
-        return (0.0, 0, False)
+        return (0.0, 0, False, 0.0)
 
     token_ratio = overlap / max(len(identity.target_tokens), len(candidate_tokens))
-    seq_ratio = SequenceMatcher(
-        None,
-        " ".join(sorted(identity.target_tokens)),
-        " ".join(sorted(candidate_tokens)),
-    ).ratio()
-    set_ratio = _token_set_ratio(identity.target_tokens, candidate_tokens)
-    score = (token_ratio * 0.45) + (seq_ratio * 0.20) + (set_ratio * 0.35)
-
     producer_overlap = len(identity.producer_tokens & candidate_tokens) if identity.producer_tokens else 0
-    if identity.producer_tokens and producer_overlap == 0:
+    producer_missing = bool(identity.producer_tokens) and producer_overlap == 0
+
+    query_year: int | None = None
+    if identity.year is not None:
+        query_year = url.year if url.year is not None else features.text_year
+    year_match = identity.year is not None and query_year == identity.year
+    year_mismatch = identity.year is not None and query_year is not None and not year_match
+
+    # Wrong producer, wrong vintage and little token overlap caps the score
+    # well under the review floor, so skip the string ratios entirely.
+    if producer_missing and year_mismatch and token_ratio < 0.2:
+        return (0.0, 0, False, 0.0)
+
+    # SequenceMatcher indexes its second sequence once; keep the candidate
+    # there so the token-set comparison reuses that index via set_seq1().
+    candidate_matcher = SequenceMatcher(None, identity.target_sorted_text, features.sorted_text)
+    seq_ratio = candidate_matcher.ratio()
+    set_ratio = _token_set_ratio(
+        identity.target_tokens,
+        candidate_tokens,
+        target_text=identity.target_sorted_text,
+        candidate_matcher=candidate_matcher,
+    )
+    # Vivino slugs lead with the producer, so a prefix-weighted comparison
+    # rewards "chateau margaux ..." slugs for producer "Château Margaux".
+    producer_similarity = _jaro_winkler(identity.producer_key, features.slug_key)
+    score = (token_ratio * 0.35) + (seq_ratio * 0.15) + (set_ratio * 0.30) + (producer_similarity * 0.20)
+
+    if producer_missing:
         score -= 0.25
     elif producer_overlap > 0:
         score += min(0.08, producer_overlap * 0.03)
 
-    year_match = False
-    if identity.year is not None:
-        query_year: int | None = None
-        year_values = parse_qs(urlparse(url).query).get("year", [])
-        if year_values:
-            try:
-                query_year = int(year_values[0])
-            except ValueError:
-                query_year = None
-        if query_year is None:
-            query_year = extract_year(candidate_text)
-
-        if query_year == identity.year:
-            score += 0.10
-            year_match = True
-        elif query_year is not None:
-            score -= 0.10
-
-    if identity.color:
-        raw_tokens = set(normalize_key(candidate_text).split())
-        if identity.color in raw_tokens:
-            score += 0.03
+    if year_match:
+        score += 0.10
+    elif year_mismatch:
+        score -= 0.10
+
+    if identity.color and identity.color in features.raw_tokens:
+        score += 0.03
 
     score = max(0.0, min(1.0, score))
-    return (score, producer_overlap, year_match)
+    return (score, producer_overlap, year_match, producer_similarity)
 
 
 def resolve_matches(args: argparse.Namespace) -> None:
@@ -646,7 +1161,7 @@ def resolve_matches(args: argparse.Namespace) -> None:
     missing_url_enrichment_count = 0
     missing_metrics_enrichment_count = 0
     for row in comparison_rows:
-        wine_name = (row.get("name_plat") or "").strip()
+        wine_name = _gs(row, "name_plat")
         if not wine_name:
             continue
 
@@ -672,19 +1187,22 @@ def resolve_matches(args: argparse.Namespace) -> None:
             missing_metrics_enrichment_count += 1
 
     total_unresolved_before_filter = len(unresolved_rows)
+    # Fingerprint each row once; the filter and the main loop share it.
+    unresolved_fingerprints = [unresolved_fingerprint(row) for row in unresolved_rows]
     skipped_seen = 0
     if args.only_new_unresolved:
-        filtered_rows: list[dict[str, str]] = []
-        for row in unresolved_rows:
-            fingerprint = unresolved_fingerprint(row)
-            if fingerprint in seen_unresolved:
-                skipped_seen += 1
-                continue
-            filtered_rows.append(row)
-        unresolved_rows = filtered_rows
+        kept = [
+            (fingerprint, row)
+            for fingerprint, row in zip(unresolved_fingerprints, unresolved_rows)
+            if fingerprint not in seen_unresolved
+        ]
+        skipped_seen = len(unresolved_rows) - len(kept)
+        unresolved_fingerprints = [fingerprint for fingerprint, _ in kept]
+        unresolved_rows = [row for _, row in kept]
 
     if args.limit > 0:
         unresolved_rows = unresolved_rows[: args.limit]
+        unresolved_fingerprints = unresolved_fingerprints[: args.limit]
 
     print(
         "[resolve] input:",
@@ -705,230 +1223,290 @@ def resolve_matches(args: argparse.Namespace) -> None:
     cache_hits = 0
     provider_usage: dict[str, int] = {}
 
-    review_rows: list[dict[str, str]] = []
-    unmatched_rows: list[dict[str, str]] = []
     accepted_rows: list[dict[str, str]] = []
 
     review_threshold = max(args.min_confidence - 0.12, 0.55)
 
-    for index, row in enumerate(unresolved_rows, start=1):
-        row_fingerprint = unresolved_fingerprint(row)
-        seen_unresolved[row_fingerprint] = int(time.time())
-
-        identity = parse_identity(row)
-        existing_match_row, _ = match_vivino_row(identity.wine_name, initial_lookup)
-        queries = build_queries(identity, row)
-        vivino_search_url = build_vivino_search_url(identity)
-
-        candidates_by_url: dict[str, Candidate] = {}
-        search_errors: list[str] = []
-
-        for query in queries:
-            results, provider_used, cache_hit, provider_errors = search_with_cache_and_fallback(
-                requested_provider=args.provider,
-                query=query,
-                max_results=args.max_results,
-                serper_api_key=args.serper_api_key,
-                google_api_key=args.google_api_key,
-                google_cse_id=args.google_cse_id,
-                brave_api_key=args.brave_api_key,
-                auto_provider_order=args.auto_provider_order,
-                query_cache=query_cache,
-                cache_ttl_hours=args.cache_ttl_hours,
-                max_api_queries=args.max_api_queries,
-                api_calls_state=api_calls_state,
+    # A row's queries are independent, so with --search-workers > 1 they are
+    # fetched concurrently; results are still scored in query order.
+    search_pool = ThreadPoolExecutor(max_workers=args.search_workers) if args.search_workers > 1 else None
+    run_memo: dict[str, _SearchOutcome] = {}
+    provider_state = ProviderRunState(limiters=_build_rate_limiters(args))
+
+    newly_seen: dict[str, int] = {}
+    # Fingerprints decided since the last checkpoint, and how many accepted
+    # rows have already been merged into the overrides file.
+    pending_seen: list[str] = []
+    applied_accepted = 0
+    review_count = 0
+    unmatched_count = 0
+    # Rows are written as they are decided so an interrupted run keeps its
+    # progress; accepted rows are also kept for --auto-apply.
+    with ExitStack() as stack:
+        review_handle, review_writer = _open_csv_stream(stack, args.output_review, _REVIEW_FIELDS)
+        unmatched_handle, unmatched_writer = _open_csv_stream(stack, args.output_unmatched, _UNMATCHED_FIELDS)
+        suggestions_handle, suggestions_writer = _open_csv_stream(stack, args.output_suggestions, OVERRIDE_FIELDS)
+        # Fingerprints reach the log only at a checkpoint, after the rows before
+        # it are flushed and (with --auto-apply) merged into the overrides, so
+        # a crashed run retries anything whose outcome was not yet saved.
+        state_log = open_state_log(stack, args.state_file)
+        stream_handles = (review_handle, unmatched_handle, suggestions_handle)
+
+        identities = [parse_identity(row) for row in unresolved_rows]
+        row_queries = [build_queries(identity, row) for identity, row in zip(identities, unresolved_rows)]
+        row_outcomes = stack.enter_context(
+            closing(
+                _iter_row_outcomes(
+                    args,
+                    row_queries,
+                    query_cache,
+                    api_calls_state,
+                    run_memo=run_memo,
+                    search_pool=search_pool,
+                    prefetch_rows=args.prefetch_rows,
+                    row_workers=args.row_workers,
+                    provider_state=provider_state,
+                )
             )
+        )
 
-            provider_usage[provider_used] = provider_usage.get(provider_used, 0) + 1
-            if cache_hit:
-                cache_hits += 1
-            if provider_errors:
-                search_errors.extend(provider_errors)
-
-            for result in results:
-                normalized_url = normalize_vivino_url(result.get("url"))
-                if not normalized_url:
-                    continue
-
-                score, producer_overlap, year_match = score_candidate(
-                    identity=identity,
-                    title=result.get("title", ""),
-                    url=normalized_url,
+        for index, (row, row_fingerprint, identity, queries, outcomes) in enumerate(
+            zip(unresolved_rows, unresolved_fingerprints, identities, row_queries, row_outcomes),
+            start=1,
+        ):
+            existing_match_row, _ = match_vivino_row(identity.wine_name, initial_lookup)
+            vivino_search_url = build_vivino_search_url(identity)
+
+            candidates_by_url: dict[str, Candidate] = {}
+            # The row's queries usually surface the same pages; an identical
+            # (title, url) rescores identically and never beats its first
+            # score, so each pair is scored once per row.
+            scored_results: set[tuple[str, ParsedVivinoUrl]] = set()
+            search_errors: list[str] = []
+            search_trace: list[dict[str, object]] = []
+
+            for query, (results, provider_used, cache_hit, provider_errors) in zip(queries, outcomes):
+                search_trace.append(
+                    {
+                        "query": query,
+                        "provider": provider_used,
+                        "cache_hit": cache_hit,
+                        "results": len(results),
+                        "errors": provider_errors,
+                    }
                 )
-                if score <= 0:
-                    continue
-
-                existing = candidates_by_url.get(normalized_url)
-                if existing is None or score > existing.score:
-                    candidates_by_url[normalized_url] = Candidate(
-                        url=normalized_url,
-                        title=(result.get("title") or _safe_slug_text(normalized_url)).strip(),
-                        query=query,
-                        provider=provider_used,
-                        score=score,
-                        producer_overlap=producer_overlap,
-                        year_match=year_match,
+                provider_usage[provider_used] = provider_usage.get(provider_used, 0) + 1
+                if cache_hit:
+                    cache_hits += 1
+                if provider_errors:
+                    search_errors.extend(provider_errors)
+
+                for result in results:
+                    parsed_url = parse_vivino_url(result.get("url"))
+                    if parsed_url is None:
+                        continue
+                    result_key = (result.get("title", ""), parsed_url)
+                    if result_key in scored_results:
+                        continue
+                    scored_results.add(result_key)
+
+                    score, producer_overlap, year_match, producer_similarity = score_candidate(
+                        identity=identity,
+                        title=result_key[0],
+                        url=parsed_url,
                     )
-
-            if args.sleep_seconds > 0:
-                time.sleep(args.sleep_seconds)
-
-        ranked = sorted(candidates_by_url.values(), key=lambda c: c.score, reverse=True)
-        best = ranked[0] if ranked else None
-        second = ranked[1] if len(ranked) > 1 else None
-
-        best_score = best.score if best else 0.0
-        second_score = second.score if second else 0.0
-        margin = best_score - second_score
-
-        if args.provider == "none":
-            decision = "no_provider"
-            reason = "provider=none; generated deterministic queries only"
-        elif best is None:
-            decision = "unmatched"
-            reason = "no viable vivino candidates returned"
-        elif args.auto_accept_best:
-            decision = "auto_accept"
-            reason = (
-                f"auto_accept_best enabled; score={best.score:.3f}, margin={margin:.3f}, "
-                f"producer_overlap={best.producer_overlap}"
-            )
-        elif best.producer_overlap == 0:
-            decision = "needs_review"
-            reason = "top candidate missing producer token overlap"
-        elif best.score >= args.min_confidence and margin >= args.min_margin:
-            decision = "auto_accept"
-            reason = f"score={best.score:.3f}, margin={margin:.3f}"
-        elif best.score >= review_threshold:
-            decision = "needs_review"
-            reason = f"score={best.score:.3f}, margin={margin:.3f}"
-        else:
-            decision = "unmatched"
-            reason = f"score below threshold ({best.score:.3f} < {review_threshold:.3f})"
-
-        if search_errors:
-            reason = f"{reason}; search_error={search_errors[0]}"
-
-        if decision == "auto_accept" and best is not None:
-            existing_rating_for_accept = (existing_match_row.get("vivino_rating") or "").strip()
-            existing_count_for_accept = (
-                (existing_match_row.get("vivino_num_ratings") or "").strip()
-                or (existing_match_row.get("vivino_raters") or "").strip()
-            )
-            if (
-                args.require_vivino_metrics
-                and not existing_rating_for_accept
-                and not existing_count_for_accept
-            ):
+                    if score <= 0:
+                        continue
+
+                    existing = candidates_by_url.get(parsed_url.url)
+                    if existing is None or score > existing.score:
+                        candidates_by_url[parsed_url.url] = Candidate(
+                            url=parsed_url.url,
+                            title=(result.get("title") or parsed_url.slug_text).strip(),
+                            query=query,
+                            provider=provider_used,
+                            score=score,
+                            producer_overlap=producer_overlap,
+                            year_match=year_match,
+                            producer_similarity=producer_similarity,
+                        )
+
+            ranked = sorted(candidates_by_url.values(), key=lambda c: c.score, reverse=True)
+            best = ranked[0] if ranked else None
+            second = ranked[1] if len(ranked) > 1 else None
+
+            best_score = best.score if best else 0.0
+            second_score = second.score if second else 0.0
+            margin = best_score - second_score
+
+            if args.provider == "none":
+                decision = "no_provider"
+                reason = "provider=none; generated deterministic queries only"
+            elif best is None:
+                decision = "unmatched"
+                reason = "no viable vivino candidates returned"
+            elif args.auto_accept_best:
+                decision = "auto_accept"
+                reason = (
+                    f"auto_accept_best enabled; score={best.score:.3f}, margin={margin:.3f}, "
+                    f"producer_overlap={best.producer_overlap}"
+                )
+            elif best.producer_overlap == 0:
                 decision = "needs_review"
-                reason = f"{reason}; missing vivino rating/count for auto-apply"
-
-        query_1 = queries[0] if len(queries) > 0 else ""
-        query_2 = queries[1] if len(queries) > 1 else ""
-        query_3 = queries[2] if len(queries) > 2 else ""
-
-        review_rows.append(
-            {
-                "wine_name": identity.wine_name,
-                "year": str(identity.year or ""),
-                "producer": identity.producer,
-                "label": identity.label,
-                "color": identity.color,
-                "query_1": query_1,
-                "query_2": query_2,
-                "query_3": query_3,
-                "vivino_search_url": vivino_search_url,
-                "candidate_count": str(len(ranked)),
-                "best_score": f"{best_score:.4f}" if best else "",
-                "second_score": f"{second_score:.4f}" if second else "",
-                "best_title": best.title if best else "",
-                "best_url": best.url if best else "",
-                "best_provider": best.provider if best else "",
-                "best_query": best.query if best else "",
-                "decision": decision,
-                "reason": reason,
-            }
-        )
-
-        if decision == "auto_accept" and best is not None:
-            existing_rating = (existing_match_row.get("vivino_rating") or "").strip()
-            existing_count = (
-                (existing_match_row.get("vivino_num_ratings") or "").strip()
-                or (existing_match_row.get("vivino_raters") or "").strip()
-            )
-            existing_price = (existing_match_row.get("vivino_price") or "").strip()
-            existing_name = (existing_match_row.get("wine_name") or "").strip()
-
-            accepted_rows.append(
-                {
-                    "match_name": identity.wine_name,
-                    "wine_name": existing_name or best.title,
-                    "vivino_rating": existing_rating,
-                    "vivino_num_ratings": existing_count,
-                    "vivino_price": existing_price,
-                    "vivino_url": best.url,
-                    "notes": (
-                        f"auto_resolved provider={best.provider or args.provider} "
-                        f"score={best.score:.3f} margin={margin:.3f}"
-                    ),
-                }
-            )
-        else:
-            unmatched_rows.append(
+                reason = "top candidate missing producer token overlap"
+            elif best.score >= args.min_confidence and margin >= args.min_margin:
+                decision = "auto_accept"
+                reason = f"score={best.score:.3f}, margin={margin:.3f}"
+            elif best.score >= review_threshold:
+                decision = "needs_review"
+                reason = f"score={best.score:.3f}, margin={margin:.3f}"
+            else:
+                decision = "unmatched"
+                reason = f"score below threshold ({best.score:.3f} < {review_threshold:.3f})"
+
+            if search_errors:
+                reason = f"{reason}; search_error={search_errors[0]}"
+
+            if decision == "auto_accept" and best is not None:
+                existing_rating_for_accept = _gs(existing_match_row, "vivino_rating")
+                existing_count_for_accept = (
+                    _gs(existing_match_row, "vivino_num_ratings")
+                    or _gs(existing_match_row, "vivino_raters")
+                )
+                if (
+                    args.require_vivino_metrics
+                    and not existing_rating_for_accept
+                    and not existing_count_for_accept
+                ):
+                    decision = "needs_review"
+                    reason = f"{reason}; missing vivino rating/count for auto-apply"
+
+            query_1 = queries[0] if len(queries) > 0 else ""
+            query_2 = queries[1] if len(queries) > 1 else ""
+            query_3 = queries[2] if len(queries) > 2 else ""
+
+            review_count += 1
+            review_writer.writerow(
                 {
                     "wine_name": identity.wine_name,
                     "year": str(identity.year or ""),
                     "producer": identity.producer,
                     "label": identity.label,
-                    "platinum_url": (row.get("url_plat") or "").strip(),
-                    "grand_cru_url": (row.get("url_main") or "").strip(),
+                    "color": identity.color,
                     "query_1": query_1,
                     "query_2": query_2,
                     "query_3": query_3,
                     "vivino_search_url": vivino_search_url,
+                    "candidate_count": str(len(ranked)),
                     "best_score": f"{best_score:.4f}" if best else "",
+                    "second_score": f"{second_score:.4f}" if second else "",
+                    "best_title": best.title if best else "",
                     "best_url": best.url if best else "",
                     "best_provider": best.provider if best else "",
+                    "best_query": best.query if best else "",
+                    "best_producer_similarity": f"{best.producer_similarity:.4f}" if best else "",
                     "decision": decision,
                     "reason": reason,
+                    "search_trace": _json_dumps(search_trace),
                 }
             )
 
-        print(
-            f"[resolve] {index}/{len(unresolved_rows)}",
-            identity.wine_name,
-            f"-> {decision}",
-            f"best={best_score:.3f}",
-            f"candidates={len(ranked)}",
-        )
+            if decision == "auto_accept" and best is not None:
+                existing_rating = _gs(existing_match_row, "vivino_rating")
+                existing_count = (
+                    _gs(existing_match_row, "vivino_num_ratings")
+                    or _gs(existing_match_row, "vivino_raters")
+                )
+                existing_price = _gs(existing_match_row, "vivino_price")
+                existing_name = _gs(existing_match_row, "wine_name")
 
-    write_csv_rows(args.output_review, review_rows, _REVIEW_FIELDS)
-    write_csv_rows(args.output_unmatched, unmatched_rows, _UNMATCHED_FIELDS)
-    write_csv_rows(args.output_suggestions, accepted_rows, OVERRIDE_FIELDS)
+                accepted_row = {
+                    "match_name": identity.wine_name,
+                    "wine_name": existing_name or best.title,
+                    "vivino_rating": existing_rating,
+                    "vivino_num_ratings": existing_count,
+                    "vivino_price": existing_price,
+                    "vivino_url": best.url,
+                    "notes": (
+                        f"auto_resolved provider={best.provider or args.provider} "
+                        f"score={best.score:.3f} margin={margin:.3f}"
+                    ),
+                }
+                accepted_rows.append(accepted_row)
+                suggestions_writer.writerow(accepted_row)
+            else:
+                unmatched_count += 1
+                unmatched_writer.writerow(
+                    {
+                        "wine_name": identity.wine_name,
+                        "year": str(identity.year or ""),
+                        "producer": identity.producer,
+                        "label": identity.label,
+                        "platinum_url": _gs(row, "url_plat"),
+                        "grand_cru_url": _gs(row, "url_main"),
+                        "query_1": query_1,
+                        "query_2": query_2,
+                        "query_3": query_3,
+                        "vivino_search_url": vivino_search_url,
+                        "best_score": f"{best_score:.4f}" if best else "",
+                        "best_url": best.url if best else "",
+                        "best_provider": best.provider if best else "",
+                        "decision": decision,
+                        "reason": reason,
+                    }
+                )
+
+            print(
+                f"[resolve] {index}/{len(unresolved_rows)}",
+                identity.wine_name,
+                f"-> {decision}",
+                f"best={best_score:.3f}",
+                f"candidates={len(ranked)}",
+            )
+
+            newly_seen[row_fingerprint] = int(time.time())
+            pending_seen.append(row_fingerprint)
+
+            if index % _STREAM_FLUSH_EVERY == 0:
+                for handle in stream_handles:
+                    handle.flush()
+                if args.auto_apply and len(accepted_rows) > applied_accepted:
+                    override_rows = upsert_overrides(override_rows, accepted_rows[applied_accepted:])
+                    write_csv_rows(args.vivino_overrides, override_rows, OVERRIDE_FIELDS)
+                    applied_accepted = len(accepted_rows)
+                for fingerprint in pending_seen:
+                    append_state_log(state_log, fingerprint, newly_seen[fingerprint])
+                state_log.flush()
+                pending_seen.clear()
+
+    if search_pool is not None:
+        search_pool.shutdown()
+    seen_unresolved.update(newly_seen)
 
     applied_overrides_rows = len(override_rows)
     if args.auto_apply and accepted_rows:
-        merged = upsert_overrides(override_rows, accepted_rows)
-        write_csv_rows(args.vivino_overrides, merged, OVERRIDE_FIELDS)
-        applied_overrides_rows = len(merged)
+        override_rows = upsert_overrides(override_rows, accepted_rows[applied_accepted:])
+        write_csv_rows(args.vivino_overrides, override_rows, OVERRIDE_FIELDS)
+        applied_overrides_rows = len(override_rows)
 
-    save_query_cache(args.query_cache, query_cache)
+    query_cache.close()
     state["last_run_at"] = int(time.time())
     save_state(args.state_file, state)
 
     print(
         "[resolve] summary:",
-        f"review_rows={len(review_rows)}",
+        f"review_rows={review_count}",
         f"auto_accepted={len(accepted_rows)}",
-        f"unmatched_or_review={len(unmatched_rows)}",
+        f"unmatched_or_review={unmatched_count}",
         f"overrides_rows={applied_overrides_rows}",
         f"api_calls={api_calls_state['count']}",
         f"cache_hits={cache_hits}",
         f"providers={provider_usage}",
+        f"disabled_providers={provider_state.disabled}",
         f"review_output={args.output_review}",
         f"unmatched_output={args.output_unmatched}",
         f"suggestions_output={args.output_suggestions}",
-        f"cache_path={args.query_cache}",
+        f"cache_path={query_cache.path}",
         f"state_path={args.state_file}",
     )
 
@@ -956,8 +1534,8 @@ def main() -> None:
     parser.add_argument(
         "--query-cache",
         type=Path,
-        default=Path("data/vivino_query_cache.json"),
-        help="Local JSON cache for provider query results.",
+        default=Path("data/vivino_query_cache.sqlite3"),
+        help="Local SQLite cache for provider query results (a legacy .json cache is imported once).",
     )
     parser.add_argument(
         "--cache-ttl-hours",
@@ -984,7 +1562,49 @@ def main() -> None:
         help="Persistent state for delta-only unresolved processing.",
     )
     parser.add_argument("--max-results", type=int, default=8)
-    parser.add_argument("--sleep-seconds", type=float, default=1.2)
+    parser.add_argument(
+        "--sleep-seconds",
+        type=float,
+        default=1.2,
+        help=(
+            "Pause after each search query; applies per worker when --search-workers > 1. "
+            "Ignored when any --rate-per-minute-* limit is set."
+        ),
+    )
+    for provider in ("google-cse", "brave", "serper"):
+        parser.add_argument(
+            f"--rate-per-minute-{provider}",
+            type=float,
+            default=0.0,
+            help=f"Pace live {provider} calls with a token bucket at this rate (0 = unlimited).",
+        )
+    parser.add_argument(
+        "--search-workers",
+        type=int,
+        default=1,
+        help="Fetch a row's search queries concurrently with this many workers (default 1 = sequential).",
+    )
+    parser.add_argument(
+        "--prefetch-rows",
+        type=int,
+        default=2,
+        help="Fetch search results for up to this many upcoming rows while the current row is scored (0 = off).",
+    )
+    parser.add_argument(
+        "--row-workers",
+        type=int,
+        default=1,
+        help=(
+            "Fetch search results for this many rows concurrently (default 1). Rows are still scored "
+            "and written in input order; pair with --rate-per-minute-* to stay within provider quotas."
+        ),
+    )
+    parser.add_argument(
+        "--serper-batch",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="With --provider serper, send each row's queries as one batch request (default: true).",
+    )
     parser.add_argument("--min-confidence", type=float, default=0.82)
     parser.add_argument("--min-margin", type=float, default=0.08)
     parser.add_argument(
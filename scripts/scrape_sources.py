@@ -6,23 +6,43 @@ This refactor replaces notebook-only scraping with a reusable script:
 """
 
 import argparse
+import atexit
 import csv
+import hashlib
+import html
 import json
 import os
 import re
+import sys
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TextIO
+from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin
-from urllib.request import Request, urlopen
 
 from selenium import webdriver
-from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
+try:
+    import orjson
+except ImportError:  # optional: faster parse of products.json pages and cache entries
+    orjson = None
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from scripts.http_pool import ConnectionPool, RequestError  # noqa: E402
+
 
 GRANDCRU_NAME_SELECTORS = [
     "a.boost-pfs-filter-product-item-title",
@@ -36,6 +56,22 @@ GRANDCRU_PRICE_SELECTORS = [
     "span.price-item--regular",
 ]
 
+GRANDCRU_CSV_FIELDS = ["name", "price", "url", "in_stock"]
+PLATINUM_CSV_FIELDS = [
+    "name",
+    "price",
+    "url",
+    "in_stock",
+    "platinum_vivino_rating",
+    "platinum_vivino_num_ratings",
+    "platinum_vivino_url",
+]
+
+PLATINUM_CARD_SELECTORS = [
+    "div.card.col-6",
+    "div.card",
+    "article",
+]
 PLATINUM_NAME_SELECTORS = [
     "a.title",
     "a[href*='/wines/']",
@@ -58,23 +94,161 @@ PLATINUM_VIVINO_HINT_SELECTORS = [
     "[data-vivino]",
 ]
 
-_VIVINO_URL_RE = re.compile(r"https?://[^\s\"'<>()]*vivino\.com[^\s\"'<>()]*", re.IGNORECASE)
+# Vivino URLs are found from the literal domain outward instead of trying a
+# URL match at every "http": each hit is extended back to its scheme and
+# forward to the end of the URL, so the scan stays linear in the markup.
+_VIVINO_DOMAIN_RE = re.compile(r"vivino\.com", re.IGNORECASE)
+_URL_SCHEME_RE = re.compile(r"https?://", re.IGNORECASE)
+_URL_TAIL_RE = re.compile(r"[^\s\"'<>()]*")
+_URL_HEAD_STOP_RE = re.compile(r".*[\s\"'<>()]", re.DOTALL)
+_URL_MAX_PREFIX_CHARS = 2048
+# Rating patterns are tried in order: the "vivino 4.2" form wins over a bare
+# "4.2 rating" anywhere in the card, so they are not folded into one regex.
 _VIVINO_RATING_RE = [
     re.compile(r"vivino[^0-9]{0,24}([0-5](?:\.\d+)?)", re.IGNORECASE),
     re.compile(r"([0-5](?:\.\d+)?)\s*(?:/5)?\s*(?:vivino|rating)", re.IGNORECASE),
 ]
-_VIVINO_COUNT_RE = [
-    re.compile(r"([\d,]+(?:\.\d+)?\s*[kKmM]?)\s*(?:ratings?|reviews?)", re.IGNORECASE),
-]
+_VIVINO_COUNT_RE = re.compile(r"([\d,]+(?:\.\d+)?\s*[kKmM]?)\s*(?:ratings?|reviews?)", re.IGNORECASE)
+_VIVINO_MENTION_RE = re.compile("vivino", re.IGNORECASE)
+_OOS_TEXT_RE = re.compile("out of stock|sold out", re.IGNORECASE)
+
+# Reads every field the card parsers need in one WebDriver call per page;
+# per-element find_element/get_attribute/.text calls are each a round-trip.
+_PLATINUM_CARDS_JS = """
+const [cardSelectors, nameSelectors, priceSelectors, linkSelectors, hintSelectors] = arguments;
+const textOf = (element) => (element.innerText || "").trim();
+const hrefOf = (element) => (element.href || element.getAttribute("href") || "").trim();
+let cards = [];
+for (const selector of cardSelectors) {
+    cards = Array.from(document.querySelectorAll(selector));
+    if (cards.length) break;
+}
+return cards.map((card) => {
+    const link = nameSelectors.map((selector) => card.querySelector(selector)).find(Boolean) || null;
+    let price = "";
+    for (const selector of priceSelectors) {
+        const element = card.querySelector(selector);
+        if (element && textOf(element)) {
+            price = textOf(element);
+            break;
+        }
+    }
+    const html = card.innerHTML || "";
+    const hints = [];
+    for (const selector of hintSelectors) {
+        for (const element of card.querySelectorAll(selector)) {
+            hints.push({
+                text: textOf(element),
+                rating: (element.getAttribute("data-vivino-rating") || "").trim(),
+                count: (element.getAttribute("data-vivino-num-ratings") || "").trim(),
+            });
+        }
+    }
+    return {
+        name: link ? textOf(link) : "",
+        href: link ? hrefOf(link) : "",
+        price: price,
+        text: card.innerText || "",
+        // Only cards that mention Vivino need their markup in Python; skip
+        // serializing the rest back over the WebDriver connection.
+        html: /vivino/i.test(html) ? html : "",
+        badges: Array.from(card.querySelectorAll("span.oos, .oos, .badge, [class*='oos']"), textOf),
+        has_add_to_cart: Boolean(
+            card.querySelector("a.btn-add-to-cart, button.btn-add-to-cart, [onclick*='addToCart']")
+        ),
+        vivino_links: linkSelectors.flatMap((selector) => Array.from(card.querySelectorAll(selector), hrefOf)),
+        hints: hints,
+    };
+});
+"""
+
+_NEXT_PAGE_JS = """
+const button = document.querySelector("li.ais-Pagination-item--nextPage a");
+if (!button) return null;
+const parentClass = (button.parentElement.getAttribute("class") || "").toLowerCase();
+return parentClass.includes("disabled") ? null : button;
+"""
+
 _PLATINUM_DETAIL_RATING_RE = re.compile(r"([0-5](?:\.\d+)?)\s*/\s*5\s*Stars\s*-\s*Vivino", re.IGNORECASE)
+_HTML_SKIPPED_BLOCK_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# products.json pages and detail pages hit the same one or two hosts, so keep
+# their connections alive between requests instead of a new TCP + TLS
+# handshake per page (urlopen closes after every response).
+_HTTP_TIMEOUT_SECONDS = 30
+_HTTP_POOL_MAXSIZE = 8
+_HTTP_MAX_REDIRECTS = 5
+_HTTP_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+_HTTP_HEADERS = {"User-Agent": "Mozilla/5.0"}
+_HTTP_POOL = ConnectionPool(maxsize=_HTTP_POOL_MAXSIZE, timeout=_HTTP_TIMEOUT_SECONDS)
 
 
 @dataclass
 class ScrapeResult:
-    rows: list[dict[str, str]]
+    rows_written: int
     pages_scraped: int
 
 
+@dataclass
+class CsvRowStream:
+    writer: csv.DictWriter
+    handle: TextIO
+    rows_written: int = 0
+
+    def write_rows(self, rows: list[dict[str, str]]) -> None:
+        self.writer.writerows(rows)
+        self.handle.flush()
+        self.rows_written += len(rows)
+
+
+def _json_loads(data: bytes | str) -> object:
+    # orjson.JSONDecodeError subclasses ValueError, like json.JSONDecodeError.
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(value: object, *, indent: bool = False) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, indent=2 if indent else None)
+
+
+@dataclass
+class ScrapeCache:
+    """On-disk cache of fetched response bodies, one JSON file per URL."""
+
+    directory: Path
+    ttl_hours: float
+
+    def _entry_path(self, url: str) -> Path:
+        return self.directory / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> str | None:
+        try:
+            entry = _json_loads(self._entry_path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+        fetched_at = entry.get("fetched_at")
+        if not isinstance(fetched_at, (int, float)) or time.time() - fetched_at > self.ttl_hours * 3600:
+            return None
+        payload = entry.get("payload")
+        return payload if isinstance(payload, str) else None
+
+    def put(self, url: str, payload: str) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(url)
+        # Pages are fetched from worker threads; write aside and rename so a
+        # reader never sees a half-written entry.
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(
+            _json_dumps({"url": url, "fetched_at": time.time(), "payload": payload}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, path)
+
+
 def make_driver(*, headless: bool, page_load_timeout: int) -> webdriver.Chrome:
     options = webdriver.ChromeOptions()
     chrome_bin = os.getenv("CHROME_BIN", "").strip()
@@ -91,77 +265,73 @@ def make_driver(*, headless: bool, page_load_timeout: int) -> webdriver.Chrome:
     return driver
 
 
-def find_first_element(root, selectors: list[str]):
-    for selector in selectors:
-        try:
-            return root.find_element(By.CSS_SELECTOR, selector)
-        except NoSuchElementException:
-            continue
-    return None
-
-
-def first_non_empty_text(root, selectors: list[str]) -> str:
-    for selector in selectors:
-        try:
-            element = root.find_element(By.CSS_SELECTOR, selector)
-            text = (element.text or "").strip()
-            if text:
-                return text
-        except NoSuchElementException:
-            continue
-    return "N/A"
+_COMPACT_COUNT_MULTIPLIERS = {"k": 1_000, "K": 1_000, "m": 1_000_000, "M": 1_000_000}
 
 
 def _parse_compact_count(value: str) -> int | None:
-    raw = (value or "").strip().replace(",", "")
+    raw = value.strip().replace(",", "") if value else ""
     if not raw:
         return None
+    multiplier = _COMPACT_COUNT_MULTIPLIERS.get(raw[-1], 1)
     try:
-        if raw[-1] in {"k", "K"}:
-            return int(float(raw[:-1]) * 1000)
-        if raw[-1] in {"m", "M"}:
-            return int(float(raw[:-1]) * 1_000_000)
-        return int(float(raw))
+        return int(float(raw[:-1] if multiplier != 1 else raw) * multiplier)
     except ValueError:
         return None
 
 
-def extract_platinum_vivino_fields(card) -> dict[str, str]:
+_PLATINUM_CARDS_JS_ARGS = (
+    PLATINUM_CARD_SELECTORS,
+    PLATINUM_NAME_SELECTORS,
+    PLATINUM_PRICE_SELECTORS,
+    PLATINUM_VIVINO_LINK_SELECTORS,
+    PLATINUM_VIVINO_HINT_SELECTORS,
+)
+
+
+def read_platinum_cards(driver: webdriver.Chrome) -> list[dict]:
+    return driver.execute_script(_PLATINUM_CARDS_JS, *_PLATINUM_CARDS_JS_ARGS) or []
+
+
+def _find_vivino_url(markup: str) -> str:
+    for domain in _VIVINO_DOMAIN_RE.finditer(markup):
+        start = domain.start()
+        window_start = max(0, start - _URL_MAX_PREFIX_CHARS)
+        head_stop = _URL_HEAD_STOP_RE.match(markup, window_start, start)
+        run_start = head_stop.end() if head_stop else window_start
+        scheme = _URL_SCHEME_RE.search(markup, run_start, start)
+        if scheme:
+            return markup[scheme.start() : _URL_TAIL_RE.match(markup, domain.end()).end()]
+    return ""
+
+
+def extract_platinum_vivino_fields(card: dict) -> dict[str, str]:
     vivino_url = ""
-    for selector in PLATINUM_VIVINO_LINK_SELECTORS:
-        elements = card.find_elements(By.CSS_SELECTOR, selector)
-        for element in elements:
-            href = (element.get_attribute("href") or "").strip()
-            if href and "vivino.com" in href.lower():
-                vivino_url = href
-                break
-        if vivino_url:
+    for href in card.get("vivino_links") or []:
+        if href and "vivino.com" in href.lower():
+            vivino_url = href
             break
 
-    html = (card.get_attribute("innerHTML") or "").strip()
-    if not vivino_url:
-        url_match = _VIVINO_URL_RE.search(html)
-        if url_match:
-            vivino_url = url_match.group(0).strip()
+    # Every Vivino URL contains "vivino", so one literal scan of the (large)
+    # innerHTML decides both the mention check and whether to look for a URL.
+    html = (card.get("html") or "").strip()
+    html_mentions_vivino = _VIVINO_MENTION_RE.search(html) is not None
+    if not vivino_url and html_mentions_vivino:
+        vivino_url = _find_vivino_url(html).strip()
 
     hint_text_parts: list[str] = []
-    for selector in PLATINUM_VIVINO_HINT_SELECTORS:
-        for element in card.find_elements(By.CSS_SELECTOR, selector):
-            text = (element.text or "").strip()
-            if text:
-                hint_text_parts.append(text)
-            data_rating = (element.get_attribute("data-vivino-rating") or "").strip()
-            if data_rating:
-                hint_text_parts.append(f"vivino {data_rating}")
-            data_count = (element.get_attribute("data-vivino-num-ratings") or "").strip()
-            if data_count:
-                hint_text_parts.append(f"{data_count} ratings")
-
-    card_text = " ".join((card.text or "").split())
+    for hint in card.get("hints") or []:
+        if hint.get("text"):
+            hint_text_parts.append(hint["text"])
+        if hint.get("rating"):
+            hint_text_parts.append(f"vivino {hint['rating']}")
+        if hint.get("count"):
+            hint_text_parts.append(f"{hint['count']} ratings")
+
+    card_text = " ".join((card.get("text") or "").split())
     context = " ".join(hint_text_parts + [card_text])
 
     # Only attempt numeric extraction when Vivino appears on-card in some form.
-    has_vivino_context = "vivino" in context.lower() or "vivino" in html.lower() or bool(vivino_url)
+    has_vivino_context = bool(vivino_url) or html_mentions_vivino or _VIVINO_MENTION_RE.search(context) is not None
     if not has_vivino_context:
         return {
             "platinum_vivino_rating": "",
@@ -183,15 +353,11 @@ def extract_platinum_vivino_fields(card) -> dict[str, str]:
             break
 
     num_ratings = ""
-    for pattern in _VIVINO_COUNT_RE:
-        match = pattern.search(context)
-        if not match:
-            continue
+    match = _VIVINO_COUNT_RE.search(context)
+    if match:
         parsed = _parse_compact_count(match.group(1))
-        if parsed is None:
-            continue
-        num_ratings = str(parsed)
-        break
+        if parsed is not None:
+            num_ratings = str(parsed)
 
     return {
         "platinum_vivino_rating": rating,
@@ -222,23 +388,89 @@ def extract_platinum_detail_rating(driver: webdriver.Chrome, url: str, pause_sec
     return rating
 
 
-def write_csv(path: Path, rows: list[dict[str, str]]) -> None:
+def close_http_pool() -> None:
+    _HTTP_POOL.close()
+
+
+atexit.register(close_http_pool)
+
+
+def _http_get(url: str) -> str:
+    # Errors surface as HTTPError/URLError like urlopen, and redirects are
+    # followed; a pooled connection the server dropped is handled by the pool.
+    for _ in range(_HTTP_MAX_REDIRECTS + 1):
+        try:
+            response, body = _HTTP_POOL.request("GET", url, headers=_HTTP_HEADERS)
+        except RequestError as exc:
+            raise URLError(exc) from exc
+        location = response.headers.get("Location")
+        if response.status in _HTTP_REDIRECT_STATUSES and location:
+            url = urljoin(url, location)
+            continue
+        if response.status >= 400:
+            raise HTTPError(url, response.status, response.reason, response.headers, None)
+        charset = response.headers.get_content_charset() or "utf-8"
+        return body.decode(charset, errors="replace")
+    raise URLError(f"too many redirects for {url}")
+
+
+def _fetch_text(url: str, cache: ScrapeCache | None = None) -> str:
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            return cached
+    payload = _http_get(url)
+    if cache is not None:
+        cache.put(url, payload)
+    return payload
+
+
+def _html_to_text(markup: str) -> str:
+    text = _HTML_TAG_RE.sub(" ", _HTML_SKIPPED_BLOCK_RE.sub(" ", markup))
+    return " ".join(html.unescape(text).split())
+
+
+def fetch_platinum_detail_rating(url: str, cache: ScrapeCache | None = None) -> str | None:
+    # "" means the page was read and has no Vivino rating. None means the
+    # browser should look instead: the fetch failed, or the served HTML has
+    # no visible text at all and is presumably rendered client-side.
+    try:
+        page_text = _html_to_text(_fetch_text(url, cache))
+    except (HTTPError, URLError):
+        return None
+    match = _PLATINUM_DETAIL_RATING_RE.search(page_text)
+    if match:
+        return match.group(1)
+    return "" if page_text.strip() else None
+
+
+def fetch_platinum_detail_ratings(
+    urls: list[str],
+    *,
+    workers: int,
+    cache: ScrapeCache | None = None,
+) -> dict[str, str | None]:
+    # The detail rating is normally in the served HTML, so fetch the pages
+    # concurrently over HTTP instead of opening a browser tab per product.
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return dict(zip(urls, pool.map(lambda url: fetch_platinum_detail_rating(url, cache), urls)))
+
+
+@contextmanager
+def open_csv_stream(path: Path, fieldnames: list[str]) -> Iterator[CsvRowStream]:
+    # Rows land in a .partial file as each page is scraped, so a crash keeps
+    # the work done so far without clobbering the last complete CSV.
     path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = ["name", "price", "url"]
-    optional_fields = [
-        "in_stock",
-        "platinum_vivino_rating",
-        "platinum_vivino_num_ratings",
-        "platinum_vivino_url",
-    ]
-    for field in optional_fields:
-        if any(field in row for row in rows):
-            fieldnames.append(field)
-    with path.open("w", newline="", encoding="utf-8") as handle:
+    partial_path = path.with_name(f"{path.name}.partial")
+    # Pages are written with writerows() and flushed once each, so a large
+    # buffer turns a page into a few write() calls.
+    with partial_path.open("w", newline="", encoding="utf-8", buffering=1 << 20) as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        yield CsvRowStream(writer=writer, handle=handle)
+    os.replace(partial_path, path)
 
 
 def save_page_html(driver: webdriver.Chrome, debug_dir: Path | None, source: str, page: int) -> None:
@@ -249,11 +481,46 @@ def save_page_html(driver: webdriver.Chrome, debug_dir: Path | None, source: str
     filename.write_text(driver.page_source, encoding="utf-8")
 
 
-def _fetch_json(url: str) -> dict:
-    request = Request(url, headers={"User-Agent": "Mozilla/5.0"})
-    with urlopen(request, timeout=30) as response:
-        payload = response.read().decode("utf-8")
-    return json.loads(payload)
+def _fetch_json(url: str, cache: ScrapeCache | None = None) -> dict:
+    return _json_loads(_fetch_text(url, cache))
+
+
+def grandcru_product_rows(products: list[dict], base: str) -> list[dict[str, str]]:
+    rows: list[dict[str, str]] = []
+    for product in products:
+        name = (product.get("title") or "").strip()
+        handle = (product.get("handle") or "").strip()
+        if not name or not handle:
+            continue
+
+        variants = product.get("variants") or []
+        available_variants = [variant for variant in variants if variant.get("available")]
+        in_stock = bool(available_variants)
+        price_variant = available_variants[0] if available_variants else (variants[0] if variants else {})
+        rows.append(
+            {
+                "name": name,
+                "price": str(price_variant.get("price") or "N/A"),
+                "url": f"{base}/products/{handle}",
+                "in_stock": "true" if in_stock else "false",
+            }
+        )
+    return rows
+
+
+def _fetch_grandcru_page(url: str, base: str, cache: ScrapeCache | None) -> tuple[int, list[dict[str, str]]]:
+    products = _fetch_json(url, cache).get("products") or []
+    return len(products), grandcru_product_rows(products, base)
+
+
+def _unseen_rows(rows: list[dict[str, str]], seen_names: set[str]) -> list[dict[str, str]]:
+    fresh: list[dict[str, str]] = []
+    for row in rows:
+        key = row["name"].casefold()
+        if key not in seen_names:
+            seen_names.add(key)
+            fresh.append(row)
+    return fresh
 
 
 def scrape_grandcru(
@@ -263,76 +530,71 @@ def scrape_grandcru(
     max_pages: int | None,
     sleep_seconds: float,
     debug_dir: Path | None,
+    out: CsvRowStream,
+    page_workers: int = 4,
+    cache: ScrapeCache | None = None,
 ) -> ScrapeResult:
     # NOTE: Grand Cru catalog pages changed frequently. Shopify's products.json endpoint
     # is significantly more stable than DOM selectors and captures full catalog pages.
     _ = driver
     _ = debug_dir
 
-    rows: list[dict[str, str]] = []
     seen_names: set[str] = set()
     page = 1
     pages_scraped = 0
 
     base = base_url.rstrip("/")
     limit = 250
+    page_workers = max(1, page_workers)
+
+    # products.json pages are stateless, so fetch and parse a batch of pages
+    # at once and dedup them in page order; the batch past the last page costs
+    # a few empty responses instead of a sleep between every page.
+    finished = False
+    with ThreadPoolExecutor(max_workers=page_workers) as pool:
+        while not finished:
+            last_page = page + page_workers - 1
+            if max_pages is not None:
+                last_page = min(last_page, max_pages)
+            if last_page < page:
+                break
 
-    while True:
-        if max_pages is not None and page > max_pages:
-            break
-
-        url = f"{base}/products.json?limit={limit}&page={page}"
-        print(f"[grandcru] page {page}: {url}")
-
-        try:
-            payload = _fetch_json(url)
-        except Exception as exc:
-            print(f"[grandcru] products.json fetch error on page {page}: {exc}")
-            break
-
-        products = payload.get("products") or []
-        if not products:
-            print(f"[grandcru] no products on page {page}; stopping.")
-            break
-
-        page_new_rows = 0
-        for product in products:
-            name = (product.get("title") or "").strip()
-            handle = (product.get("handle") or "").strip()
-            if not name or not handle:
-                continue
-
-            variants = product.get("variants") or []
-            available_variants = [variant for variant in variants if variant.get("available")]
-            in_stock = bool(available_variants)
-            price_variant = available_variants[0] if available_variants else (variants[0] if variants else {})
-            price = str(price_variant.get("price") or "N/A")
-
-            key = name.lower()
-            if key in seen_names:
-                continue
-
-            seen_names.add(key)
-            rows.append(
-                {
-                    "name": name,
-                    "price": price,
-                    "url": f"{base}/products/{handle}",
-                    "in_stock": "true" if in_stock else "false",
-                }
-            )
-            page_new_rows += 1
-
-        print(f"[grandcru] captured {page_new_rows} new rows on page {page}.")
-        pages_scraped += 1
-
-        if len(products) < limit:
-            break
+            futures = []
+            for number in range(page, last_page + 1):
+                url = f"{base}/products.json?limit={limit}&page={number}"
+                futures.append((number, url, pool.submit(_fetch_grandcru_page, url, base, cache)))
+            for number, url, future in futures:
+                print(f"[grandcru] page {number}: {url}")
+                try:
+                    product_count, fetched_rows = future.result()
+                except Exception as exc:
+                    print(f"[grandcru] products.json fetch error on page {number}: {exc}")
+                    finished = True
+                    break
+
+                if not product_count:
+                    print(f"[grandcru] no products on page {number}; stopping.")
+                    finished = True
+                    break
+
+                page_rows = _unseen_rows(fetched_rows, seen_names)
+                out.write_rows(page_rows)
+                print(f"[grandcru] captured {len(page_rows)} new rows on page {number}.")
+                pages_scraped += 1
+
+                if product_count < limit:
+                    finished = True
+                    break
+
+            if finished:
+                for _, _, future in futures:
+                    future.cancel()
+                break
 
-        page += 1
-        time.sleep(max(sleep_seconds, 0.3))
+            page = last_page + 1
+            time.sleep(max(sleep_seconds, 0.3))
 
-    return ScrapeResult(rows=rows, pages_scraped=pages_scraped)
+    return ScrapeResult(rows_written=out.rows_written, pages_scraped=pages_scraped)
 
 
 def click_in_stock_filter(driver: webdriver.Chrome, wait: WebDriverWait) -> None:
@@ -358,14 +620,9 @@ def click_in_stock_filter(driver: webdriver.Chrome, wait: WebDriverWait) -> None
 
 
 def click_next_page(driver: webdriver.Chrome) -> bool:
-    candidates = driver.find_elements(By.CSS_SELECTOR, "li.ais-Pagination-item--nextPage a")
-    if not candidates:
-        return False
-
-    next_button = candidates[0]
-    parent = next_button.find_element(By.XPATH, "./..")
-    parent_class = (parent.get_attribute("class") or "").lower()
-    if "disabled" in parent_class:
+    # Lookup and the disabled check in one WebDriver call instead of three.
+    next_button = driver.execute_script(_NEXT_PAGE_JS)
+    if next_button is None:
         return False
 
     try:
@@ -377,23 +634,45 @@ def click_next_page(driver: webdriver.Chrome) -> bool:
     return True
 
 
-def is_platinum_in_stock(card) -> bool:
-    oos_text_tokens = ("out of stock", "sold out")
-    oos_badges = card.find_elements(By.CSS_SELECTOR, "span.oos, .oos, .badge, [class*='oos']")
-    for badge in oos_badges:
-        text = (badge.text or "").strip().lower()
-        if any(token in text for token in oos_text_tokens):
+def is_platinum_in_stock(card: dict) -> bool:
+    for badge_text in card.get("badges") or []:
+        if _OOS_TEXT_RE.search(badge_text):
             return False
 
-    full_text = (card.text or "").strip().lower()
-    if any(token in full_text for token in oos_text_tokens):
+    if _OOS_TEXT_RE.search(card.get("text") or ""):
         return False
 
-    add_to_cart_buttons = card.find_elements(
-        By.CSS_SELECTOR,
-        "a.btn-add-to-cart, button.btn-add-to-cart, [onclick*='addToCart']",
+    return bool(card.get("has_add_to_cart"))
+
+
+def fill_platinum_detail_ratings(
+    driver: webdriver.Chrome,
+    rows: list[dict[str, str]],
+    *,
+    workers: int,
+    sleep_seconds: float,
+    cache: ScrapeCache | None = None,
+) -> None:
+    if not rows:
+        return
+    detail_urls = list(dict.fromkeys(row["url"] for row in rows))
+    fetched_ratings = fetch_platinum_detail_ratings(detail_urls, workers=workers, cache=cache)
+    browser_fallbacks = 0
+    for row in rows:
+        detail_rating = fetched_ratings.get(row["url"])
+        if detail_rating is None:
+            # The page could not be read, or needs JS to render the rating.
+            browser_fallbacks += 1
+            try:
+                detail_rating = extract_platinum_detail_rating(driver, row["url"], sleep_seconds)
+            except WebDriverException:
+                detail_rating = ""
+        if detail_rating:
+            row["platinum_vivino_rating"] = detail_rating
+    print(
+        f"[platinum] fetched {len(detail_urls)} detail pages for Vivino ratings; "
+        f"{browser_fallbacks} needed the browser fallback."
     )
-    return bool(add_to_cart_buttons)
 
 
 def scrape_platinum(
@@ -407,8 +686,10 @@ def scrape_platinum(
     include_oos: bool,
     detail_ratings: bool,
     detail_sleep_seconds: float,
+    out: CsvRowStream,
+    detail_workers: int = 8,
+    cache: ScrapeCache | None = None,
 ) -> ScrapeResult:
-    rows: list[dict[str, str]] = []
     seen_names: set[str] = set()
     pages_scraped = 0
 
@@ -436,16 +717,12 @@ def scrape_platinum(
 
         save_page_html(driver, debug_dir, "platinum", page)
 
-        cards = driver.find_elements(By.CSS_SELECTOR, "div.card.col-6")
-        if not cards:
-            cards = driver.find_elements(By.CSS_SELECTOR, "div.card")
-        if not cards:
-            cards = driver.find_elements(By.CSS_SELECTOR, "article")
+        cards = read_platinum_cards(driver)
         if not cards:
             print(f"[platinum] no cards found on page {page}; stopping.")
             break
 
-        page_new_rows = 0
+        card_rows: list[dict[str, str]] = []
         page_oos_skipped = 0
         for card in cards:
             in_stock = is_platinum_in_stock(card)
@@ -453,54 +730,39 @@ def scrape_platinum(
                 page_oos_skipped += 1
                 continue
 
-            link_element = find_first_element(card, PLATINUM_NAME_SELECTORS)
-            if link_element is None:
-                continue
-
-            name = (link_element.text or "").strip()
-            href = (link_element.get_attribute("href") or "").strip()
+            name = card.get("name") or ""
+            href = card.get("href") or ""
             if not name or not href:
                 continue
 
-            href = urljoin(base + "/", href)
-            price = first_non_empty_text(card, PLATINUM_PRICE_SELECTORS)
-            vivino_fields = extract_platinum_vivino_fields(card)
-            if detail_ratings and not vivino_fields.get("platinum_vivino_rating"):
-                try:
-                    detail_rating = extract_platinum_detail_rating(
-                        driver,
-                        href,
-                        detail_sleep_seconds,
-                    )
-                    if detail_rating:
-                        vivino_fields["platinum_vivino_rating"] = detail_rating
-                except WebDriverException:
-                    pass
-            key = name.lower()
-            if key in seen_names:
-                continue
-
-            seen_names.add(key)
             payload = {
                 "name": name,
-                "price": price,
-                "url": href,
+                "price": card.get("price") or "N/A",
+                "url": urljoin(base + "/", href),
                 "in_stock": "true" if in_stock else "false",
             }
-            if vivino_fields.get("platinum_vivino_rating"):
-                payload["platinum_vivino_rating"] = vivino_fields["platinum_vivino_rating"]
-            if vivino_fields.get("platinum_vivino_num_ratings"):
-                payload["platinum_vivino_num_ratings"] = vivino_fields["platinum_vivino_num_ratings"]
-            if vivino_fields.get("platinum_vivino_url"):
-                payload["platinum_vivino_url"] = vivino_fields["platinum_vivino_url"]
-            rows.append(payload)
-            page_new_rows += 1
+            vivino_fields = extract_platinum_vivino_fields(card)
+            for field in ("platinum_vivino_rating", "platinum_vivino_num_ratings", "platinum_vivino_url"):
+                if vivino_fields.get(field):
+                    payload[field] = vivino_fields[field]
+            card_rows.append(payload)
+        page_rows = _unseen_rows(card_rows, seen_names)
+
+        if detail_ratings:
+            fill_platinum_detail_ratings(
+                driver,
+                [row for row in page_rows if not row.get("platinum_vivino_rating")],
+                workers=detail_workers,
+                sleep_seconds=detail_sleep_seconds,
+                cache=cache,
+            )
+        out.write_rows(page_rows)
 
         if include_oos:
-            print(f"[platinum] captured {page_new_rows} new rows on page {page}.")
+            print(f"[platinum] captured {len(page_rows)} new rows on page {page}.")
         else:
             print(
-                f"[platinum] captured {page_new_rows} new rows on page {page}; "
+                f"[platinum] captured {len(page_rows)} new rows on page {page}; "
                 f"skipped {page_oos_skipped} out-of-stock cards."
             )
         pages_scraped += 1
@@ -510,7 +772,7 @@ def scrape_platinum(
         page += 1
         time.sleep(max(sleep_seconds, 1.5))
 
-    return ScrapeResult(rows=rows, pages_scraped=pages_scraped)
+    return ScrapeResult(rows_written=out.rows_written, pages_scraped=pages_scraped)
 
 
 def main() -> None:
@@ -546,59 +808,88 @@ def main() -> None:
         default=2.0,
         help="Pause after opening Platinum product detail page.",
     )
+    parser.add_argument(
+        "--grandcru-page-workers",
+        type=int,
+        default=4,
+        help="Grand Cru products.json pages fetched concurrently per batch.",
+    )
+    parser.add_argument(
+        "--platinum-detail-workers",
+        type=int,
+        default=8,
+        help="Concurrent HTTP fetches for Platinum detail pages (browser is only a fallback).",
+    )
+    parser.add_argument(
+        "--scrape-cache",
+        default=None,
+        help="If set, cache products.json and detail page responses in this directory (e.g. data/scrape_cache).",
+    )
+    parser.add_argument(
+        "--scrape-cache-ttl-hours",
+        type=float,
+        default=6.0,
+        help="Scrape cache freshness window in hours (default 6).",
+    )
     parser.add_argument("--headed", action="store_true", help="Run with browser UI visible")
     args = parser.parse_args()
 
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     debug_dir = Path(args.debug_dir) if args.debug_dir else None
-
-    driver = make_driver(headless=not args.headed, page_load_timeout=args.page_load_timeout)
-    try:
-        grandcru = scrape_grandcru(
-            driver,
-            base_url=args.grandcru_base_url,
-            max_pages=args.max_pages,
-            sleep_seconds=args.sleep_seconds,
-            debug_dir=debug_dir,
-        )
-        platinum = scrape_platinum(
-            driver,
-            base_url=args.platinum_base_url,
-            wines_path=args.platinum_wines_path,
-            max_pages=args.max_pages,
-            sleep_seconds=args.sleep_seconds,
-            debug_dir=debug_dir,
-            include_oos=args.include_oos,
-            detail_ratings=args.platinum_detail_ratings,
-            detail_sleep_seconds=args.platinum_detail_sleep_seconds,
-        )
-    finally:
-        driver.quit()
+    scrape_cache = ScrapeCache(Path(args.scrape_cache), args.scrape_cache_ttl_hours) if args.scrape_cache else None
 
     grandcru_path = output_dir / args.grandcru_csv
     platinum_path = output_dir / args.platinum_csv
     metadata_path = output_dir / args.metadata_json
 
-    write_csv(grandcru_path, grandcru.rows)
-    write_csv(platinum_path, platinum.rows)
+    driver = make_driver(headless=not args.headed, page_load_timeout=args.page_load_timeout)
+    try:
+        with open_csv_stream(grandcru_path, GRANDCRU_CSV_FIELDS) as grandcru_out:
+            grandcru = scrape_grandcru(
+                driver,
+                base_url=args.grandcru_base_url,
+                max_pages=args.max_pages,
+                sleep_seconds=args.sleep_seconds,
+                debug_dir=debug_dir,
+                out=grandcru_out,
+                page_workers=args.grandcru_page_workers,
+                cache=scrape_cache,
+            )
+        with open_csv_stream(platinum_path, PLATINUM_CSV_FIELDS) as platinum_out:
+            platinum = scrape_platinum(
+                driver,
+                base_url=args.platinum_base_url,
+                wines_path=args.platinum_wines_path,
+                max_pages=args.max_pages,
+                sleep_seconds=args.sleep_seconds,
+                debug_dir=debug_dir,
+                include_oos=args.include_oos,
+                detail_ratings=args.platinum_detail_ratings,
+                detail_sleep_seconds=args.platinum_detail_sleep_seconds,
+                out=platinum_out,
+                detail_workers=args.platinum_detail_workers,
+                cache=scrape_cache,
+            )
+    finally:
+        driver.quit()
 
     metadata = {
         "generated_at_utc": datetime.now(UTC).isoformat(),
         "grandcru_base_url": args.grandcru_base_url,
         "platinum_base_url": args.platinum_base_url,
         "platinum_wines_path": args.platinum_wines_path,
-        "grandcru_rows": len(grandcru.rows),
-        "platinum_rows": len(platinum.rows),
+        "grandcru_rows": grandcru.rows_written,
+        "platinum_rows": platinum.rows_written,
         "grandcru_pages_scraped": grandcru.pages_scraped,
         "platinum_pages_scraped": platinum.pages_scraped,
         "max_pages": args.max_pages,
         "include_oos": args.include_oos,
     }
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    metadata_path.write_text(_json_dumps(metadata, indent=True), encoding="utf-8")
 
-    print(f"[done] wrote {len(grandcru.rows)} rows to {grandcru_path}")
-    print(f"[done] wrote {len(platinum.rows)} rows to {platinum_path}")
+    print(f"[done] wrote {grandcru.rows_written} rows to {grandcru_path}")
+    print(f"[done] wrote {platinum.rows_written} rows to {platinum_path}")
     print(f"[done] wrote metadata to {metadata_path}")
 
 
@@ -1,17 +1,22 @@
 import argparse
 import csv
+import json
+import os
 import random
 import re
 import sys
 import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import parse_qs, quote_plus, urlparse
 
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -26,6 +31,9 @@ from scripts.import_wine_data import (  # noqa: E402
     parse_int,
 )
 
+# Search results repeat the same titles across queries, and every candidate is
+# scored against the same target; canonicalize_key is pure, so memoize it here.
+_canonical_key = lru_cache(maxsize=16384)(canonicalize_key)
 
 _OVERRIDE_FIELDS = [
     "match_name",
@@ -37,6 +45,55 @@ _OVERRIDE_FIELDS = [
     "notes",
 ]
 
+# Pages are read as soon as this content is present rather than after a fixed sleep.
+_SEARCH_RESULT_LOCATOR = (By.CSS_SELECTOR, "a[href*='/w/']")
+_WINE_METRICS_LOCATOR = (By.XPATH, "//*[contains(text(),'ratings') or contains(text(),'$')]")
+
+# Every result link's href and text in one WebDriver call instead of two
+# (or three, when innerText is empty) round-trips per anchor.
+_SEARCH_ANCHORS_JS = """
+return Array.from(document.querySelectorAll("a[href*='/w/']"), (a) => ({
+    href: a.href || a.getAttribute("href") || "",
+    text: (a.innerText || "").trim() || (a.textContent || "").trim(),
+}));
+"""
+
+# Title and the head of the rendered body text in one call; challenge pages are short.
+_BLOCK_PAGE_TEXT_JS = (
+    "return (document.title || '') + '\\n' + "
+    "(document.body ? document.body.innerText.slice(0, 2000) : '');"
+)
+_BODY_TEXT_JS = "return document.body ? document.body.innerText : '';"
+
+_PROFILE_DISK_CACHE_BYTES = 512 * 1024 * 1024
+_CACHE_FLUSH_EVERY = 10
+
+# Images, fonts, stylesheets, media and trackers are never read by this script.
+_BLOCKED_URL_PATTERNS = (
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.css",
+    "*.mp4",
+    "*/analytics/*",
+    "*googletagmanager*",
+)
+
+_BUNDLE_RE = re.compile(r"\(bundle of\s+\d+\)", re.IGNORECASE)
+_COLOR_RE = re.compile(r"\b(red|white|rose)\b", re.IGNORECASE)
+_STANDARD_BOTTLE_RE = re.compile(r"\bstandard bottle\b", re.IGNORECASE)
+_VOLUME_RE = re.compile(r"\b\d+(?:\.\d+)?\s*(?:ml|l)\b", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_RATING_RE = re.compile(r"\b([0-5]\.[0-9])\s*(?:\n|\s)+(?:based on all vintages|[0-9,]+\s+ratings)\b")
+_RATINGS_COUNT_RE = re.compile(r"\b([0-9][0-9,]*)\s+ratings\b")
+_PRICE_RE = re.compile(r"\$\s*([0-9]+(?:\.[0-9]{1,2})?)")
+
 _BLOCK_PATTERNS = (
     "attention required",
     "verify you are human",
@@ -61,25 +118,75 @@ def read_csv_rows(path: Path) -> list[dict[str, str]]:
         return list(csv.DictReader(handle))
 
 
+def load_suggest_cache(path: Path) -> dict[str, dict[str, object]]:
+    if not path.exists():
+        return {}
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    return {key: value for key, value in payload.items() if isinstance(value, dict)}
+
+
+def save_suggest_cache(path: Path, cache: dict[str, dict[str, object]]) -> None:
+    # Write aside and rename so an interrupted run never leaves a torn file.
+    # The cache only saves page loads on the next run, so a failed write is
+    # reported rather than raised (it would mask a --stop-on-block error).
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(cache, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, path)
+    except OSError as exc:
+        print(f"[suggest] could not write cache {path}: {exc}")
+
+
 def write_csv_rows(path: Path, rows: list[dict[str, str]], fieldnames: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8", newline="") as handle:
+    with path.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
         writer = csv.DictWriter(handle, fieldnames=fieldnames)
         writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
 
-def make_driver(*, headless: bool = True, timeout: int = 35) -> webdriver.Chrome:
+def make_driver(
+    *,
+    headless: bool = True,
+    timeout: int = 35,
+    block_assets: bool = True,
+    profile_dir: Path | None = None,
+) -> webdriver.Chrome:
     options = webdriver.ChromeOptions()
     if headless:
         options.add_argument("--headless=new")
+    else:
+        options.add_argument("--no-first-run")
+        options.add_argument("--no-default-browser-check")
+    if profile_dir is not None:
+        # A persistent profile keeps cookies (including solved challenges),
+        # the HTTP cache and DNS/TLS state between runs.
+        profile_dir = profile_dir.resolve()
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--profile-directory=Default")
+        options.add_argument(f"--disk-cache-dir={profile_dir / 'cache'}")
+        options.add_argument(f"--disk-cache-size={_PROFILE_DISK_CACHE_BYTES}")
     options.add_argument("--window-size=1920,1080")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    if block_assets:
+        # Only anchors and body text are read, so get() can return at
+        # DOMContentLoaded and the element waits cover the rest.
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
     driver = webdriver.Chrome(options=options)
     driver.set_page_load_timeout(timeout)
+    if block_assets:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(_BLOCKED_URL_PATTERNS)})
     return driver
 
 
@@ -88,17 +195,22 @@ def pause_with_jitter(base_seconds: float, jitter_seconds: float) -> None:
     time.sleep(duration)
 
 
-def detect_block_page(driver: webdriver.Chrome) -> tuple[bool, str]:
+def wait_for_element(driver: webdriver.Chrome, locator: tuple[str, str], timeout: float) -> bool:
+    # A timeout is not an error: block pages and empty searches never show the
+    # element, and callers still inspect whatever did load.
     try:
-        title = (driver.title or "").strip().lower()
-    except Exception:
-        title = ""
+        WebDriverWait(driver, max(timeout, 0.1)).until(EC.presence_of_element_located(locator))
+    except TimeoutException:
+        return False
+    return True
+
+
+def detect_block_page(driver: webdriver.Chrome) -> tuple[bool, str]:
     try:
-        body_text = (driver.find_element(By.TAG_NAME, "body").text or "").strip().lower()
+        haystack = (driver.execute_script(_BLOCK_PAGE_TEXT_JS) or "").lower()
     except Exception:
-        body_text = ""
+        haystack = ""
 
-    haystack = f"{title}\n{body_text}"
     for pattern in _BLOCK_PATTERNS:
         if pattern in haystack:
             return True, pattern
@@ -107,18 +219,19 @@ def detect_block_page(driver: webdriver.Chrome) -> tuple[bool, str]:
 
 def clean_query(name: str) -> str:
     text = name
-    text = re.sub(r"\(bundle of\s+\d+\)", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"\b(red|white|rose)\b", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"\bstandard bottle\b", " ", text, flags=re.IGNORECASE)
-    text = re.sub(r"\b\d+(?:\.\d+)?\s*(?:ml|l)\b", " ", text, flags=re.IGNORECASE)
+    text = _BUNDLE_RE.sub(" ", text)
+    text = _COLOR_RE.sub(" ", text)
+    text = _STANDARD_BOTTLE_RE.sub(" ", text)
+    text = _VOLUME_RE.sub(" ", text)
     text = text.replace(" - ", " ")
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
 def slug_to_title(url: str) -> str:
-    parsed = urlparse(url)
-    parts = [p for p in parsed.path.split("/") if p]
+    # urlparse drops ";params" from the last segment and is memoized by
+    # urlsplit, so repeated candidate URLs are cheap.
+    parts = [p for p in urlparse(url).path.split("/") if p]
     if "w" in parts:
         idx = parts.index("w")
         if idx > 0:
@@ -129,55 +242,85 @@ def slug_to_title(url: str) -> str:
     return ""
 
 
-def token_set_ratio(a: str, b: str) -> float:
-    a_tokens = set(a.split())
-    b_tokens = set(b.split())
-    if not a_tokens or not b_tokens:
-        return 0.0
-    inter = sorted(a_tokens & b_tokens)
+@dataclass(frozen=True)
+class ScoringText:
+    # Canonical key plus its token forms, built once per name and reused for
+    # every comparison it takes part in.
+    key: str
+    tokens: frozenset[str]
+    sorted_text: str
+
+
+def scoring_text(key: str) -> ScoringText:
+    tokens = frozenset(key.split())
+    return ScoringText(key=key, tokens=tokens, sorted_text=" ".join(sorted(tokens)))
+
+
+def _target_year(target_name: str) -> str | None:
+    year = extract_year(target_name)
+    return str(year) if year is not None else None
+
+
+def _url_year_values(url: str) -> list[str]:
+    return parse_qs(urlparse(url).query).get("year", [])
+
+
+def _token_set_ratio(a: ScoringText, b: ScoringText) -> float:
+    inter = a.tokens & b.tokens
     if not inter:
         return 0.0
-    inter_text = " ".join(inter)
-    return max(
-        SequenceMatcher(None, inter_text, " ".join(sorted(a_tokens))).ratio(),
-        SequenceMatcher(None, inter_text, " ".join(sorted(b_tokens))).ratio(),
-    )
+    # The sorted intersection is a subsequence of each side's sorted text, so
+    # their longest common subsequence is the whole intersection and the
+    # match ratio 2*LCS/(len(x)+len(y)) needs only lengths. The shorter side
+    # scores higher; a subset side gives exactly 1.0.
+    inter_len = len(" ".join(sorted(inter)))
+    side_len = min(len(a.sorted_text), len(b.sorted_text))
+    return 2 * inter_len / (inter_len + side_len)
 
 
-def score_candidate(target_name: str, candidate_name: str, candidate_url: str) -> float:
-    target = canonicalize_key(target_name)
-    candidate = canonicalize_key(candidate_name)
-    if not target or not candidate:
-        return 0.0
+def token_set_ratio(a: str, b: str) -> float:
+    return _token_set_ratio(scoring_text(a), scoring_text(b))
+
 
-    target_tokens = set(target.split())
-    candidate_tokens = set(candidate.split())
-    overlap = len(target_tokens & candidate_tokens)
+def _score_prepared(
+    target: ScoringText,
+    target_year: str | None,
+    candidate: ScoringText,
+    candidate_years: list[str],
+    min_score: float = 0.0,
+) -> float:
+    overlap = len(target.tokens & candidate.tokens)
     if overlap == 0:
         return 0.0
 
-    token_ratio = overlap / max(len(target_tokens), len(candidate_tokens))
-    seq_ratio = SequenceMatcher(None, target, candidate).ratio()
-    set_ratio = token_set_ratio(target, candidate)
-    score = (token_ratio * 0.45) + (seq_ratio * 0.2) + (set_ratio * 0.35)
+    token_ratio = overlap / max(len(target.tokens), len(candidate.tokens))
+    year_bonus = 0.07 if target_year is not None and target_year in candidate_years else 0.0
+    # Both string ratios are at most 1.0; when even that cannot reach
+    # min_score, the candidate is rejected without running SequenceMatcher.
+    if (token_ratio * 0.45) + 0.2 + 0.35 + year_bonus < min_score:
+        return 0.0
+    seq_ratio = 1.0 if target.key == candidate.key else SequenceMatcher(None, target.key, candidate.key).ratio()
+    set_ratio = _token_set_ratio(target, candidate)
+    score = (token_ratio * 0.45) + (seq_ratio * 0.2) + (set_ratio * 0.35) + year_bonus
+    return min(score, 1.0)
 
-    target_year = extract_year(target_name)
-    if target_year is not None:
-        parsed = urlparse(candidate_url)
-        year_values = parse_qs(parsed.query).get("year", [])
-        if any(str(target_year) == value for value in year_values):
-            score += 0.07
 
-    return min(score, 1.0)
+def score_candidate(target_name: str, candidate_name: str, candidate_url: str) -> float:
+    return _score_prepared(
+        scoring_text(_canonical_key(target_name)),
+        _target_year(target_name),
+        scoring_text(_canonical_key(candidate_name)),
+        _url_year_values(candidate_url),
+    )
 
 
 def extract_candidates_from_search(driver: webdriver.Chrome) -> list[dict[str, str]]:
-    anchors = driver.find_elements(By.CSS_SELECTOR, "a[href*='/w/']")
+    anchors = driver.execute_script(_SEARCH_ANCHORS_JS) or []
     candidates: list[dict[str, str]] = []
     seen: set[str] = set()
 
     for anchor in anchors:
-        href = (anchor.get_attribute("href") or "").strip()
+        href = (anchor.get("href") or "").strip()
         if not href or "/w/" not in href:
             continue
         if "/search/" in href:
@@ -187,10 +330,7 @@ def extract_candidates_from_search(driver: webdriver.Chrome) -> list[dict[str, s
         if normalized in seen:
             continue
 
-        text = (anchor.text or "").strip()
-        if not text:
-            text = (driver.execute_script("return arguments[0].textContent || '';", anchor) or "").strip()
-        title = text or slug_to_title(normalized)
+        title = (anchor.get("text") or "").strip() or slug_to_title(normalized)
 
         seen.add(normalized)
         candidates.append({"url": normalized, "title": title})
@@ -199,22 +339,37 @@ def extract_candidates_from_search(driver: webdriver.Chrome) -> list[dict[str, s
 
 
 def choose_best_candidate(target_name: str, candidates: list[dict[str, str]], min_score: float) -> Candidate | None:
-    best: Candidate | None = None
-    for candidate in candidates:
-        score = score_candidate(target_name, candidate["title"], candidate["url"])
-        if best is None or score > best.score:
-            best = Candidate(url=candidate["url"], title=candidate["title"], score=score)
-
-    if best is None or best.score < min_score:
+    # The target side is the same for every candidate; prepare it once.
+    target = scoring_text(_canonical_key(target_name))
+    target_year = _target_year(target_name)
+    best_index = -1
+    best_score = 0.0
+    for index, candidate in enumerate(candidates):
+        score = _score_prepared(
+            target,
+            target_year,
+            scoring_text(_canonical_key(candidate["title"])),
+            _url_year_values(candidate["url"]),
+            min_score,
+        )
+        if best_index < 0 or score > best_score:
+            best_index, best_score = index, score
+            # Scores are capped at 1.0 and only a strictly higher one replaces
+            # the leader, so nothing after a perfect score can win.
+            if best_score >= 1.0:
+                break
+
+    if best_index < 0 or best_score < min_score:
         return None
-    return best
+    best = candidates[best_index]
+    return Candidate(url=best["url"], title=best["title"], score=best_score)
 
 
-def fetch_metrics(driver: webdriver.Chrome, url: str, pause: float) -> tuple[str, str, str]:
+def fetch_metrics(driver: webdriver.Chrome, url: str, timeout: float) -> tuple[str, str, str]:
     try:
         driver.get(url)
-        time.sleep(pause)
-        body_text = (driver.find_element(By.TAG_NAME, "body").text or "").strip()
+        wait_for_element(driver, _WINE_METRICS_LOCATOR, timeout)
+        body_text = (driver.execute_script(_BODY_TEXT_JS) or "").strip()
     except Exception:
         return "", "", ""
 
@@ -222,17 +377,17 @@ def fetch_metrics(driver: webdriver.Chrome, url: str, pause: float) -> tuple[str
     num_ratings = ""
     price = ""
 
-    rating_match = re.search(r"\b([0-5]\.[0-9])\s*(?:\n|\s)+(?:based on all vintages|[0-9,]+\s+ratings)\b", body_text)
+    rating_match = _RATING_RE.search(body_text)
     if rating_match:
         rating = rating_match.group(1)
 
-    ratings_match = re.search(r"\b([0-9][0-9,]*)\s+ratings\b", body_text)
+    ratings_match = _RATINGS_COUNT_RE.search(body_text)
     if ratings_match:
         num_ratings = ratings_match.group(1).replace(",", "")
     elif "based on all vintages" in body_text.lower():
         num_ratings = "based on all vintages"
 
-    price_match = re.search(r"\$\s*([0-9]+(?:\.[0-9]{1,2})?)", body_text)
+    price_match = _PRICE_RE.search(body_text)
     if price_match:
         price = price_match.group(1)
 
@@ -246,15 +401,23 @@ def unresolved_wines(
 ) -> list[str]:
     lookup = build_vivino_lookup(vivino_rows + override_rows)
     missing: list[str] = []
+    # The same listing often appears on several comparison rows (vintages,
+    # bundles); match_vivino_row normalizes and may fuzzy-scan the whole
+    # lookup, so each distinct name is matched once.
+    unresolved_by_name: dict[str, bool] = {}
     for row in comparison_rows:
         wine_name = (row.get("name_plat") or "").strip()
         if not wine_name:
             continue
-        vivino, _ = match_vivino_row(wine_name, lookup)
-        rating = parse_float(vivino.get("vivino_rating")) if vivino else None
-        rating_count = parse_int(vivino.get("vivino_num_ratings")) if vivino else None
-        vivino_url = (vivino.get("vivino_url") if vivino else None) or ""
-        if rating is None and rating_count is None and not vivino_url.strip():
+        unresolved = unresolved_by_name.get(wine_name)
+        if unresolved is None:
+            vivino, _ = match_vivino_row(wine_name, lookup)
+            rating = parse_float(vivino.get("vivino_rating")) if vivino else None
+            rating_count = parse_int(vivino.get("vivino_num_ratings")) if vivino else None
+            vivino_url = (vivino.get("vivino_url") if vivino else None) or ""
+            unresolved = rating is None and rating_count is None and not vivino_url.strip()
+            unresolved_by_name[wine_name] = unresolved
+        if unresolved:
             missing.append(wine_name)
     return missing
 
@@ -285,8 +448,18 @@ def main() -> None:
     parser.add_argument("--output", type=Path, default=Path("seed/vivino_overrides_suggested.csv"))
     parser.add_argument("--limit", type=int, default=10)
     parser.add_argument("--min-score", type=float, default=0.64)
-    parser.add_argument("--sleep-seconds", type=float, default=8.0)
-    parser.add_argument("--sleep-jitter-seconds", type=float, default=6.0)
+    parser.add_argument(
+        "--sleep-seconds",
+        type=float,
+        default=8.0,
+        help="Maximum seconds to wait for search results or wine metrics to appear.",
+    )
+    parser.add_argument(
+        "--sleep-jitter-seconds",
+        type=float,
+        default=1.5,
+        help="Random pause of up to this many seconds after each search, for pacing.",
+    )
     parser.add_argument("--apply", action="store_true", help="Upsert suggestions into --vivino-overrides")
     parser.add_argument("--fetch-metrics", action="store_true", help="Open chosen wine page and parse rating/ratings/price")
     parser.add_argument(
@@ -300,6 +473,23 @@ def main() -> None:
         help="Fail fast when a block/challenge page is detected.",
     )
     parser.add_argument("--headed", action="store_true", help="Run browser with UI")
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=Path("data/vivino_suggest_cache.json"),
+        help="Accepted candidates by search query, reused by later runs to skip Selenium page loads.",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        type=Path,
+        default=None,
+        help="Reuse this Chrome profile directory across runs (e.g. data/vivino_chrome_profile).",
+    )
+    parser.add_argument(
+        "--load-assets",
+        action="store_true",
+        help="Load images, fonts and stylesheets (blocked by default to speed up page loads).",
+    )
     args = parser.parse_args()
 
     comparison_rows = read_csv_rows(args.comparison)
@@ -312,41 +502,67 @@ def main() -> None:
 
     print(f"[suggest] unresolved wines to scan: {len(missing)}")
 
-    driver = make_driver(headless=not args.headed)
+    driver = make_driver(
+        headless=not args.headed,
+        block_assets=not args.load_assets,
+        profile_dir=args.profile_dir,
+    )
     suggestions: list[dict[str, str]] = []
+    cache = load_suggest_cache(args.cache_path)
 
     try:
         for idx, wine_name in enumerate(missing, 1):
             query = clean_query(wine_name)
             search_url = f"https://www.vivino.com/en/search/wines?q={quote_plus(query)}"
             print(f"[suggest] {idx}/{len(missing)}: {wine_name}")
-            print(f"[suggest] search: {search_url}")
-
-            try:
-                driver.get(search_url)
-                pause_with_jitter(args.sleep_seconds, args.sleep_jitter_seconds)
-            except (TimeoutException, WebDriverException) as exc:
-                print(f"[suggest] failed to open search page: {exc}")
-                continue
-
-            blocked, trigger = detect_block_page(driver)
-            if blocked:
-                message = f"[suggest] blocked/challenge page detected while searching ({trigger})"
-                if args.stop_on_block:
-                    raise RuntimeError(message)
-                print(message)
-                continue
-
-            candidates = extract_candidates_from_search(driver)
-            best = choose_best_candidate(wine_name, candidates, args.min_score)
-            if best is None:
-                print("[suggest] no candidate above confidence threshold")
-                continue
+
+            # A query accepted by an earlier run is reused without opening the
+            # search page (or the wine page, once its metrics are cached).
+            cached = cache.get(query)
+            best = None
+            if cached is not None and float(cached.get("score") or 0.0) >= args.min_score:
+                best = Candidate(
+                    url=str(cached.get("url") or ""),
+                    title=str(cached.get("title") or ""),
+                    score=float(cached.get("score") or 0.0),
+                )
+                print(f"[suggest] cached: {best.url}")
+            else:
+                cached = None
+                print(f"[suggest] search: {search_url}")
+                try:
+                    driver.get(search_url)
+                    wait_for_element(driver, _SEARCH_RESULT_LOCATOR, args.sleep_seconds)
+                    pause_with_jitter(0.0, args.sleep_jitter_seconds)
+                except (TimeoutException, WebDriverException) as exc:
+                    print(f"[suggest] failed to open search page: {exc}")
+                    continue
+
+                blocked, trigger = detect_block_page(driver)
+                if blocked:
+                    message = f"[suggest] blocked/challenge page detected while searching ({trigger})"
+                    if args.stop_on_block:
+                        raise RuntimeError(message)
+                    print(message)
+                    continue
+
+                candidates = extract_candidates_from_search(driver)
+                best = choose_best_candidate(wine_name, candidates, args.min_score)
+                if best is None:
+                    print("[suggest] no candidate above confidence threshold")
+                    continue
 
             rating = ""
             num_ratings = ""
             price = ""
-            if args.fetch_metrics:
+            # Only a cached rating counts: fetch_metrics returns blanks when the
+            # wine page failed to load, and those entries should be retried.
+            metrics_cached = cached is not None and bool(cached.get("vivino_rating"))
+            if metrics_cached:
+                rating = str(cached.get("vivino_rating") or "")
+                num_ratings = str(cached.get("vivino_num_ratings") or "")
+                price = str(cached.get("vivino_price") or "")
+            elif args.fetch_metrics:
                 rating, num_ratings, price = fetch_metrics(driver, best.url, args.sleep_seconds)
                 blocked, trigger = detect_block_page(driver)
                 if blocked:
@@ -376,9 +592,20 @@ def main() -> None:
                 }
             )
             print(f"[suggest] selected: {best.title} ({best.score:.3f})")
+            cache[query] = {
+                "url": best.url,
+                "title": best.title,
+                "score": best.score,
+                "vivino_rating": rating,
+                "vivino_num_ratings": num_ratings,
+                "vivino_price": price,
+            }
+            if len(suggestions) % _CACHE_FLUSH_EVERY == 0:
+                save_suggest_cache(args.cache_path, cache)
 
     finally:
         driver.quit()
+        save_suggest_cache(args.cache_path, cache)
 
     write_csv_rows(args.output, suggestions, _OVERRIDE_FIELDS)
     print(f"[suggest] wrote {len(suggestions)} suggestion rows to {args.output}")
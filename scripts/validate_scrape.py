@@ -1,12 +1,19 @@
 import argparse
 import csv
+import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from urllib.parse import urlparse
 
 
 PRICE_RE = re.compile(r"-?\d+(?:\.\d+)?")
+STOCK_TRUE = frozenset({"1", "true", "yes", "y"})
+STOCK_FALSE = frozenset({"0", "false", "no", "n"})
+# netloc of an ordinary "scheme://host/..." URL, matched in C; anything
+# unusual (brackets, embedded tabs/newlines, no scheme) goes to urlparse.
+_URL_HOST_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.\-]*://([^/?#\[\]\t\r\n]*)(?:[/?#]|\Z)")
 
 
 def parse_price(value: str) -> float | None:
@@ -25,64 +32,123 @@ def parse_price(value: str) -> float | None:
         return None
 
 
-def load_rows(path: Path) -> list[dict[str, str]]:
-    with path.open("r", newline="", encoding="utf-8") as handle:
-        return list(csv.DictReader(handle))
-
+def url_host(url: str) -> str:
+    match = _URL_HOST_RE.match(url)
+    if match and "\t" not in url and "\n" not in url and "\r" not in url:
+        return match.group(1)
+    return urlparse(url).netloc
+
+
+def summarize(path: Path) -> str:
+    # One streaming pass: only the counters and the first few bad rows are
+    # kept, so memory does not grow with the file.
+    total = 0
+    missing_name = 0
+    missing_url = 0
+    missing_price = 0
+    # Duplicates are counted when a key is seen for the second time, so the
+    # per-key tallies never need a second walk.
+    name_counts: dict[str, int] = {}
+    url_counts: dict[str, int] = {}
+    dup_names = 0
+    dup_urls = 0
+    host_counts: Counter[str] = Counter()
+    # Scraped prices repeat heavily ("$45.00", "N/A", ...), so each distinct
+    # string is parsed once.
+    price_parseable: dict[str, bool] = {}
+    stock_other = False
+    in_stock_true = 0
+    in_stock_false = 0
+    bad_rows: list[tuple[int, str, str, str]] = []
 
-def summarize(path: Path) -> None:
-    rows = load_rows(path)
-    total = len(rows)
-    names = [((row.get("name") or "").strip()) for row in rows]
-    urls = [((row.get("url") or "").strip()) for row in rows]
-    prices = [parse_price((row.get("price") or "").strip()) for row in rows]
-    stock_values = [((row.get("in_stock") or "").strip().lower()) for row in rows]
+    with path.open("r", newline="", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        # Plain lists with fixed column positions instead of a dict per row.
+        # Like DictReader, a repeated header name maps to its last column
+        # and blank lines are not rows.
+        columns = {column: index for index, column in enumerate(next(reader, []))}
+        name_idx, url_idx, price_idx, stock_idx = (
+            columns.get(column, -1) for column in ("name", "url", "price", "in_stock")
+        )
+        idx = 1  # header is line 1
+        for row in reader:
+            if not row:
+                continue
+            idx += 1
+            total += 1
+            width = len(row)
+            name = row[name_idx].strip() if 0 <= name_idx < width else ""
+            url = row[url_idx].strip() if 0 <= url_idx < width else ""
+            price = row[price_idx].strip() if 0 <= price_idx < width else ""
+            stock = row[stock_idx].strip().lower() if 0 <= stock_idx < width else ""
+
+            if name:
+                key = name.lower()
+                seen = name_counts.get(key, 0)
+                if seen == 1:
+                    dup_names += 1
+                name_counts[key] = seen + 1
+            else:
+                missing_name += 1
+            if url:
+                seen = url_counts.get(url, 0)
+                if seen == 1:
+                    dup_urls += 1
+                url_counts[url] = seen + 1
+                host_counts[url_host(url)] += 1
+            else:
+                missing_url += 1
+            parseable = price_parseable.get(price)
+            if parseable is None:
+                parseable = price_parseable[price] = parse_price(price) is not None
+            if not parseable:
+                missing_price += 1
+            if stock in STOCK_TRUE:
+                in_stock_true += 1
+            elif stock in STOCK_FALSE:
+                in_stock_false += 1
+            elif stock:
+                stock_other = True
+            if (not name or not url) and len(bad_rows) < 10:
+                bad_rows.append((idx, name, price, url))
 
-    missing_name = sum(1 for x in names if not x)
-    missing_url = sum(1 for x in urls if not x)
-    missing_price = sum(1 for x in prices if x is None)
     parsed_price = total - missing_price
 
-    name_counts = Counter(n.lower() for n in names if n)
-    url_counts = Counter(u for u in urls if u)
-    dup_names = sum(1 for _, c in name_counts.items() if c > 1)
-    dup_urls = sum(1 for _, c in url_counts.items() if c > 1)
-
-    host_counts = Counter(urlparse(u).netloc for u in urls if u)
-
-    print(f"\n=== {path} ===")
-    print(f"rows: {total}")
-    print(f"missing name: {missing_name}")
-    print(f"missing url: {missing_url}")
-    print(f"price parseable: {parsed_price}/{total}")
-    print(f"duplicate names: {dup_names}")
-    print(f"duplicate urls: {dup_urls}")
-    print(f"url hosts: {dict(host_counts)}")
-    if any(stock_values):
-        in_stock_true = sum(1 for x in stock_values if x in {"1", "true", "yes", "y"})
-        in_stock_false = sum(1 for x in stock_values if x in {"0", "false", "no", "n"})
+    lines = [
+        "",
+        f"=== {path} ===",
+        f"rows: {total}",
+        f"missing name: {missing_name}",
+        f"missing url: {missing_url}",
+        f"price parseable: {parsed_price}/{total}",
+        f"duplicate names: {dup_names}",
+        f"duplicate urls: {dup_urls}",
+        f"url hosts: {dict(host_counts)}",
+    ]
+    if in_stock_true or in_stock_false or stock_other:
         in_stock_unknown = total - in_stock_true - in_stock_false
-        print(f"in_stock true/false/unknown: {in_stock_true}/{in_stock_false}/{in_stock_unknown}")
+        lines.append(f"in_stock true/false/unknown: {in_stock_true}/{in_stock_false}/{in_stock_unknown}")
 
-    bad_rows: list[tuple[int, str, str, str]] = []
-    for idx, row in enumerate(rows, start=2):  # header is line 1
-        name = (row.get("name") or "").strip()
-        url = (row.get("url") or "").strip()
-        price = (row.get("price") or "").strip()
-        if not name or not url:
-            bad_rows.append((idx, name, price, url))
     if bad_rows:
-        print("rows with missing required fields (first 10):")
-        for line_no, name, price, url in bad_rows[:10]:
-            print(f"  line {line_no}: name={name!r} price={price!r} url={url!r}")
+        lines.append("rows with missing required fields (first 10):")
+        for line_no, name, price, url in bad_rows:
+            lines.append(f"  line {line_no}: name={name!r} price={price!r} url={url!r}")
+    return "\n".join(lines)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Validate scraped CSV quality")
     parser.add_argument("csv_paths", nargs="+", type=Path)
     args = parser.parse_args()
-    for csv_path in args.csv_paths:
-        summarize(csv_path)
+    if len(args.csv_paths) == 1:
+        print(summarize(args.csv_paths[0]))
+        return
+    # Files are independent and parsing is CPU-bound, so summarize them in
+    # separate processes; reports are printed in argument order.
+    workers = min(len(args.csv_paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for report in pool.map(summarize, args.csv_paths):
+            print(report)
 
 
 if __name__ == "__main__":
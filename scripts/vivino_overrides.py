@@ -16,20 +16,26 @@ OVERRIDE_FIELDS = [
 _LOCKED_TRUTHY = {"1", "true", "yes", "y", "locked"}
 
 
+def _gs(row: dict[str, str], key: str, _strip=str.strip) -> str:
+    # Stripped field value with missing/None treated as empty.
+    value = row.get(key)
+    return _strip(value) if value else ""
+
+
 def is_locked_override_row(row: dict[str, str] | None) -> bool:
     if not row:
         return False
 
-    locked = (row.get("locked") or "").strip().lower()
+    locked = _gs(row, "locked").lower()
     if locked in _LOCKED_TRUTHY:
         return True
 
-    notes = (row.get("notes") or "").strip().lower()
+    notes = _gs(row, "notes").lower()
     return notes.startswith("manual")
 
 
 def normalize_override_row(row: dict[str, str]) -> dict[str, str]:
-    normalized = {field: (row.get(field) or "").strip() for field in OVERRIDE_FIELDS}
+    normalized = {field: _gs(row, field) for field in OVERRIDE_FIELDS}
     normalized["match_name"] = normalized["match_name"].strip()
     if is_locked_override_row(normalized):
         normalized["locked"] = "1"
@@ -40,14 +46,14 @@ def upsert_overrides(existing: list[dict[str, str]], new_rows: list[dict[str, st
     by_name: dict[str, dict[str, str]] = {}
 
     for row in existing:
-        key = (row.get("match_name") or "").strip()
+        key = _gs(row, "match_name")
         if key:
             normalized = normalize_override_row(row)
             normalized["match_name"] = key
             by_name[key] = normalized
 
     for row in new_rows:
-        key = (row.get("match_name") or "").strip()
+        key = _gs(row, "match_name")
         if not key:
             continue
 
@@ -57,7 +63,7 @@ def upsert_overrides(existing: list[dict[str, str]], new_rows: list[dict[str, st
 
         merged = prior.copy() if prior is not None else {field: "" for field in OVERRIDE_FIELDS}
         for field in OVERRIDE_FIELDS:
-            incoming = (row.get(field) or "").strip()
+            incoming = _gs(row, field)
             if incoming:
                 merged[field] = incoming
         merged["match_name"] = key
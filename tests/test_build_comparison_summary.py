@@ -1,4 +1,14 @@
-from scripts.build_comparison_summary import build_matches, build_summary, package_type, prepare_rows
+import csv
+from pathlib import Path
+
+from scripts.build_comparison_summary import (
+    build_comparison,
+    build_matches,
+    build_summary,
+    package_type,
+    prepare_rows,
+    read_rows,
+)
 
 
 def test_package_type_detects_gift_sets() -> None:
@@ -89,3 +99,39 @@ def test_brut_reserve_does_not_match_rose_reserve() -> None:
 
     assert summary[0]["cheaper_side"] == "No Match"
     assert summary[0]["url_main"] == ""
+
+
+def test_build_comparison_returns_rows_matching_written_csv(tmp_path: Path) -> None:
+    fields = ["name", "price", "url", "in_stock"]
+    grandcru_csv = tmp_path / "grandcru.csv"
+    platinum_csv = tmp_path / "platinum.csv"
+    for path, row in (
+        (
+            grandcru_csv,
+            {
+                "name": "2019 Vajra Barolo Albe",
+                "price": "95.00",
+                "url": "https://grandcruwines.com/products/2019-vajra-barolo-albe",
+                "in_stock": "true",
+            },
+        ),
+        (
+            platinum_csv,
+            {
+                "name": "2019 Vajra Barolo Albe - Red - 750 ml - Standard Bottle",
+                "price": "80.00",
+                "url": "https://platwineclub.wineportal.com/wines/2019-vajra-barolo-albe-red-750-ml-standard-bottle",
+                "in_stock": "true",
+            },
+        ),
+    ):
+        with path.open("w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=fields)
+            writer.writeheader()
+            writer.writerow(row)
+
+    output = tmp_path / "comparison_summary.csv"
+    rows = build_comparison(grandcru_csv, platinum_csv, output, match_threshold=0.6)
+
+    assert rows == read_rows(output)
+    assert rows[0]["price_plat"] == "80.00"
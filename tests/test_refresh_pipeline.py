@@ -0,0 +1,312 @@
+"""Regression tests for refresh_pipeline helpers."""
+
+import csv
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import create_engine
+
+from scripts.refresh_pipeline import (
+    ROOT,
+    cached_count_rows,
+    check_health,
+    count_rows,
+    existing_paths,
+    input_mtimes,
+    inputs_unchanged,
+    run_commands,
+    run_import,
+    run_streamed,
+    run_vivino_resolver,
+    save_refresh_state,
+)
+from scripts.reset_database import reset_database
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    responses: list[tuple[int, bytes]] = []
+    connections: set[tuple[str, int]] = set()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        type(self).connections.add(self.client_address)
+        status, body = type(self).responses.pop(0)
+        self.send_response(status)
+        if status in (301, 302, 307, 308):
+            self.send_header("Location", "/health/")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+class CheckHealthTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _HealthHandler.responses = []
+        _HealthHandler.connections = set()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/health"
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_healthy_json_response_passes(self) -> None:
+        _HealthHandler.responses = [(200, json.dumps({"total_deals": 3}).encode())]
+        self.assertTrue(check_health(self.url))
+
+    def test_non_json_response_is_reported_raw_and_passes(self) -> None:
+        _HealthHandler.responses = [(200, b"ok")]
+        self.assertTrue(check_health(self.url))
+
+    def test_oversized_response_fails_without_parsing(self) -> None:
+        _HealthHandler.responses = [(200, b"[" + b"0," * 40_000 + b"0]")]
+        self.assertFalse(check_health(self.url, retries=2, backoff_seconds=0.0))
+        self.assertEqual(_HealthHandler.responses, [])
+
+    def test_error_status_fails_without_retries(self) -> None:
+        _HealthHandler.responses = [(503, b"{}")]
+        self.assertFalse(check_health(self.url))
+
+    def test_redirect_is_followed_to_the_final_response(self) -> None:
+        _HealthHandler.responses = [(301, b"moved"), (200, json.dumps({"total_deals": 3}).encode())]
+        self.assertTrue(check_health(self.url))
+        self.assertEqual(_HealthHandler.responses, [])
+
+    def test_non_2xx_status_without_location_fails(self) -> None:
+        _HealthHandler.responses = [(304, b"")]
+        self.assertFalse(check_health(self.url))
+
+    def test_retries_reuse_keep_alive_connection(self) -> None:
+        _HealthHandler.responses = [(503, b"{}"), (200, b"{}")]
+        self.assertTrue(check_health(self.url, retries=1, backoff_seconds=0.0))
+        self.assertEqual(len(_HealthHandler.connections), 1)
+
+
+class CountRowsTests(unittest.TestCase):
+    def _count(self, content: str) -> int:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.csv"
+            path.write_text(content, encoding="utf-8", newline="")
+            with path.open("r", encoding="utf-8", newline="") as handle:
+                expected = sum(1 for _ in csv.DictReader(handle))
+            actual = count_rows(path)
+        self.assertEqual(actual, expected)
+        return actual
+
+    def test_plain_rows_match_csv_reader(self) -> None:
+        self.assertEqual(self._count("a,b\n1,2\n3,4\n"), 2)
+        self.assertEqual(self._count("a,b\r\n1,2\r\n3,4"), 2)
+
+    def test_empty_and_header_only_files(self) -> None:
+        self.assertEqual(self._count(""), 0)
+        self.assertEqual(self._count("a,b\n"), 0)
+
+    def test_quoted_newlines_and_blank_lines_fall_back_to_csv(self) -> None:
+        self.assertEqual(self._count('a,b\n1,"two\nlines"\n3,4\n'), 2)
+        self.assertEqual(self._count("a,b\n1,2\n\n3,4\n"), 2)
+
+    def test_cached_count_reuses_entry_until_file_changes(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.csv"
+            path.write_text("a\n1\n", encoding="utf-8")
+            cache: dict[str, dict[str, int]] = {}
+            self.assertEqual(cached_count_rows(path, cache), 1)
+
+            cache[str(path)]["rows"] = 99
+            self.assertEqual(cached_count_rows(path, cache), 99)
+
+            path.write_text("a\n1\n2\n", encoding="utf-8")
+            self.assertEqual(cached_count_rows(path, cache), 2)
+            self.assertEqual(cached_count_rows(Path(tmp) / "missing.csv", cache), 0)
+
+
+class ExistingPathsTests(unittest.TestCase):
+    def test_shared_and_mixed_parent_directories(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "sub").mkdir()
+            present = root / "a.csv"
+            nested = root / "sub" / "b.csv"
+            present.write_text("a\n", encoding="utf-8")
+            nested.write_text("b\n", encoding="utf-8")
+            missing = root / "missing.csv"
+
+            self.assertEqual(existing_paths(present, missing), {present})
+            self.assertEqual(existing_paths(present, nested, missing), {present, nested})
+            self.assertEqual(existing_paths(root / "nope" / "x.csv", root / "nope" / "y.csv"), set())
+
+
+class RefreshStateTests(unittest.TestCase):
+    def test_skip_only_when_inputs_and_database_match(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            comparison, vivino = root / "comparison.csv", root / "vivino.csv"
+            comparison.write_text("a\n", encoding="utf-8")
+            vivino.write_text("a\n", encoding="utf-8")
+            overrides = root / "overrides.csv"
+            state = root / "refresh_state.json"
+            db = "sqlite:///./data/wines.db"
+
+            self.assertFalse(inputs_unchanged(state, input_mtimes(comparison, vivino, overrides), db))
+            save_refresh_state(state, input_mtimes(comparison, vivino, overrides), db)
+            self.assertTrue(inputs_unchanged(state, input_mtimes(comparison, vivino, overrides), db))
+            self.assertFalse(
+                inputs_unchanged(state, input_mtimes(comparison, vivino, overrides), "sqlite:///other.db")
+            )
+
+            overrides.write_text("a\n", encoding="utf-8")
+            self.assertFalse(inputs_unchanged(state, input_mtimes(comparison, vivino, overrides), db))
+
+            stat = vivino.stat()
+            os.utime(vivino, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            save_refresh_state(state, input_mtimes(comparison, vivino, overrides), db)
+            os.utime(vivino, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000_000))
+            self.assertFalse(inputs_unchanged(state, input_mtimes(comparison, vivino, overrides), db))
+
+    def test_unwritable_state_file_warns_instead_of_failing(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            blocker = Path(tmp) / "data"
+            blocker.write_text("not a directory", encoding="utf-8")
+            with mock.patch("builtins.print") as printed:
+                save_refresh_state(blocker / "refresh_state.json", {}, "sqlite:///./data/wines.db")
+        self.assertIn("Could not write refresh state", printed.call_args.args[0])
+
+    def test_database_reset_forgets_the_last_import(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            state = Path(tmp) / "refresh_state.json"
+            save_refresh_state(state, {}, "sqlite:///./data/wines.db")
+            with mock.patch("app.database.engine", create_engine("sqlite://")):
+                reset_database(drop_all=True, refresh_state_file=state)
+            self.assertFalse(inputs_unchanged(state, {}, "sqlite:///./data/wines.db"))
+            self.assertFalse(state.exists())
+
+
+class RunCommandsTests(unittest.TestCase):
+    def test_chained_commands_keep_argv_quoting_and_stop_on_failure(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out.txt"
+            script = f"import sys; open({str(out)!r}, 'a').write(sys.argv[1] + chr(10))"
+            first = f"{sys.executable} -c \"{script}\" 'a;b $HOME'"
+            second = f"{sys.executable} -c \"{script}\" second"
+            failing = f"{sys.executable} -c 'raise SystemExit(2)'"
+
+            run_commands([first, second], dict(os.environ))
+            self.assertEqual(out.read_text(encoding="utf-8"), "a;b $HOME\nsecond\n")
+
+            with self.assertRaises(subprocess.CalledProcessError):
+                run_commands([failing, first], dict(os.environ))
+            self.assertEqual(out.read_text(encoding="utf-8"), "a;b $HOME\nsecond\n")
+
+    def test_chained_programs_are_resolved_on_path_and_never_read_as_assignments(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "out.txt"
+            program = Path(tmp) / "FOO=bar"
+            program.write_text(f"#!/bin/sh\necho ran >> {shlex.quote(str(out))}\n", encoding="utf-8")
+            program.chmod(0o755)
+            env = {**os.environ, "PATH": f"{tmp}{os.pathsep}{os.environ.get('PATH', '')}"}
+            second = f"{sys.executable} -c 'pass'"
+
+            run_commands(["FOO=bar", second], env)
+            self.assertEqual(out.read_text(encoding="utf-8"), "ran\n")
+
+            with self.assertRaisesRegex(FileNotFoundError, "not found on PATH"):
+                run_commands(["FOO=bar", "no-such-program-xyz --flag"], env)
+            self.assertEqual(out.read_text(encoding="utf-8"), "ran\n")
+
+
+class RunImportTests(unittest.TestCase):
+    def test_in_process_import_restores_environment_and_cwd(self) -> None:
+        seen: dict[str, str | None] = {}
+
+        def fake_import(*args: object, **kwargs: object) -> None:
+            seen["database_url"] = os.environ.get("DATABASE_URL")
+            seen["cwd"] = os.getcwd()
+            raise RuntimeError("import failed")
+
+        cwd = os.getcwd()
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch.dict(os.environ, {}, clear=False),
+            mock.patch("scripts.import_wine_data.import_data", side_effect=fake_import),
+            mock.patch("builtins.print"),
+        ):
+            os.environ.pop("DATABASE_URL", None)
+            os.chdir(tmp)
+            try:
+                with self.assertRaises(RuntimeError):
+                    run_import(
+                        Path("comparison.csv"),
+                        Path("vivino.csv"),
+                        Path("overrides.csv"),
+                        {"DATABASE_URL": "sqlite:///./data/test.db"},
+                        in_process=True,
+                    )
+                self.assertEqual(os.path.realpath(os.getcwd()), os.path.realpath(tmp))
+                self.assertNotIn("DATABASE_URL", os.environ)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(seen["database_url"], "sqlite:///./data/test.db")
+        self.assertEqual(Path(seen["cwd"]).resolve(), ROOT.resolve())
+
+
+class RunStreamedTests(unittest.TestCase):
+    def test_nonzero_exit_raises_called_process_error(self) -> None:
+        cmd = [sys.executable, "-c", "import sys; print('relayed'); sys.exit(3)"]
+        with self.assertRaises(subprocess.CalledProcessError) as ctx:
+            run_streamed(cmd, dict(os.environ))
+        self.assertEqual(ctx.exception.returncode, 3)
+
+
+class ResolverCommandTests(unittest.TestCase):
+    def test_value_flags_are_paired_with_stringified_values(self) -> None:
+        with mock.patch("scripts.refresh_pipeline.subprocess.run") as run:
+            run_vivino_resolver(
+                comparison_path=Path("/seed/comparison.csv"),
+                vivino_path=Path("/seed/vivino.csv"),
+                vivino_overrides_path=Path("/seed/overrides.csv"),
+                provider="brave",
+                auto_apply=True,
+                max_results=8,
+                sleep_seconds=1.2,
+                min_confidence=0.82,
+                min_margin=0.08,
+                limit=0,
+                max_api_queries=40,
+                auto_provider_order="google_cse,brave,serper",
+                query_cache=Path("/data/cache.json"),
+                cache_ttl_hours=168.0,
+                only_new_unresolved=True,
+                state_file=Path("/data/state.json"),
+                output_review=Path("/data/review.csv"),
+                output_unmatched=Path("/data/unmatched.csv"),
+                output_suggestions=Path("/data/suggestions.csv"),
+                require_vivino_metrics=True,
+                env={},
+            )
+        cmd = run.call_args.args[0]
+        self.assertEqual(cmd[cmd.index("--vivino") + 1], "/seed/vivino.csv")
+        self.assertEqual(cmd[cmd.index("--provider") + 1], "brave")
+        self.assertEqual(cmd[cmd.index("--max-api-queries") + 1], "40")
+        self.assertEqual(cmd[cmd.index("--output-suggestions") + 1], "/data/suggestions.csv")
+        self.assertEqual(
+            cmd[-3:], ["--only-new-unresolved", "--auto-apply", "--require-vivino-metrics"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,35 @@
 """Regression tests for resolve_vivino_matches decision logic."""
 
 import argparse
+import csv
+import json
+import tempfile
+import threading
+import time
 import unittest
+from collections.abc import Callable
+from difflib import SequenceMatcher
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+from urllib.error import HTTPError
 
-from scripts.resolve_vivino_matches import Candidate, vivino_row_has_metrics
+from scripts.query_cache import build_query_cache_key, load_query_cache
+from scripts.resolve_vivino_matches import (
+    Candidate,
+    _jaro_winkler,
+    _RateLimiter,
+    _request_json,
+    _reserve_api_call,
+    _token_set_ratio,
+    build_queries,
+    close_http_pool,
+    parse_identity,
+    parse_vivino_url,
+    resolve_matches,
+    score_candidate,
+    vivino_row_has_metrics,
+)
 
 
 def _make_args(*, require_vivino_metrics: bool = True, auto_accept_best: bool = False) -> argparse.Namespace:
@@ -154,5 +180,565 @@ class MetricsDetectionTests(unittest.TestCase):
         self.assertTrue(vivino_row_has_metrics({"vivino_raters": "120 ratings"}))
 
 
+
+class TokenSetRatioTests(unittest.TestCase):
+    def test_matches_plain_sequence_matcher_comparisons(self) -> None:
+        cases = [
+            ({"2019", "vajra", "barolo", "albe"}, {"vajra", "barolo", "albe", "2019", "red"}),
+            ({"tempier", "bandol", "rose"}, {"tempier", "bandol"}),
+            ({"chateau", "margaux", "pavillon"}, {"margaux", "rouge", "du"}),
+            ({"krug"}, {"grande", "cuvee"}),
+        ]
+        for target, candidate in cases:
+            inter = sorted(target & candidate)
+            expected = 0.0
+            if inter:
+                inter_text = " ".join(inter)
+                expected = max(
+                    SequenceMatcher(None, inter_text, " ".join(sorted(target))).ratio(),
+                    SequenceMatcher(None, inter_text, " ".join(sorted(candidate))).ratio(),
+                )
+            with self.subTest(target=target, candidate=candidate):
+                self.assertEqual(_token_set_ratio(target, candidate), expected)
+
+
+class JaroWinklerTests(unittest.TestCase):
+    def test_reference_values(self) -> None:
+        self.assertAlmostEqual(_jaro_winkler("martha", "marhta"), 0.9611, places=4)
+        self.assertAlmostEqual(_jaro_winkler("dwayne", "duane"), 0.84, places=4)
+        self.assertAlmostEqual(_jaro_winkler("dixon", "dicksonx"), 0.8133, places=4)
+        self.assertEqual(_jaro_winkler("vajra", "vajra"), 1.0)
+        self.assertEqual(_jaro_winkler("", "vajra"), 0.0)
+
+    def test_producer_led_slug_outscores_same_tokens_out_of_order(self) -> None:
+        identity = parse_identity({"name_plat": "2015 Chateau Margaux - Pavillon Rouge - Red", "year_plat": "2015"})
+        title = "Pavillon Rouge"
+        led = score_candidate(identity, title, "https://www.vivino.com/en/chateau-margaux-pavillon-rouge/w/1")
+        trailing = score_candidate(identity, title, "https://www.vivino.com/en/pavillon-rouge-chateau-margaux/w/1")
+        self.assertGreater(led[3], trailing[3])
+        self.assertGreater(led[0], trailing[0])
+
+    def test_wrong_producer_and_vintage_with_weak_overlap_scores_zero(self) -> None:
+        identity = parse_identity({"name_plat": "2015 Chateau Margaux - Pavillon Rouge - Red", "year_plat": "2015"})
+        score = score_candidate(
+            identity,
+            "Pavillon Blanc Sauvignon Bordeaux Superieur Estate Reserve",
+            "https://www.vivino.com/en/other-estate-pavillon-blanc/w/9?year=2019",
+        )
+        self.assertEqual(score, (0.0, 0, False, 0.0))
+
+
+class IdentityMemoTests(unittest.TestCase):
+    def test_repeated_rows_share_identity_and_return_fresh_query_lists(self) -> None:
+        row = {
+            "name_plat": " 2019 G.D. Vajra - Barolo Albe - Red ",
+            "year_plat": "2019",
+            "url_main": "https://grandcruwines.com/products/2019-g-d-vajra-barolo-albe",
+        }
+        identity = parse_identity(row)
+        self.assertIs(parse_identity(dict(row)), identity)
+        self.assertEqual(identity.wine_name, "2019 G.D. Vajra - Barolo Albe - Red")
+
+        queries = build_queries(identity, row)
+        queries.append("mutated")
+        self.assertEqual(len(build_queries(identity, row)), len(queries) - 1)
+        self.assertNotEqual(build_queries(identity, {**row, "url_main": ""}), build_queries(identity, row))
+
+
+class ParseVivinoUrlTests(unittest.TestCase):
+    def test_normalized_url_keeps_year_hint_from_raw_link(self) -> None:
+        parsed = parse_vivino_url(" https://www.vivino.com/en/domaine-tempier-bandol/w/42/?year=2019#reviews ")
+        self.assertEqual(parsed.url, "https://www.vivino.com/en/domaine-tempier-bandol/w/42")
+        self.assertEqual(parsed.year, 2019)
+        self.assertEqual(parsed.slug_text, "domaine tempier bandol")
+        self.assertIsNone(parse_vivino_url("https://example.com/en/domaine-tempier-bandol/w/42"))
+        self.assertIsNone(parse_vivino_url("https://www.vivino.com/search?q=tempier"))
+
+    def test_year_hint_feeds_year_match_after_normalisation(self) -> None:
+        identity = parse_identity({"name_plat": "2019 Domaine Tempier - Bandol Rose", "year_plat": "2019"})
+        parsed = parse_vivino_url("https://www.vivino.com/en/domaine-tempier-bandol-rose/w/42?year=2019")
+        self.assertTrue(score_candidate(identity, "Bandol Rose", parsed)[2])
+        self.assertFalse(score_candidate(identity, "Bandol Rose", parsed.url)[2])
+
+
+class RateLimiterTests(unittest.TestCase):
+    def test_burst_then_calls_are_spaced_at_the_configured_rate(self) -> None:
+        clock = [100.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(round(seconds, 6))
+            clock[0] += seconds
+
+        with (
+            mock.patch("scripts.resolve_vivino_matches.time.monotonic", side_effect=lambda: clock[0]),
+            mock.patch("scripts.resolve_vivino_matches.time.sleep", side_effect=sleep),
+        ):
+            limiter = _RateLimiter(rate_per_minute=120, burst=2)
+            for _ in range(4):
+                limiter.acquire()
+            clock[0] += 5.0
+            limiter.acquire()
+        self.assertEqual(sleeps, [0.5, 0.5])
+
+
+class QueryCacheTests(unittest.TestCase):
+    def test_legacy_json_cache_is_imported_and_writes_persist(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            legacy = Path(tmp) / "cache.json"
+            entry = {"timestamp": 1700000000, "results": [{"url": "https://www.vivino.com/w/1", "title": "Albe"}]}
+            legacy.write_text(json.dumps({"serper|8|barolo albe": entry}), encoding="utf-8")
+
+            cache = load_query_cache(legacy)
+            self.assertEqual(cache.path, Path(tmp) / "cache.sqlite3")
+            self.assertEqual(cache.get(build_query_cache_key("serper", "Barolo  Albe", 8)), entry)
+            brave_key = build_query_cache_key("brave", "tempier", 8)
+            cache[brave_key] = {"timestamp": 1700000001, "results": [], "query": "tempier"}
+            cache.close()
+
+            legacy.write_text("{}", encoding="utf-8")
+            reopened = load_query_cache(legacy)
+            self.assertEqual(len(reopened), 2)
+            self.assertEqual(reopened.get(brave_key), {"timestamp": 1700000001, "results": []})
+            self.assertIsNone(reopened.get("missing"))
+            reopened.close()
+
+    def test_ttl_is_applied_by_the_lookup(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = load_query_cache(Path(tmp) / "cache.sqlite3")
+            stamp = int(time.time()) - 7200
+            cache["old"] = {"timestamp": stamp, "results": []}
+            self.assertIsNone(cache.get("old", ttl_hours=1.0))
+            self.assertEqual(cache.get("old", ttl_hours=3.0), {"timestamp": stamp, "results": []})
+            self.assertIsNotNone(cache.get("old", ttl_hours=0.0))
+            cache.close()
+
+    def test_concurrent_opens_share_entries_without_rewriting_keys(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache.sqlite3"
+            first, second = load_query_cache(path), load_query_cache(path)
+            key = build_query_cache_key("brave", "Bandol Rose", 8)
+            first[key] = {"timestamp": 1700000000, "results": [], "query": "bandol rose"}
+            self.assertEqual(second.get(key), {"timestamp": 1700000000, "results": []})
+            first.close()
+            second.close()
+            reopened = load_query_cache(path)
+            self.assertEqual(reopened.get(key), {"timestamp": 1700000000, "results": []})
+            reopened.close()
+
+
+class _SearchHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    responses: list[tuple[int, bytes]] = []
+    connections: set[tuple[str, int]] = set()
+    requests: list[str] = []
+    # Mimics a server that silently drops keep-alive sockets once idle.
+    close_idle: bool = False
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server API
+        type(self).connections.add(self.client_address)
+        type(self).requests.append(self.command)
+        status, body = type(self).responses.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if type(self).close_idle:
+            self.close_connection = True
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server API
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.do_GET()
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+class PooledRequestTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _SearchHandler.responses = []
+        _SearchHandler.connections = set()
+        _SearchHandler.requests = []
+        _SearchHandler.close_idle = False
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _SearchHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/search?q=barolo"
+        sleep_patch = mock.patch("scripts.resolve_vivino_matches.time.sleep")
+        sleep_patch.start()
+        self.addCleanup(sleep_patch.stop)
+
+    def tearDown(self) -> None:
+        close_http_pool()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_requests_and_retries_reuse_one_connection(self) -> None:
+        _SearchHandler.responses = [
+            (200, json.dumps({"n": 1}).encode()),
+            (503, b"{}"),
+            (200, json.dumps({"n": 2}).encode()),
+        ]
+        self.assertEqual(_request_json("GET", self.url), {"n": 1})
+        self.assertEqual(_request_json("GET", self.url), {"n": 2})
+        self.assertEqual(len(_SearchHandler.connections), 1)
+
+    def test_client_error_raises_http_error_without_retry(self) -> None:
+        _SearchHandler.responses = [(403, b"{}"), (200, b"{}")]
+        with self.assertRaises(HTTPError) as ctx:
+            _request_json("GET", self.url)
+        self.assertEqual(ctx.exception.code, 403)
+        self.assertEqual(len(_SearchHandler.responses), 1)
+
+    def test_post_is_not_resent_after_the_server_answered(self) -> None:
+        _SearchHandler.responses = [(503, b"{}"), (200, b"{}")]
+        with self.assertRaises(HTTPError) as ctx:
+            _request_json("POST", self.url, body=b"{}", headers={"Content-Type": "application/json"})
+        self.assertEqual(ctx.exception.code, 503)
+        self.assertEqual(len(_SearchHandler.responses), 1)
+
+    def test_post_on_a_connection_closed_while_idle_is_resent_once_fresh(self) -> None:
+        _SearchHandler.close_idle = True
+        _SearchHandler.responses = [(200, json.dumps({"n": 1}).encode()), (200, json.dumps({"n": 2}).encode())]
+        headers = {"Content-Type": "application/json"}
+
+        def deny() -> bool:
+            return False
+
+        self.assertEqual(_request_json("POST", self.url, body=b"{}", headers=headers), {"n": 1})
+        self.assertEqual(_request_json("POST", self.url, body=b"{}", headers=headers, reserve_retry=deny), {"n": 2})
+        self.assertEqual(_SearchHandler.requests, ["POST", "POST"])
+        self.assertEqual(len(_SearchHandler.connections), 2)
+
+    def test_retries_are_charged_to_the_query_budget(self) -> None:
+        api_calls_state = {"count": 1}
+
+        def reserve() -> bool:
+            return _reserve_api_call(api_calls_state, 2)
+
+        _SearchHandler.responses = [(503, b"{}"), (503, b"{}"), (200, b"{}")]
+        with self.assertRaises(HTTPError):
+            _request_json("GET", self.url, reserve_retry=reserve)
+        self.assertEqual(api_calls_state["count"], 2)
+        self.assertEqual(len(_SearchHandler.responses), 1)
+
+
+
+_COMPARISON_ROWS = [
+    {
+        "name_plat": "2019 G D Vajra - Barolo Albe - Red - 750 ml",
+        "year_plat": "2019",
+        "url_main": "https://grandcruwines.com/products/2019-g-d-vajra-barolo-albe",
+        "url_plat": "",
+    },
+    {
+        "name_plat": "2020 Domaine Tempier - Bandol Rose - Rose - 750 ml",
+        "year_plat": "2020",
+        "url_main": "",
+        "url_plat": "https://platwineclub.wineportal.com/wines/2020-domaine-tempier-bandol-rose",
+    },
+    {
+        "name_plat": "2018 Unknown Cellars - Mystery Blend - Red - 750 ml",
+        "year_plat": "2018",
+        "url_main": "",
+        "url_plat": "",
+    },
+]
+
+_SEARCH_RESULTS = {
+    "vajra": [
+        {"url": "https://www.vivino.com/en/g-d-vajra-barolo-albe/w/1?year=2019", "title": "G D Vajra Barolo Albe 2019"},
+        {"url": "https://www.vivino.com/en/g-d-vajra-langhe/w/2", "title": "G D Vajra Langhe Nebbiolo"},
+    ],
+    "tempier": [
+        {"url": "https://www.vivino.com/en/domaine-tempier-bandol-rose/w/3", "title": "Domaine Tempier Bandol Rose 2020"},
+        {"url": "https://example.com/not-vivino", "title": "Domaine Tempier"},
+    ],
+}
+
+
+def _fake_search(*, provider: str, query: str, **_: object) -> list[dict[str, str]]:
+    for needle, results in _SEARCH_RESULTS.items():
+        if needle in query.lower():
+            return list(results)
+    return []
+
+
+def _read_rows(path: Path) -> list[dict[str, str]]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        return list(csv.DictReader(handle))
+
+
+class ResolveMatchesTests(unittest.TestCase):
+    def _run(
+        self,
+        tmp: Path,
+        rows: list[dict[str, str]] = _COMPARISON_ROWS,
+        search: Callable[..., list[dict[str, str]]] = _fake_search,
+        **overrides: object,
+    ) -> dict[str, list[dict[str, str]]]:
+        comparison = tmp / "comparison.csv"
+        with comparison.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.DictWriter(handle, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        vivino = tmp / "vivino.csv"
+        vivino.write_text("wine_name,vivino_rating,vivino_num_ratings,vivino_price,vivino_url\n", encoding="utf-8")
+
+        args = argparse.Namespace(
+            comparison=comparison,
+            vivino=vivino,
+            vivino_overrides=tmp / "overrides.csv",
+            provider="serper",
+            serper_api_key="test-key",
+            google_api_key="",
+            google_cse_id="",
+            brave_api_key="",
+            auto_provider_order="google_cse,brave,serper",
+            query_cache=tmp / "query_cache.json",
+            cache_ttl_hours=168.0,
+            max_api_queries=0,
+            only_new_unresolved=True,
+            state_file=tmp / "state.json",
+            max_results=8,
+            sleep_seconds=0.0,
+            rate_per_minute_google_cse=0.0,
+            rate_per_minute_brave=0.0,
+            rate_per_minute_serper=0.0,
+            search_workers=1,
+            prefetch_rows=0,
+            row_workers=1,
+            serper_batch=False,
+            min_confidence=0.82,
+            min_margin=0.08,
+            auto_accept_best=False,
+            require_vivino_metrics=False,
+            limit=0,
+            auto_apply=False,
+            output_review=tmp / "review.csv",
+            output_unmatched=tmp / "unmatched.csv",
+            output_suggestions=tmp / "suggestions.csv",
+        )
+        for key, value in overrides.items():
+            setattr(args, key, value)
+
+        with (
+            mock.patch("scripts.llm_utils.load_identity_cache", return_value={}),
+            mock.patch("scripts.resolve_vivino_matches.run_search", side_effect=search) as run_search,
+            mock.patch("builtins.print"),
+        ):
+            resolve_matches(args)
+
+        return {
+            "review": _read_rows(args.output_review),
+            "unmatched": _read_rows(args.output_unmatched),
+            "suggestions": _read_rows(args.output_suggestions),
+            "api_calls": [run_search.call_count],
+        }
+
+    def test_decisions_for_matched_and_unmatched_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = self._run(Path(tmp))
+        decisions = {row["wine_name"]: row["decision"] for row in outputs["review"]}
+        self.assertEqual(
+            decisions,
+            {
+                _COMPARISON_ROWS[0]["name_plat"]: "auto_accept",
+                _COMPARISON_ROWS[1]["name_plat"]: "auto_accept",
+                _COMPARISON_ROWS[2]["name_plat"]: "unmatched",
+            },
+        )
+        self.assertEqual(
+            [row["vivino_url"] for row in outputs["suggestions"]],
+            [
+                "https://www.vivino.com/en/g-d-vajra-barolo-albe/w/1",
+                "https://www.vivino.com/en/domaine-tempier-bandol-rose/w/3",
+            ],
+        )
+
+    def test_repeated_results_within_a_row_are_scored_once(self) -> None:
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch("scripts.resolve_vivino_matches.score_candidate", wraps=score_candidate) as scorer,
+        ):
+            outputs = self._run(Path(tmp))
+        self.assertEqual(len(outputs["suggestions"]), 2)
+        self.assertEqual(scorer.call_count, 3)
+
+    def test_concurrent_search_workers_match_sequential_output(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            sequential = self._run(Path(tmp))
+        with tempfile.TemporaryDirectory() as tmp:
+            concurrent = self._run(Path(tmp), search_workers=4)
+        self.assertEqual(concurrent, sequential)
+
+    def test_provider_rejected_with_quota_error_is_skipped_for_rest_of_run(self) -> None:
+        providers: list[str] = []
+
+        def search(*, provider: str, query: str, **kwargs: object) -> list[dict[str, str]]:
+            providers.append(provider)
+            if provider == "brave":
+                raise HTTPError("https://api.search.brave.com", 429, "Too Many Requests", {}, None)
+            return _fake_search(provider=provider, query=query, **kwargs)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            outputs = self._run(
+                Path(tmp),
+                search=search,
+                provider="auto",
+                brave_api_key="brave-key",
+                auto_provider_order="brave,serper",
+            )
+        self.assertEqual(providers.count("brave"), 1)
+        self.assertEqual(providers.count("serper"), len(providers) - 1)
+        decisions = [row["decision"] for row in outputs["review"]]
+        self.assertEqual(decisions, ["auto_accept", "auto_accept", "unmatched"])
+        trace = json.loads(outputs["review"][1]["search_trace"])
+        self.assertEqual(trace[0]["provider"], "serper")
+        self.assertIn("brave:skipped_after_http_429", trace[0]["errors"])
+
+    def test_prefetched_rows_match_sequential_output(self) -> None:
+        rows = _COMPARISON_ROWS * 2
+        with tempfile.TemporaryDirectory() as tmp:
+            sequential = self._run(Path(tmp), rows=rows)
+        for prefetch_rows in (1, 8):
+            with self.subTest(prefetch_rows=prefetch_rows), tempfile.TemporaryDirectory() as tmp:
+                self.assertEqual(self._run(Path(tmp), rows=rows, prefetch_rows=prefetch_rows), sequential)
+
+    def test_concurrent_row_workers_keep_row_order_and_decisions(self) -> None:
+        rows = _COMPARISON_ROWS * 3
+        with tempfile.TemporaryDirectory() as tmp:
+            sequential = self._run(Path(tmp), rows=rows)
+        with tempfile.TemporaryDirectory() as tmp:
+            concurrent = self._run(Path(tmp), rows=rows, row_workers=4)
+        # Which row reaches a shared query first depends on timing, so only
+        # the decisions are compared, not the per-query trace or error text.
+        def decisions(outputs: dict[str, list[dict[str, str]]]) -> list[tuple[str, str, str, str]]:
+            return [
+                (row["wine_name"], row["decision"], row["best_url"], row["best_score"]) for row in outputs["review"]
+            ]
+
+        self.assertEqual(decisions(concurrent), decisions(sequential))
+        self.assertEqual(concurrent["suggestions"], sequential["suggestions"])
+
+    def test_serper_batch_matches_per_query_output_with_one_request_per_row(self) -> None:
+        def fake_request(method: str, url: str, *, headers: dict, body: bytes, **_: object) -> list[dict]:
+            searches = json.loads(body)
+            return [
+                {"organic": [{"link": r["url"], "title": r["title"]} for r in _fake_search(provider="serper", query=s["q"])]}
+                for s in searches
+            ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            per_query = self._run(Path(tmp))
+        with (
+            tempfile.TemporaryDirectory() as tmp,
+            mock.patch("scripts.resolve_vivino_matches._request_json", side_effect=fake_request) as request,
+        ):
+            batched = self._run(Path(tmp), serper_batch=True)
+        self.assertEqual(request.call_count, 3)
+        self.assertEqual(batched["api_calls"], [0])
+        self.assertEqual(
+            {key: value for key, value in batched.items() if key != "api_calls"},
+            {key: value for key, value in per_query.items() if key != "api_calls"},
+        )
+
+    def test_repeated_queries_are_sent_once_per_run(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            single = self._run(Path(tmp))
+        with tempfile.TemporaryDirectory() as tmp:
+            doubled = self._run(Path(tmp), rows=_COMPARISON_ROWS * 2)
+        self.assertEqual(len(doubled["review"]), 2 * len(single["review"]))
+        self.assertEqual(doubled["api_calls"], single["api_calls"])
+
+    def test_empty_outcome_with_a_transient_provider_error_is_not_memoized(self) -> None:
+        def run(rows: list[dict[str, str]]) -> list[str]:
+            providers: list[str] = []
+
+            def search(*, provider: str, query: str, **kwargs: object) -> list[dict[str, str]]:
+                providers.append(provider)
+                if provider == "brave":
+                    raise HTTPError("https://api.search.brave.com", 500, "Server Error", {}, None)
+                return _fake_search(provider=provider, query=query, **kwargs)
+
+            with tempfile.TemporaryDirectory() as tmp:
+                self._run(
+                    Path(tmp),
+                    rows=rows,
+                    search=search,
+                    provider="auto",
+                    brave_api_key="brave-key",
+                    auto_provider_order="serper,brave",
+                )
+            return providers
+
+        single = run(_COMPARISON_ROWS)
+        doubled = run(_COMPARISON_ROWS * 2)
+        self.assertGreater(single.count("brave"), 0)
+        self.assertEqual(doubled.count("brave"), 2 * single.count("brave"))
+
+    def test_interrupted_run_keeps_rows_already_decided(self) -> None:
+        def fail_on_second_row(*args: object, **kwargs: object) -> None:
+            if args and str(args[0]).startswith("[resolve] 2/"):
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("scripts.resolve_vivino_matches.print", side_effect=fail_on_second_row, create=True):
+                with self.assertRaises(KeyboardInterrupt):
+                    self._run(Path(tmp))
+            review = _read_rows(Path(tmp) / "review.csv")
+        self.assertEqual([row["wine_name"] for row in review], [row["name_plat"] for row in _COMPARISON_ROWS[:2]])
+
+    def test_interrupted_run_requeries_rows_it_had_not_checkpointed(self) -> None:
+        def fail_on_second_row(*args: object, **kwargs: object) -> None:
+            if args and str(args[0]).startswith("[resolve] 2/"):
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with mock.patch("scripts.resolve_vivino_matches.print", side_effect=fail_on_second_row, create=True):
+                with self.assertRaises(KeyboardInterrupt):
+                    self._run(Path(tmp), auto_apply=True)
+            self.assertFalse((Path(tmp) / "state.json").exists())
+            self.assertFalse((Path(tmp) / "overrides.csv").exists())
+            rerun = self._run(Path(tmp), auto_apply=True)
+            overrides = _read_rows(Path(tmp) / "overrides.csv")
+        self.assertEqual(
+            [row["wine_name"] for row in rerun["review"]], [row["name_plat"] for row in _COMPARISON_ROWS]
+        )
+        self.assertEqual(len(overrides), 2)
+
+    def test_checkpointed_rows_are_applied_and_skipped_next_time(self) -> None:
+        def fail_on_second_row(*args: object, **kwargs: object) -> None:
+            if args and str(args[0]).startswith("[resolve] 2/"):
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            with (
+                mock.patch("scripts.resolve_vivino_matches._STREAM_FLUSH_EVERY", 1),
+                mock.patch("scripts.resolve_vivino_matches.print", side_effect=fail_on_second_row, create=True),
+            ):
+                with self.assertRaises(KeyboardInterrupt):
+                    self._run(Path(tmp), auto_apply=True)
+            overrides = _read_rows(Path(tmp) / "overrides.csv")
+            self.assertEqual([row["match_name"] for row in overrides], [_COMPARISON_ROWS[0]["name_plat"]])
+            rerun = self._run(Path(tmp), auto_apply=True)
+            self.assertFalse((Path(tmp) / "state.json.log").exists())
+            state = json.loads((Path(tmp) / "state.json").read_text(encoding="utf-8"))
+            overrides = _read_rows(Path(tmp) / "overrides.csv")
+        self.assertEqual(
+            [row["wine_name"] for row in rerun["review"]], [row["name_plat"] for row in _COMPARISON_ROWS[1:]]
+        )
+        self.assertEqual(len(state["seen_unresolved"]), len(_COMPARISON_ROWS))
+        self.assertEqual(len(overrides), 2)
+
+    def test_second_run_only_processes_new_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            self._run(Path(tmp))
+            rerun = self._run(Path(tmp))
+        self.assertEqual(rerun["review"], [])
+        self.assertEqual(rerun["api_calls"], [0])
+
+
 if __name__ == "__main__":
     unittest.main()
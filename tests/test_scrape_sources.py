@@ -0,0 +1,173 @@
+"""Regression tests for scrape_sources helpers."""
+
+import csv
+import random
+import re
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+from urllib.error import URLError
+
+from scripts.scrape_sources import (
+    PLATINUM_CSV_FIELDS,
+    ScrapeCache,
+    _find_vivino_url,
+    fetch_platinum_detail_rating,
+    fill_platinum_detail_ratings,
+    open_csv_stream,
+)
+
+# The regex _find_vivino_url replaced; it restarts at every "http" and can go
+# quadratic, but defines the expected result for URLs within the prefix cap.
+_OLD_VIVINO_URL_RE = re.compile(r"https?://[^\s\"'<>()]*vivino\.com[^\s\"'<>()]*", re.IGNORECASE)
+
+
+def _old_find_vivino_url(markup: str) -> str:
+    match = _OLD_VIVINO_URL_RE.search(markup)
+    return match.group(0) if match else ""
+
+
+_RATED_PAGE = "<html><body><p>4.2 / 5 Stars - Vivino</p></body></html>"
+_UNRATED_PAGE = "<html><body><h1>2019 Barolo Albe</h1><p>In stock</p></body></html>"
+_SCRIPT_ONLY_PAGE = "<html><body><div id='root'></div><script>render()</script></body></html>"
+
+
+class DetailRatingTests(unittest.TestCase):
+    def _fetch(self, page: str | Exception) -> str | None:
+        with mock.patch("scripts.scrape_sources._fetch_text", side_effect=[page]):
+            return fetch_platinum_detail_rating("https://portal.example/wines/1")
+
+    def test_rating_missing_failed_and_unrendered_pages_are_distinguished(self) -> None:
+        self.assertEqual(self._fetch(_RATED_PAGE), "4.2")
+        self.assertEqual(self._fetch(_UNRATED_PAGE), "")
+        self.assertIsNone(self._fetch(_SCRIPT_ONLY_PAGE))
+        self.assertIsNone(self._fetch(URLError("timed out")))
+
+    def test_browser_fallback_only_for_pages_http_could_not_read(self) -> None:
+        pages = {
+            "https://portal.example/wines/rated": _RATED_PAGE,
+            "https://portal.example/wines/unrated": _UNRATED_PAGE,
+            "https://portal.example/wines/failed": URLError("timed out"),
+        }
+
+        def fetch(url: str, cache: object = None) -> str:
+            page = pages[url]
+            if isinstance(page, Exception):
+                raise page
+            return page
+
+        rows = [{"url": url} for url in pages]
+        with (
+            mock.patch("scripts.scrape_sources._fetch_text", side_effect=fetch),
+            mock.patch("scripts.scrape_sources.extract_platinum_detail_rating", return_value="3.9") as browser,
+            mock.patch("builtins.print"),
+        ):
+            fill_platinum_detail_ratings(mock.Mock(), rows, workers=2, sleep_seconds=0.0)
+
+        self.assertEqual([call.args[1] for call in browser.call_args_list], ["https://portal.example/wines/failed"])
+        self.assertEqual(
+            [row.get("platinum_vivino_rating", "") for row in rows],
+            ["4.2", "", "3.9"],
+        )
+
+
+class FindVivinoUrlTests(unittest.TestCase):
+    def test_matches_the_old_url_regex(self) -> None:
+        cases = [
+            "",
+            "no link here",
+            '<a href="https://www.vivino.com/w/1">Vivino</a>',
+            "see vivino.com or (https://VIVINO.COM/wines/2?year=2019) today",
+            "vivino.com/x https://example.com/?next=https://www.vivino.com/w/3 tail",
+            "https://example.com/a vivino.com http://vivino.com/b http://vivino.com/c",
+            "'https://www.vivino.com/w/4'<span>https://www.vivino.com/w/5</span>",
+            "vivino.com/w/6?u=http://x.vivino.com/w/7",
+            "http://http://vivino.com",
+            "https://vivino.co vivino.com",
+        ]
+        for markup in cases:
+            with self.subTest(markup=markup):
+                self.assertEqual(_find_vivino_url(markup), _old_find_vivino_url(markup))
+
+    def test_matches_the_old_url_regex_on_generated_markup(self) -> None:
+        rng = random.Random(20240611)
+        alphabet = ["https://", "http://", "vivino.com", "VIVINO.com", "/w/", "a", " ", '"', "(", ">", "x."]
+        for _ in range(2000):
+            markup = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+            self.assertEqual(_find_vivino_url(markup), _old_find_vivino_url(markup), markup)
+
+    def test_scheme_is_looked_for_within_2_kib_of_the_domain(self) -> None:
+        near = "https://" + "a" * 2000 + "vivino.com/w/1"
+        far = "https://" + "a" * 2100 + "vivino.com/w/1"
+        self.assertEqual(_find_vivino_url(near), near)
+        self.assertEqual(_find_vivino_url(far), "")
+        self.assertEqual(_old_find_vivino_url(far), far)
+
+
+def _read_csv(path: Path) -> tuple[list[str], list[dict[str, str]]]:
+    with path.open("r", encoding="utf-8", newline="") as handle:
+        reader = csv.DictReader(handle)
+        return list(reader.fieldnames or []), list(reader)
+
+
+class CsvStreamTests(unittest.TestCase):
+    def test_pages_are_flushed_to_the_partial_file_then_committed(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out" / "platinum.csv"
+            partial = path.with_name("platinum.csv.partial")
+            with open_csv_stream(path, PLATINUM_CSV_FIELDS) as out:
+                out.write_rows([{"name": "Barolo Albe", "price": "58.00"}])
+                self.assertEqual(_read_csv(partial)[1][0]["name"], "Barolo Albe")
+                out.write_rows([{"name": "Bandol Rose"}, {"name": "Mystery Blend"}])
+                self.assertEqual(out.rows_written, 3)
+                self.assertFalse(path.exists())
+
+            self.assertFalse(partial.exists())
+            header, rows = _read_csv(path)
+        self.assertEqual(header, PLATINUM_CSV_FIELDS)
+        self.assertEqual([row["name"] for row in rows], ["Barolo Albe", "Bandol Rose", "Mystery Blend"])
+        self.assertEqual(rows[1]["price"], "")
+
+    def test_failed_scrape_keeps_the_last_complete_csv(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "platinum.csv"
+            path.write_text("name\nprevious\n", encoding="utf-8")
+            with self.assertRaises(RuntimeError):
+                with open_csv_stream(path, PLATINUM_CSV_FIELDS) as out:
+                    out.write_rows([{"name": "Barolo Albe"}])
+                    raise RuntimeError("driver crashed")
+            self.assertEqual(path.read_text(encoding="utf-8"), "name\nprevious\n")
+            partial_rows = _read_csv(path.with_name("platinum.csv.partial"))[1]
+        self.assertEqual([row["name"] for row in partial_rows], ["Barolo Albe"])
+
+
+class ScrapeCacheTests(unittest.TestCase):
+    def test_entries_round_trip_until_they_expire(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ScrapeCache(directory=Path(tmp) / "cache", ttl_hours=1.0)
+            url = "https://portal.example/products.json?page=1"
+            self.assertIsNone(cache.get(url))
+            cache.put(url, '{"products": []}')
+            self.assertEqual(cache.get(url), '{"products": []}')
+            self.assertEqual([path.suffix for path in cache.directory.iterdir()], [".json"])
+
+            with mock.patch("scripts.scrape_sources.time.time", return_value=time.time() + 3601):
+                self.assertIsNone(cache.get(url))
+
+    def test_unreadable_or_mismatched_entries_are_misses(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ScrapeCache(directory=Path(tmp), ttl_hours=1.0)
+            url = "https://portal.example/wines/1"
+            cache.put(url, "<html></html>")
+            entry_path = next(Path(tmp).iterdir())
+
+            entry_path.write_text(entry_path.read_text(encoding="utf-8").replace(url, url + "?other"), encoding="utf-8")
+            self.assertIsNone(cache.get(url))
+            entry_path.write_text("{truncated", encoding="utf-8")
+            self.assertIsNone(cache.get(url))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Regression tests for suggest_vivino_overrides helpers."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts import suggest_vivino_overrides
+from scripts.suggest_vivino_overrides import (
+    _CACHE_FLUSH_EVERY,
+    Candidate,
+    clean_query,
+    load_suggest_cache,
+    save_suggest_cache,
+    slug_to_title,
+)
+
+
+class SlugToTitleTests(unittest.TestCase):
+    def test_titles_come_from_the_url_path(self) -> None:
+        cases = {
+            "https://www.vivino.com/albe-barolo/w/1234?year=2019#reviews": "albe barolo",
+            "https://www.vivino.com/en/wines/tignanello-2019": "tignanello 2019",
+            "https://www.vivino.com/w/1234": "1234",
+            "https://www.vivino.com/": "",
+        }
+        for url, title in cases.items():
+            with self.subTest(url=url):
+                self.assertEqual(slug_to_title(url), title)
+
+    def test_params_on_the_last_segment_are_not_part_of_the_slug(self) -> None:
+        self.assertEqual(slug_to_title("https://www.vivino.com/;.-  #-x"), "")
+        self.assertEqual(slug_to_title("https://www.vivino.com/bandol-rose;jsessionid=42"), "bandol rose")
+        self.assertEqual(slug_to_title("https://www.vivino.com/a;b/bandol-rose"), "bandol rose")
+
+
+_WINE = "Albe Barolo 2019"
+_FOUND = Candidate(url="https://www.vivino.com/albe-barolo/w/1", title="Albe Barolo", score=0.9)
+
+
+class SuggestCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.cache_path = self.tmp / "suggest_cache.json"
+        self.driver = mock.Mock()
+        self.fetch_metrics = mock.Mock(return_value=("4.1", "120", "55.0"))
+        self.choose = mock.Mock(return_value=_FOUND)
+        self.blocked = mock.Mock(return_value=(False, ""))
+
+    def _run(self, wines: list[str], *extra: str) -> None:
+        argv = [
+            "suggest_vivino_overrides.py",
+            "--output", str(self.tmp / "suggested.csv"),
+            "--cache-path", str(self.cache_path),
+            "--limit", "0",
+            "--min-score", "0.64",
+            "--fetch-metrics",
+            *extra,
+        ]  # fmt: skip
+        with (
+            mock.patch.object(sys, "argv", argv),
+            mock.patch.multiple(
+                suggest_vivino_overrides,
+                read_csv_rows=mock.Mock(return_value=[]),
+                unresolved_wines=mock.Mock(return_value=wines),
+                make_driver=mock.Mock(return_value=self.driver),
+                wait_for_element=mock.Mock(return_value=True),
+                pause_with_jitter=mock.Mock(),
+                detect_block_page=self.blocked,
+                extract_candidates_from_search=mock.Mock(return_value=[]),
+                choose_best_candidate=self.choose,
+                fetch_metrics=self.fetch_metrics,
+            ),
+            mock.patch("builtins.print"),
+        ):
+            suggest_vivino_overrides.main()
+
+    def _seed(self, **entry: object) -> None:
+        save_suggest_cache(self.cache_path, {clean_query(_WINE): {"url": _FOUND.url, "title": _FOUND.title, **entry}})
+
+    def test_hit_above_min_score_skips_search_and_wine_page(self) -> None:
+        self._seed(score=0.8, vivino_rating="4.3", vivino_num_ratings="99", vivino_price="60.0")
+        self._run([_WINE])
+        self.driver.get.assert_not_called()
+        self.fetch_metrics.assert_not_called()
+        self.assertEqual(load_suggest_cache(self.cache_path)[clean_query(_WINE)]["vivino_rating"], "4.3")
+
+    def test_hit_below_min_score_is_searched_again(self) -> None:
+        self._seed(score=0.5, vivino_rating="4.3", vivino_num_ratings="99", vivino_price="60.0")
+        self._run([_WINE])
+        self.assertEqual(self.driver.get.call_count, 1)
+        self.choose.assert_called_once()
+        self.fetch_metrics.assert_called_once()
+        entry = load_suggest_cache(self.cache_path)[clean_query(_WINE)]
+        self.assertEqual((entry["score"], entry["vivino_rating"]), (0.9, "4.1"))
+
+    def test_hit_with_empty_rating_still_fetches_metrics(self) -> None:
+        self._seed(score=0.8, vivino_rating="", vivino_num_ratings="", vivino_price="")
+        self._run([_WINE])
+        self.driver.get.assert_not_called()
+        self.fetch_metrics.assert_called_once_with(self.driver, _FOUND.url, 8.0)
+        self.assertEqual(load_suggest_cache(self.cache_path)[clean_query(_WINE)]["vivino_rating"], "4.1")
+
+    def test_cache_is_flushed_every_few_accepted_rows(self) -> None:
+        wines = [f"Wine {n}" for n in range(2 * _CACHE_FLUSH_EVERY + 3)]
+        saved_sizes: list[int] = []
+
+        def save(path: Path, cache: dict[str, dict[str, object]]) -> None:
+            saved_sizes.append(len(cache))
+            save_suggest_cache(path, cache)
+
+        with mock.patch.object(suggest_vivino_overrides, "save_suggest_cache", side_effect=save):
+            self._run(wines)
+        self.assertEqual(saved_sizes, [_CACHE_FLUSH_EVERY, 2 * _CACHE_FLUSH_EVERY, len(wines)])
+        self.assertEqual(len(load_suggest_cache(self.cache_path)), len(wines))
+
+    def test_unwritable_cache_does_not_mask_a_stop_on_block_error(self) -> None:
+        (self.tmp / "not_a_dir").write_text("", encoding="utf-8")
+        self.cache_path = self.tmp / "not_a_dir" / "suggest_cache.json"
+        self.blocked.return_value = (True, "verify you are human")
+        with self.assertRaisesRegex(RuntimeError, "blocked/challenge page"):
+            self._run([_WINE], "--stop-on-block")
+        self.driver.quit.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Regression tests for validate_scrape reports."""
+
+import random
+import tempfile
+import unittest
+from collections.abc import Callable
+from pathlib import Path
+from urllib.parse import urlparse
+
+from scripts.validate_scrape import summarize, url_host
+
+# A repeated "name" header (the last column wins), blank lines that are not
+# rows, a short row, and stock values outside the true/false sets.
+_FIXTURE_CSV = (
+    "name,url,price,in_stock,name\n"
+    "ignored,https://www.platinum.example/a,$45.00,yes,Barolo Albe\n"
+    ",https://www.platinum.example/b,N/A,no,\n"
+    "\n"
+    'x,http://shop.example:8080/c?x=1,"1,200",maybe,Bandol Rose\n'
+    "x,,12,,barolo albe\n"
+    "\n"
+    "x,https://www.platinum.example/a,abc,TRUE,Tignanello\n"
+    "Lonely\n"
+)
+
+# Printed by the DictReader-based validator this streaming pass replaced.
+_EXPECTED_REPORT = """
+=== {path} ===
+rows: 6
+missing name: 2
+missing url: 2
+price parseable: 3/6
+duplicate names: 1
+duplicate urls: 1
+url hosts: {{'www.platinum.example': 3, 'shop.example:8080': 1}}
+in_stock true/false/unknown: 2/1/3
+rows with missing required fields (first 10):
+  line 3: name='' price='N/A' url='https://www.platinum.example/b'
+  line 5: name='barolo albe' price='12' url=''
+  line 7: name='' price='' url=''"""
+
+
+class SummarizeTests(unittest.TestCase):
+    def test_report_matches_the_dictreader_validator(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "platinum.csv"
+            path.write_text(_FIXTURE_CSV, encoding="utf-8")
+            self.assertEqual(summarize(path), _EXPECTED_REPORT.format(path=path))
+
+    def test_header_only_file_has_no_rows(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "empty.csv"
+            path.write_text("name,url,price\n", encoding="utf-8")
+            report = summarize(path)
+        self.assertIn("rows: 0\n", report)
+        self.assertIn("url hosts: {}", report)
+        self.assertNotIn("in_stock", report)
+
+
+def _outcome(host_of: Callable[[str], str], url: str) -> str:
+    # urlparse rejects unbalanced IPv6 brackets; url_host must do the same.
+    try:
+        return host_of(url)
+    except ValueError as exc:
+        return f"ValueError: {exc}"
+
+
+def _netloc(url: str) -> str:
+    return urlparse(url).netloc
+
+
+class UrlHostTests(unittest.TestCase):
+    def test_matches_urlparse_netloc(self) -> None:
+        cases = [
+            "https://www.platinum.example/wines/1",
+            "HTTP://Shop.Example:8080?page=2",
+            "https://user:pw@host.example#top",
+            "https://[::1]:8443/x",
+            "https://host.example\t/x",
+            "//host.example/path",
+            "host.example/path",
+            "mailto:someone@example.com",
+            "1http://host.example/",
+            "https://",
+            "http:/host.example",
+            "https://[::1/x",
+        ]
+        for url in cases:
+            with self.subTest(url=url):
+                self.assertEqual(_outcome(url_host, url), _outcome(_netloc, url))
+
+    def test_matches_urlparse_netloc_on_generated_urls(self) -> None:
+        rng = random.Random(20240611)
+        alphabet = ["https://", "http:", "//", "/", "?", "#", "[", "]", ":", "@", "a", "B.", "\t", "\n", " ", "1"]
+        for _ in range(2000):
+            url = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 10)))
+            self.assertEqual(_outcome(url_host, url), _outcome(_netloc, url), repr(url))
+
+
+if __name__ == "__main__":
+    unittest.main()